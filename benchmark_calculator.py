@@ -0,0 +1,689 @@
+#!/usr/bin/env python3
+"""
+Suíte de Benchmarks da Calculadora Moderna
+
+Este módulo mede o tempo dos caminhos críticos da calculadora sem interface
+gráfica: cada método do CalculatorEngine (com entradas em string e numéricas),
+sequências de teclas em CalculatorController.process_input, o despacho de
+execute_operation e as operações de histórico.
+
+Cada benchmark é uma função que prepara o cenário e retorna uma chamada sem
+argumentos; a chamada é cronometrada com timeit (calibração automática do
+número de laços e várias repetições). Os resultados são gravados em JSON e
+podem ser comparados com uma execução de referência, sinalizando regressões
+acima de um limite.
+
+Uso:
+    python benchmark_calculator.py --out resultados.json
+    python benchmark_calculator.py --baseline referencia.json --threshold 0.10
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from calculator_controller import CalculatorController
+from calculator_engine import CalculatorEngine
+
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+# Benchmarks registrados: nome -> função que prepara e retorna a chamada medida
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+# Linhas processadas por chamada, para os benchmarks que medem vazão
+BENCHMARK_ROWS: Dict[str, int] = {}
+
+
+def benchmark(name: str, rows: Optional[int] = None):
+    """
+    Registra uma função de preparação de benchmark.
+
+    Args:
+        name: Nome único do benchmark (ex.: "engine.square_root[str]")
+        rows: Linhas processadas por chamada; quando informado, o resultado
+            inclui rows_per_second
+
+    Returns:
+        Decorador que registra a função em BENCHMARKS
+    """
+    def decorator(setup: Callable[[], Callable[[], Any]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark duplicado: {name}")
+        BENCHMARKS[name] = setup
+        if rows is not None:
+            BENCHMARK_ROWS[name] = rows
+        return setup
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Motor de cálculo
+# ---------------------------------------------------------------------------
+
+# Chamadas do motor: nome do método -> argumentos (string, numéricos)
+ENGINE_CALLS = {
+    "basic_operation": (("12.5", "3.2", "+"), (12.5, 3.2, "+")),
+    "percentage": (("250", "15"), (250.0, 15.0)),
+    "square_root": (("144",), (144.0,)),
+    "trigonometric": (("30", "sin", "degrees"), (30.0, "sin", "degrees")),
+    "degrees_to_radians": (("180",), (180.0,)),
+    "radians_to_degrees": (("3.14159",), (3.14159,)),
+    "circle_area": (("2.5",), (2.5,)),
+    "sphere_volume": (("2.5",), (2.5,)),
+    "is_even_odd": (("42",), (42,)),
+}
+
+
+def _register_engine_call(method: str, kind: str, args: tuple, cache_size: int = 0):
+    suffix = f"{kind},cache" if cache_size else kind
+
+    @benchmark(f"engine.{method}[{suffix}]")
+    def setup():
+        call = getattr(CalculatorEngine(cache_size=cache_size), method)
+        return lambda: call(*args)
+
+
+for _method, (_str_args, _num_args) in ENGINE_CALLS.items():
+    _register_engine_call(_method, "str", _str_args)
+    _register_engine_call(_method, "float", _num_args)
+
+for _method in ("square_root", "trigonometric", "circle_area"):
+    _register_engine_call(_method, "float", ENGINE_CALLS[_method][1], cache_size=128)
+
+
+@benchmark("engine.square_root[float,instrumented]")
+def _engine_instrumented_square_root():
+    engine = CalculatorEngine()
+    engine.enable_instrumentation()
+    return lambda: engine.square_root(144.0)
+
+
+@benchmark("engine.basic_operation_batch[1000]")
+def _engine_basic_operation_batch():
+    engine = CalculatorEngine()
+    num1 = [float(i) for i in range(1000)]
+    num2 = [float(i % 7) for i in range(1000)]
+    return lambda: engine.basic_operation_batch(num1, num2, "/")
+
+
+@benchmark("engine.trigonometric_batch[1000]")
+def _engine_trigonometric_batch():
+    engine = CalculatorEngine()
+    angles = [float(i) for i in range(1000)]
+    return lambda: engine.trigonometric_batch(angles, "tan", "degrees")
+
+
+# ---------------------------------------------------------------------------
+# Controlador
+# ---------------------------------------------------------------------------
+
+# Sequências de teclas: nome -> teclas (cada sequência termina com o estado limpo)
+KEYSTROKE_SEQUENCES = {
+    "addition": ["1", "2", "+", "3", "4", "=", "C"],
+    "decimal_chain": ["3", ".", "1", "4", "*", "2", "-", "1", ".", "5", "=", "C"],
+    "backspace": ["9", "8", "7", "←", "←", "/", "3", "=", "C"],
+    "division_by_zero": ["5", "/", "0", "=", "C"],
+    "invalid_keys": ["x", "", "1", "?", "C"],
+}
+
+# Chamadas de execute_operation: nome -> argumentos nomeados
+CONTROLLER_OPERATIONS = {
+    "percentage": {"number": "250", "percent": "15"},
+    "square_root": {"number": "144"},
+    "trigonometric": {"number": "30", "function": "cos", "unit": "degrees"},
+    "circle_area": {"radius": "2.5"},
+    "sphere_volume": {"radius": "2.5"},
+    "is_even_odd": {"number": "42"},
+    "degrees_to_radians": {"degrees": "180"},
+    "radians_to_degrees": {"radians": "3.14159"},
+    "unknown": {},
+}
+
+
+def _register_keystrokes(name: str, keys: List[str]):
+    @benchmark(f"controller.process_input[{name}]")
+    def setup():
+        process_input = CalculatorController().process_input
+
+        def run():
+            for key in keys:
+                process_input(key)
+        return run
+
+
+def _register_controller_operation(operation: str, kwargs: Dict[str, Any]):
+    @benchmark(f"controller.execute_operation[{operation}]")
+    def setup():
+        execute_operation = CalculatorController().execute_operation
+        return lambda: execute_operation(operation, **kwargs)
+
+
+for _name, _keys in KEYSTROKE_SEQUENCES.items():
+    _register_keystrokes(_name, _keys)
+
+for _operation, _kwargs in CONTROLLER_OPERATIONS.items():
+    _register_controller_operation(_operation, _kwargs)
+
+
+CONTENTION_THREADS = 8
+CONTENTION_ROUNDS = 50
+
+
+@benchmark("controller.contention[8 threads,thread_safe]",
+           rows=CONTENTION_THREADS * CONTENTION_ROUNDS * 5)
+def _controller_contention():
+    from concurrent.futures import ThreadPoolExecutor
+    from calculator_controller import ThreadSafeCalculatorController
+    controller = ThreadSafeCalculatorController(history_size=1000)
+    executor = ThreadPoolExecutor(CONTENTION_THREADS)
+
+    # Cada rodada: quatro teclas e uma operação, mais leituras sem trava
+    def worker(index: int):
+        for _ in range(CONTENTION_ROUNDS):
+            for key in ("7", "*", "3", "="):
+                controller.process_input(key)
+                controller.get_current_display()
+            controller.execute_operation("square_root", number=index)
+
+    return lambda: list(executor.map(worker, range(CONTENTION_THREADS)))
+
+
+@benchmark("controller.get_current_display[thread_safe]")
+def _controller_display_thread_safe():
+    from calculator_controller import ThreadSafeCalculatorController
+    return ThreadSafeCalculatorController().get_current_display
+
+
+def _filled_controller() -> CalculatorController:
+    """Cria um controlador com o histórico cheio (sucessos e erros)."""
+    controller = CalculatorController()
+    for index in range(controller.max_history_size):
+        controller.execute_operation("square_root", number=str(index - 2))
+    return controller
+
+
+@benchmark("history.add")
+def _history_add():
+    controller = CalculatorController()
+    return lambda: controller._add_to_history("12 + 34", "46", True)
+
+
+@benchmark("history.get_history")
+def _history_get():
+    return _filled_controller().get_history
+
+
+@benchmark("history.get_formatted_history")
+def _history_formatted():
+    return _filled_controller().get_formatted_history
+
+
+@benchmark("history.get_history_summary")
+def _history_summary():
+    return _filled_controller().get_history_summary
+
+
+def _large_controller(size: int = 100000, compact: bool = False) -> CalculatorController:
+    """Cria um controlador com um histórico grande e cheio."""
+    controller = CalculatorController(history_size=size, compact_history=compact)
+    for index in range(size):
+        controller._add_to_history(f"{index} + 1", str(index + 1), True)
+    return controller
+
+
+@benchmark("history.add[100000]")
+def _history_add_large():
+    controller = _large_controller()
+    return lambda: controller._add_to_history("12 + 34", "46", True)
+
+
+@benchmark("history.get_history[100000,window=50]")
+def _history_window_large():
+    controller = _large_controller()
+    return lambda: controller.get_history(-50)
+
+
+@benchmark("history.get_formatted_history[100000,window=50]")
+def _history_formatted_window_large():
+    controller = _large_controller()
+    return lambda: controller.get_formatted_history(-50)
+
+
+@benchmark("history.get_history_summary[100000]")
+def _history_summary_large():
+    return _large_controller().get_history_summary
+
+
+def _mixed_controller(size: int = 100000, compact: bool = False) -> CalculatorController:
+    """Cria um controlador cheio em que 1 de cada 100 operações é uma raiz quadrada."""
+    controller = CalculatorController(history_size=size, compact_history=compact)
+    for index in range(size):
+        if index % 100:
+            controller._add_to_history(f"{index} + 1", str(index + 1), True, "basic_operation")
+        else:
+            controller._add_to_history(f"√{index}", "0", index % 300 != 0, "square_root")
+    return controller
+
+
+@benchmark("history.query[100000,operation_type,limit=50]")
+def _history_query_type():
+    controller = _mixed_controller()
+    return lambda: list(controller.query_history(operation_type="square_root", limit=50))
+
+
+@benchmark("history.query[100000,failed,columnar]")
+def _history_query_failed_columnar():
+    controller = _mixed_controller(compact=True)
+    return lambda: list(controller.query_history(success=False))
+
+
+@benchmark("history.add[100000,listener]")
+def _history_add_listener():
+    controller = _large_controller()
+    controller.add_history_listener(lambda event: None)
+    return lambda: controller._add_to_history("12 + 34", "46", True)
+
+
+@benchmark("history.add[100000,columnar]")
+def _history_add_columnar():
+    controller = _large_controller(compact=True)
+    return lambda: controller._add_to_history("12 + 34", "46", True)
+
+
+@benchmark("history.get_history[100000,window=50,columnar]")
+def _history_window_columnar():
+    controller = _large_controller(compact=True)
+    return lambda: controller.get_history(-50)
+
+
+def _sqlite_controller(size: int = 10000):
+    """Cria um controlador com histórico em SQLite em um diretório temporário."""
+    directory = tempfile.TemporaryDirectory()
+    controller = CalculatorController(history_path=f"{directory.name}/historico.db")
+    for index in range(size):
+        controller._add_to_history(f"{index} + 1", str(index + 1), index % 10 != 0,
+                                   "basic_operation")
+    controller.history.flush()
+    return controller, directory
+
+
+@benchmark("history.add[sqlite]")
+def _history_add_sqlite():
+    controller, directory = _sqlite_controller()
+    return lambda directory=directory: controller._add_to_history("12 + 34", "46", True)
+
+
+@benchmark("history.get_history_summary[10000,sqlite]")
+def _history_summary_sqlite():
+    controller, directory = _sqlite_controller()
+    return lambda directory=directory: controller.get_history_summary()
+
+
+EXPORT_ROWS = 100000
+
+
+def _export_file(name: str):
+    """Exporta um histórico cheio para um diretório temporário."""
+    from calculator_history_export import export_history
+    directory = tempfile.TemporaryDirectory()
+    path = f"{directory.name}/{name}"
+    export_history(_large_controller(EXPORT_ROWS), path)
+    return path, directory
+
+
+@benchmark("history.export[csv,100000]", rows=EXPORT_ROWS)
+def _history_export_csv():
+    from calculator_history_export import export_history
+    controller = _large_controller(EXPORT_ROWS)
+    directory = tempfile.TemporaryDirectory()
+    path = f"{directory.name}/historico.csv"
+    return lambda directory=directory: export_history(controller, path)
+
+
+@benchmark("history.export[jsonl.gz,100000]", rows=EXPORT_ROWS)
+def _history_export_jsonl_gzip():
+    from calculator_history_export import export_history
+    controller = _large_controller(EXPORT_ROWS)
+    directory = tempfile.TemporaryDirectory()
+    path = f"{directory.name}/historico.jsonl.gz"
+    return lambda directory=directory: export_history(controller, path)
+
+
+def _import_into_empty(controller: CalculatorController, path: str):
+    """Importa o arquivo em um histórico vazio (a importação exige ordem de horário)."""
+    from calculator_history_export import import_history
+    controller.clear_history()
+    return import_history(controller, path)
+
+
+@benchmark("history.import[csv,100000]", rows=EXPORT_ROWS)
+def _history_import_csv():
+    path, directory = _export_file("historico.csv")
+    controller = CalculatorController(history_size=EXPORT_ROWS)
+    return lambda directory=directory: _import_into_empty(controller, path)
+
+
+@benchmark("history.import[jsonl.gz,100000]", rows=EXPORT_ROWS)
+def _history_import_jsonl_gzip():
+    path, directory = _export_file("historico.jsonl.gz")
+    controller = CalculatorController(history_size=EXPORT_ROWS)
+    return lambda directory=directory: _import_into_empty(controller, path)
+
+
+# ---------------------------------------------------------------------------
+# Serviço JSON
+# ---------------------------------------------------------------------------
+
+SERVER_REQUESTS = 4000
+
+
+@benchmark("server.ndjson[connections=4,pipeline=100]", rows=SERVER_REQUESTS)
+def _server_pipelined():
+    import asyncio
+    import threading
+    from calculator_server import CalculatorServer, run_load_test
+    # O servidor roda em um laço de eventos próprio, em outra thread
+    loop = asyncio.new_event_loop()
+    server = CalculatorServer(port=0)
+    host, port = loop.run_until_complete(server.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return lambda: asyncio.run(run_load_test(host, port, SERVER_REQUESTS, 4, 100))
+
+
+# ---------------------------------------------------------------------------
+# Reprodução de sessões gravadas
+# ---------------------------------------------------------------------------
+
+REPLAY_ROUNDS = 200
+
+
+def _recorded_session():
+    """Grava as sequências de teclas e operações do controlador em um diretório temporário."""
+    directory = tempfile.TemporaryDirectory()
+    path = f"{directory.name}/sessao.log"
+    controller = CalculatorController()
+    controller.start_recording(path)
+    for _ in range(REPLAY_ROUNDS):
+        for keys in KEYSTROKE_SEQUENCES.values():
+            for key in keys:
+                controller.process_input(key)
+        for operation, kwargs in CONTROLLER_OPERATIONS.items():
+            controller.execute_operation(operation, **kwargs)
+    controller.stop_recording()
+    return path, directory
+
+
+@benchmark("replay.keystrokes", rows=REPLAY_ROUNDS * (
+    sum(map(len, KEYSTROKE_SEQUENCES.values())) + len(CONTROLLER_OPERATIONS)))
+def _replay_keystrokes():
+    from calculator_replay import replay
+    path, directory = _recorded_session()
+    return lambda directory=directory: replay(path)
+
+
+# ---------------------------------------------------------------------------
+# Sessões
+# ---------------------------------------------------------------------------
+
+SESSIONS = 50000
+SESSION_BATCH = 1000
+
+
+def _session_manager():
+    from calculator_sessions import SessionManager
+    manager = SessionManager(max_sessions=SESSIONS)
+    for index in range(SESSIONS):
+        manager.get(f"sessao-{index}")
+    return manager
+
+
+@benchmark("sessions.get+process_input[50000 sessões]", rows=SESSION_BATCH)
+def _sessions_active():
+    manager = _session_manager()
+    ids = [f"sessao-{index}" for index in range(0, SESSIONS, SESSIONS // SESSION_BATCH)]
+
+    def run():
+        for session_id in ids:
+            manager.get(session_id).process_input("7")
+    return run
+
+
+@benchmark("sessions.open[50000 sessões,LRU+pool]", rows=SESSION_BATCH)
+def _sessions_churn():
+    manager = _session_manager()
+    counter = iter(range(SESSIONS, 1 << 62))
+
+    # Cada nova sessão encerra a menos usada e reaproveita seu controlador
+    def run():
+        for _ in range(SESSION_BATCH):
+            manager.get(f"sessao-{next(counter)}").process_input("7")
+    return run
+
+
+@benchmark("startup.headless_cold_start")
+def _startup_headless():
+    from calculator_headless import measure_cold_start
+    return lambda: measure_cold_start()["seconds"]
+
+
+# ---------------------------------------------------------------------------
+# Execução e comparação
+# ---------------------------------------------------------------------------
+
+def time_callable(function: Callable[[], Any], repeat: int = DEFAULT_REPEAT,
+                  min_time: float = DEFAULT_MIN_TIME) -> Dict[str, Any]:
+    """
+    Cronometra uma chamada sem argumentos.
+
+    O número de laços é calibrado para que cada repetição dure pelo menos
+    min_time segundos.
+
+    Args:
+        function: Chamada a ser medida
+        repeat: Quantidade de repetições
+        min_time: Duração mínima de cada repetição, em segundos
+
+    Returns:
+        Dict: loops, repeat e tempos por chamada em nanossegundos
+        (best_ns, median_ns, mean_ns)
+    """
+    timer = timeit.Timer(function)
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+    samples = [elapsed] + timer.repeat(repeat=repeat - 1, number=loops)
+    per_call = [sample / loops * 1e9 for sample in samples]
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "best_ns": min(per_call),
+        "median_ns": statistics.median(per_call),
+        "mean_ns": statistics.mean(per_call)
+    }
+
+
+def select_benchmarks(patterns: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Seleciona benchmarks pelo nome.
+
+    Args:
+        patterns: Padrões no estilo glob (ex.: "engine.*"); todos se None
+
+    Returns:
+        List[str]: Nomes dos benchmarks selecionados, em ordem de registro
+    """
+    if not patterns:
+        return list(BENCHMARKS)
+    patterns = list(patterns)
+    return [
+        name for name in BENCHMARKS
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+def run_benchmarks(names: Optional[Iterable[str]] = None, repeat: int = DEFAULT_REPEAT,
+                   min_time: float = DEFAULT_MIN_TIME,
+                   progress: Optional[Callable[[str, Dict[str, Any]], None]] = None
+                   ) -> Dict[str, Any]:
+    """
+    Executa os benchmarks.
+
+    Args:
+        names: Nomes dos benchmarks (todos se None)
+        repeat: Quantidade de repetições de cada benchmark
+        min_time: Duração mínima de cada repetição, em segundos
+        progress: Função chamada com (nome, medição) após cada benchmark
+
+    Returns:
+        Dict: Metadados da execução e medições por benchmark em "results"
+    """
+    names = list(BENCHMARKS) if names is None else list(names)
+    results = {}
+    for name in names:
+        measurement = time_callable(BENCHMARKS[name](), repeat, min_time)
+        if name in BENCHMARK_ROWS:
+            measurement["rows_per_second"] = BENCHMARK_ROWS[name] / (measurement["best_ns"] / 1e9)
+        results[name] = measurement
+        if progress is not None:
+            progress(name, measurement)
+    return {
+        "created": time.time(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "min_time": min_time,
+        "results": results
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compara uma execução com a referência usando o melhor tempo por chamada.
+
+    Args:
+        current: Resultado de run_benchmarks
+        baseline: Resultado de referência (mesmo formato)
+        threshold: Aumento relativo tolerado (0.10 = 10%)
+
+    Returns:
+        List[Dict]: Comparações dos benchmarks presentes nas duas execuções
+        (name, baseline_ns, current_ns, change, regression)
+    """
+    comparisons = []
+    for name, measurement in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        change = measurement["best_ns"] / reference["best_ns"] - 1.0
+        comparisons.append({
+            "name": name,
+            "baseline_ns": reference["best_ns"],
+            "current_ns": measurement["best_ns"],
+            "change": change,
+            "regression": change > threshold
+        })
+    return comparisons
+
+
+def save_results(results: Dict[str, Any], path: str):
+    """Grava os resultados em JSON ("-" para a saída padrão)."""
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if path == "-":
+        print(text)
+        return
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text + "\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Carrega resultados gravados por save_results."""
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _format_ns(value: float) -> str:
+    if value >= 1e6:
+        return f"{value / 1e6:.2f} ms"
+    if value >= 1e3:
+        return f"{value / 1e3:.2f} µs"
+    return f"{value:.0f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Executa a suíte pela linha de comando.
+
+    Returns:
+        int: Código de saída (0 = sucesso, 1 = regressões encontradas)
+    """
+    parser = argparse.ArgumentParser(
+        prog="benchmark_calculator.py",
+        description="Mede os caminhos críticos da calculadora."
+    )
+    parser.add_argument("benchmarks", nargs="*",
+                        help="Padrões de nomes (ex.: 'engine.*'); todos por padrão")
+    parser.add_argument("--out", help="Arquivo JSON de resultados ('-' para stdout)")
+    parser.add_argument("--baseline", help="Arquivo JSON de referência para comparação")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Aumento relativo tolerado antes de acusar regressão")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="Duração mínima de cada repetição, em segundos")
+    parser.add_argument("--list", action="store_true", help="Lista os benchmarks e sai")
+    options = parser.parse_args(argv)
+
+    names = select_benchmarks(options.benchmarks)
+    if options.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        print("❌ Nenhum benchmark corresponde aos padrões", file=sys.stderr)
+        return 1
+
+    def progress(name: str, measurement: Dict[str, Any]):
+        line = f"{name:<55} {_format_ns(measurement['best_ns']):>12}"
+        if "rows_per_second" in measurement:
+            line += f"  ({measurement['rows_per_second']:.0f} linhas/s)"
+        print(line, file=sys.stderr)
+
+    results = run_benchmarks(names, options.repeat, options.min_time, progress)
+    if options.out:
+        save_results(results, options.out)
+
+    if options.baseline:
+        comparisons = compare_results(results, load_results(options.baseline),
+                                      options.threshold)
+        regressions = [item for item in comparisons if item["regression"]]
+        for item in regressions:
+            print(
+                f"⚠️  {item['name']}: {_format_ns(item['baseline_ns'])} → "
+                f"{_format_ns(item['current_ns'])} ({item['change']:+.1%})",
+                file=sys.stderr
+            )
+        print(
+            f"{len(comparisons)} comparados, {len(regressions)} regressões "
+            f"acima de {options.threshold:.0%}",
+            file=sys.stderr
+        )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
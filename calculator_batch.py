@@ -0,0 +1,473 @@
+"""
+Operações em Lote da Calculadora Moderna
+
+Este módulo contém os núcleos vetorizados usados pelos métodos *_batch do
+CalculatorEngine. Quando o NumPy está disponível os cálculos são feitos sobre
+arrays float64 em uma única passada; caso contrário é usado o módulo array da
+biblioteca padrão, mantendo a mesma interface de retorno.
+
+Cada núcleo retorna uma tupla (resultados, máscara_de_erros), onde a máscara
+contém um código por elemento (BATCH_OK quando o elemento foi calculado).
+Elementos com erro recebem NaN no vetor de resultados.
+"""
+
+import math
+from array import array
+from typing import Any, Tuple
+
+from calculator_coercion import InvalidNumber, parse_number
+from calculator_registry import BINARY_OPERATORS, TRIGONOMETRIC_FUNCTIONS
+
+# NumPy é opcional e só é importado no primeiro uso dos núcleos em lote,
+# para não pesar na inicialização da calculadora (veja numpy_available)
+np = None
+_numpy_checked = False
+
+
+# Códigos da máscara de erros (um byte por elemento)
+BATCH_OK = 0
+BATCH_INVALID_INPUT = 1
+BATCH_DIVISION_BY_ZERO = 2
+BATCH_CALCULATION_ERROR = 3
+BATCH_NEAR_POLE = 4
+BATCH_DOMAIN_ERROR = 5
+
+# |cos(x)| abaixo deste limite indica tangente próxima de uma assíntota
+NEAR_POLE_TOLERANCE = 1e-10
+
+# Acima de 2**52 todo float64 já é inteiro; evita overflow em np.round
+_ROUND_LIMIT = 2.0 ** 52
+
+# Operadores de BINARY_OPERATORS com núcleo NumPy; os demais usam o núcleo
+# em Python puro mesmo com o NumPy disponível
+_NUMPY_OPERATORS = ('+', '-', '*', '/')
+
+# Funções de TRIGONOMETRIC_FUNCTIONS com ufunc do NumPy de mesmo nome; as
+# demais usam o núcleo em Python puro mesmo com o NumPy disponível
+_NUMPY_TRIG_FUNCTIONS = ('sin', 'cos', 'tan')
+
+_DEG_TO_RAD = math.pi / 180.0
+_RAD_TO_DEG = 180.0 / math.pi
+
+# Operações unárias: nome -> (função escalar, exige valor não negativo)
+# As expressões seguem a mesma ordem de operações do CalculatorEngine.
+_PYTHON_UNARY = {
+    'square_root': (math.sqrt, True),
+    'circle_area': (lambda r: math.pi * r * r, True),
+    'sphere_volume': (lambda r: (4/3) * math.pi * r * r * r, True),
+    'degrees_to_radians': (lambda d: d * _DEG_TO_RAD, False),
+    'radians_to_degrees': (lambda r: r * _RAD_TO_DEG, False),
+}
+
+UNARY_OPERATIONS = tuple(_PYTHON_UNARY)
+
+_NAN = float("nan")
+
+
+def numpy_available() -> bool:
+    """
+    Indica se os núcleos vetorizados com NumPy estão disponíveis.
+
+    Returns:
+        bool: True se o NumPy puder ser usado
+    """
+    global np, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np is not None
+
+
+def _is_scalar(value: Any) -> bool:
+    """Verifica se o valor deve ser tratado como escalar (broadcast)."""
+    return isinstance(value, (int, float, str, bytes))
+
+
+def _parse_element(value: Any) -> float:
+    """
+    Converte um elemento para float.
+
+    Raises:
+        ValueError: Se o elemento não for um número válido
+    """
+    number = parse_number(value)
+    if isinstance(number, InvalidNumber):
+        raise ValueError(value)
+    return number
+
+
+# ---------------------------------------------------------------------------
+# Implementação com NumPy
+# ---------------------------------------------------------------------------
+
+def _numpy_column(values: Any) -> Tuple[Any, Any]:
+    """
+    Converte uma coluna de entrada em array float64 e máscara de inválidos.
+
+    Colunas com dtype numérico são convertidas diretamente (sem objetos
+    Python por elemento); as demais (textos, None, objetos mistos) passam
+    pela mesma validação elemento a elemento do núcleo em Python puro.
+    """
+    try:
+        items = np.asarray(values)
+    except (ValueError, TypeError):
+        # Colunas irregulares (por exemplo, números misturados com listas)
+        items = np.asarray(values, dtype=object)
+
+    if items.dtype.kind in "biuf":
+        data = items.astype(np.float64, copy=False)
+        return data, np.zeros(data.shape, dtype=bool)
+
+    data = np.empty(items.shape, dtype=np.float64)
+    invalid = np.zeros(items.shape, dtype=bool)
+    flat_items = items.reshape(-1)
+    flat_data = data.reshape(-1)
+    flat_invalid = invalid.reshape(-1)
+    for index, item in enumerate(flat_items):
+        try:
+            flat_data[index] = _parse_element(item)
+        except (ValueError, TypeError):
+            flat_data[index] = np.nan
+            flat_invalid[index] = True
+    return data, invalid
+
+
+def _numpy_finish(result: Any, mask: Any) -> Tuple[Any, Any]:
+    """Marca resultados não finitos, aplica NaN aos erros e arredonda."""
+    mask[(mask == BATCH_OK) & ~np.isfinite(result)] = BATCH_CALCULATION_ERROR
+    result[mask != BATCH_OK] = np.nan
+    # Mesmo arredondamento de 10 casas decimais do cálculo escalar
+    small = np.abs(result) < _ROUND_LIMIT
+    result[small] = np.round(result[small], 10)
+    return result, mask
+
+
+def _numpy_basic_operation(num1_values: Any, num2_values: Any,
+                           operator: str) -> Tuple[Any, Any]:
+    """Núcleo vetorizado de basic_operation usando NumPy."""
+    a, invalid_a = _numpy_column(num1_values)
+    b, invalid_b = _numpy_column(num2_values)
+    a, b = np.broadcast_arrays(a, b)
+    invalid = invalid_a | invalid_b
+
+    with np.errstate(all="ignore"):
+        if operator == '/':
+            zero = b == 0
+            result = np.divide(a, np.where(zero, 1.0, b))
+        elif operator == '+':
+            result = np.add(a, b)
+        elif operator == '-':
+            result = np.subtract(a, b)
+        else:
+            result = np.multiply(a, b)
+
+    result = np.atleast_1d(result)
+    mask = np.zeros(result.shape, dtype=np.uint8)
+    if operator == '/':
+        mask[zero.reshape(result.shape)] = BATCH_DIVISION_BY_ZERO
+    mask[invalid.reshape(result.shape)] = BATCH_INVALID_INPUT
+    return _numpy_finish(result, mask)
+
+
+def _numpy_trigonometric(values: Any, function: str,
+                         unit: str) -> Tuple[Any, Any]:
+    """Núcleo vetorizado de trigonometric usando NumPy."""
+    angles, invalid = _numpy_column(values)
+    angles = np.atleast_1d(angles)
+    invalid = invalid.reshape(angles.shape)
+
+    with np.errstate(all="ignore"):
+        if unit == "degrees":
+            # Conversão feita uma única vez sobre o vetor inteiro
+            angles = np.multiply(angles, _DEG_TO_RAD)
+
+        if function == 'sin':
+            result = np.sin(angles)
+        elif function == 'cos':
+            result = np.cos(angles)
+        else:
+            result = np.tan(angles)
+            near_pole = np.abs(np.cos(angles)) < NEAR_POLE_TOLERANCE
+
+    mask = np.zeros(result.shape, dtype=np.uint8)
+    if function == 'tan':
+        mask[near_pole] = BATCH_NEAR_POLE
+    mask[invalid] = BATCH_INVALID_INPUT
+    return _numpy_finish(result, mask)
+
+
+def _numpy_unary_operation(values: Any, operation: str) -> Tuple[Any, Any]:
+    """Núcleo vetorizado das operações unárias usando NumPy."""
+    data, invalid = _numpy_column(values)
+    data = np.atleast_1d(data)
+    invalid = invalid.reshape(data.shape)
+
+    with np.errstate(all="ignore"):
+        if operation == 'square_root':
+            result = np.sqrt(data)
+        elif operation == 'circle_area':
+            result = np.pi * data * data
+        elif operation == 'sphere_volume':
+            result = (4/3) * np.pi * data * data * data
+        elif operation == 'degrees_to_radians':
+            result = data * _DEG_TO_RAD
+        else:
+            result = data * _RAD_TO_DEG
+
+    mask = np.zeros(result.shape, dtype=np.uint8)
+    if _PYTHON_UNARY[operation][1]:
+        mask[data < 0] = BATCH_DOMAIN_ERROR
+    mask[invalid] = BATCH_INVALID_INPUT
+    return _numpy_finish(result, mask)
+
+
+# ---------------------------------------------------------------------------
+# Implementação pura em Python (módulo array)
+# ---------------------------------------------------------------------------
+
+def _python_column(values: Any) -> Tuple[array, array]:
+    """
+    Converte uma coluna de entrada em array('d') e máscara de inválidos.
+
+    Objetos com protocolo de buffer em float64 são copiados diretamente,
+    sem conversão elemento a elemento.
+    """
+    if _is_scalar(values):
+        values = (values,)
+
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+
+    if view is not None and view.format == 'd' and view.ndim == 1:
+        data = array('d')
+        data.frombytes(view.cast('B'))
+        return data, array('B', bytes(len(data)))
+
+    try:
+        items = iter(values)
+    except TypeError:
+        # Objetos não iteráveis (None, por exemplo) são um único elemento,
+        # como na conversão do NumPy
+        items = iter((values,))
+
+    data = array('d')
+    invalid = array('B')
+    for item in items:
+        try:
+            data.append(_parse_element(item))
+            invalid.append(0)
+        except (ValueError, TypeError):
+            data.append(_NAN)
+            invalid.append(1)
+    return data, invalid
+
+
+def _python_broadcast(a: array, b: array) -> int:
+    """Valida os tamanhos das colunas, permitindo broadcast de escalares."""
+    if len(a) == len(b) or len(a) == 1 or len(b) == 1:
+        return max(len(a), len(b))
+    raise ValueError(
+        f"Tamanhos incompatíveis entre os operandos: {len(a)} e {len(b)}"
+    )
+
+
+def _python_round(value: float) -> float:
+    """Arredonda para 10 casas decimais como no cálculo escalar."""
+    if abs(value) < _ROUND_LIMIT:
+        return round(value, 10)
+    return value
+
+
+def _python_basic_operation(num1_values: Any, num2_values: Any,
+                            operator: str) -> Tuple[array, array]:
+    """Núcleo de basic_operation usando apenas a biblioteca padrão."""
+    a, invalid_a = _python_column(num1_values)
+    b, invalid_b = _python_column(num2_values)
+    size = _python_broadcast(a, b)
+    step_a = 1 if len(a) > 1 else 0
+    step_b = 1 if len(b) > 1 else 0
+    function = BINARY_OPERATORS[operator]
+    isfinite = math.isfinite
+
+    results = array('d', bytes(8 * size))
+    mask = array('B', bytes(size))
+    for index in range(size):
+        ia = index * step_a
+        ib = index * step_b
+        if invalid_a[ia] or invalid_b[ib]:
+            mask[index] = BATCH_INVALID_INPUT
+            results[index] = _NAN
+            continue
+        n2 = b[ib]
+        if operator == '/' and n2 == 0:
+            mask[index] = BATCH_DIVISION_BY_ZERO
+            results[index] = _NAN
+            continue
+        try:
+            value = function(a[ia], n2)
+        except ZeroDivisionError:
+            mask[index] = BATCH_DIVISION_BY_ZERO
+            results[index] = _NAN
+            continue
+        except (ValueError, OverflowError):
+            value = _NAN
+        if not isfinite(value):
+            mask[index] = BATCH_CALCULATION_ERROR
+            results[index] = _NAN
+            continue
+        results[index] = _python_round(value)
+    return results, mask
+
+
+def _python_trigonometric(values: Any, function: str,
+                          unit: str) -> Tuple[array, array]:
+    """Núcleo de trigonometric usando apenas a biblioteca padrão."""
+    angles, invalid = _python_column(values)
+    size = len(angles)
+    trig = TRIGONOMETRIC_FUNCTIONS[function]
+    cos = math.cos
+    isfinite = math.isfinite
+    factor = _DEG_TO_RAD if unit == "degrees" else 1.0
+    is_tan = function == 'tan'
+
+    results = array('d', bytes(8 * size))
+    mask = array('B', bytes(size))
+    for index in range(size):
+        if invalid[index]:
+            mask[index] = BATCH_INVALID_INPUT
+            results[index] = _NAN
+            continue
+        angle = angles[index] * factor
+        if not isfinite(angle):
+            mask[index] = BATCH_CALCULATION_ERROR
+            results[index] = _NAN
+            continue
+        if is_tan and abs(cos(angle)) < NEAR_POLE_TOLERANCE:
+            mask[index] = BATCH_NEAR_POLE
+            results[index] = _NAN
+            continue
+        try:
+            value = trig(angle)
+        except (ValueError, OverflowError):
+            value = _NAN
+        if not isfinite(value):
+            mask[index] = BATCH_CALCULATION_ERROR
+            results[index] = _NAN
+            continue
+        results[index] = _python_round(value)
+    return results, mask
+
+
+def _python_unary_operation(values: Any, operation: str) -> Tuple[array, array]:
+    """Núcleo das operações unárias usando apenas a biblioteca padrão."""
+    data, invalid = _python_column(values)
+    size = len(data)
+    function, non_negative = _PYTHON_UNARY[operation]
+    isfinite = math.isfinite
+
+    results = array('d', bytes(8 * size))
+    mask = array('B', bytes(size))
+    for index in range(size):
+        if invalid[index]:
+            mask[index] = BATCH_INVALID_INPUT
+            results[index] = _NAN
+            continue
+        value = data[index]
+        if non_negative and value < 0:
+            mask[index] = BATCH_DOMAIN_ERROR
+            results[index] = _NAN
+            continue
+        value = function(value) if isfinite(value) else _NAN
+        if not isfinite(value):
+            mask[index] = BATCH_CALCULATION_ERROR
+            results[index] = _NAN
+            continue
+        results[index] = _python_round(value)
+    return results, mask
+
+
+# ---------------------------------------------------------------------------
+# Interface pública
+# ---------------------------------------------------------------------------
+
+def basic_operation(num1_values: Any, num2_values: Any,
+                    operator: str) -> Tuple[Any, Any]:
+    """
+    Executa uma operação básica sobre colunas de operandos.
+
+    Args:
+        num1_values: Coluna (ou escalar) com os primeiros operandos
+        num2_values: Coluna (ou escalar) com os segundos operandos
+        operator: Um dos BINARY_OPERATORS, previamente validado
+
+    Returns:
+        Tuple: (resultados, máscara_de_erros)
+
+    Raises:
+        ValueError: Se as colunas tiverem tamanhos incompatíveis
+    """
+    if operator in _NUMPY_OPERATORS and numpy_available():
+        return _numpy_basic_operation(num1_values, num2_values, operator)
+    return _python_basic_operation(num1_values, num2_values, operator)
+
+
+def trigonometric(values: Any, function: str, unit: str) -> Tuple[Any, Any]:
+    """
+    Calcula uma função trigonométrica sobre um vetor de ângulos.
+
+    Args:
+        values: Vetor de ângulos
+        function: Nome de uma das TRIGONOMETRIC_FUNCTIONS, previamente validado
+        unit: Unidade dos ângulos (radians ou degrees), previamente validada
+
+    Returns:
+        Tuple: (resultados, máscara_de_erros); tangentes próximas de uma
+        assíntota são marcadas com BATCH_NEAR_POLE
+    """
+    if function in _NUMPY_TRIG_FUNCTIONS and numpy_available():
+        return _numpy_trigonometric(values, function, unit)
+    return _python_trigonometric(values, function, unit)
+
+
+def unary_operation(values: Any, operation: str) -> Tuple[Any, Any]:
+    """
+    Aplica uma operação unária do motor sobre um vetor de valores.
+
+    Args:
+        values: Vetor de valores
+        operation: Uma das UNARY_OPERATIONS (square_root, circle_area,
+            sphere_volume, degrees_to_radians, radians_to_degrees)
+
+    Returns:
+        Tuple: (resultados, máscara_de_erros); raios e radicandos negativos
+        são marcados com BATCH_DOMAIN_ERROR
+
+    Raises:
+        ValueError: Se a operação não for unária
+    """
+    if operation not in _PYTHON_UNARY:
+        raise ValueError(f"Operação unária inválida: {operation}")
+    if numpy_available():
+        return _numpy_unary_operation(values, operation)
+    return _python_unary_operation(values, operation)
+
+
+def count_errors(mask: Any) -> int:
+    """
+    Conta os elementos com erro em uma máscara.
+
+    Args:
+        mask: Máscara de erros retornada por um núcleo
+
+    Returns:
+        int: Quantidade de elementos com código diferente de BATCH_OK
+    """
+    if numpy_available() and isinstance(mask, np.ndarray):
+        return int(np.count_nonzero(mask))
+    return len(mask) - mask.count(BATCH_OK)
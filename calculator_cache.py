@@ -0,0 +1,228 @@
+"""
+Cache de Resultados da Calculadora Moderna
+
+Este módulo contém a classe ResultCache, usada pelo CalculatorEngine para
+memorizar as respostas das funções puras (raiz quadrada, trigonometria,
+conversões de ângulo e cálculos geométricos). O cache tem capacidade limitada,
+política de remoção configurável (LRU ou LFU) e contadores de acertos, falhas
+e remoções por tipo de operação.
+
+As chaves são tuplas (tipo_da_operação, *argumentos_convertidos), de modo que
+"16", 16 e 16.0 compartilham a mesma entrada.
+"""
+
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+CACHE_POLICIES = ("lru", "lfu")
+
+
+class _LRUStore:
+    """Armazenamento com remoção do item menos recentemente usado."""
+
+    def __init__(self):
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable) -> Any:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self._items[key] = value
+        self._items.move_to_end(key)
+
+    def evict(self) -> Hashable:
+        key, _ = self._items.popitem(last=False)
+        return key
+
+    def clear(self):
+        self._items.clear()
+
+
+class _LFUStore:
+    """
+    Armazenamento com remoção do item menos frequentemente usado.
+
+    Os itens são agrupados por frequência de acesso; empates são desfeitos
+    removendo o item mais antigo da menor frequência (O(1) por operação).
+    """
+
+    def __init__(self):
+        self._values: Dict[Hashable, Any] = {}
+        self._frequency: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = defaultdict(OrderedDict)
+        self._min_frequency = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def _touch(self, key: Hashable):
+        frequency = self._frequency[key]
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+        self._frequency[key] = frequency + 1
+        self._buckets[frequency + 1][key] = None
+
+    def get(self, key: Hashable) -> Any:
+        value = self._values.get(key)
+        if value is not None:
+            self._touch(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        if key in self._values:
+            self._values[key] = value
+            self._touch(key)
+            return
+        self._values[key] = value
+        self._frequency[key] = 1
+        self._buckets[1][key] = None
+        self._min_frequency = 1
+
+    def evict(self) -> Hashable:
+        bucket = self._buckets[self._min_frequency]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_frequency]
+            self._min_frequency = min(self._buckets) if self._buckets else 0
+        del self._values[key]
+        del self._frequency[key]
+        return key
+
+    def clear(self):
+        self._values.clear()
+        self._frequency.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+
+class ResultCache:
+    """
+    Cache limitado de respostas do motor de cálculo.
+    """
+
+    def __init__(self, capacity: int = 1024, policy: str = "lru"):
+        """
+        Inicializa o cache.
+
+        Args:
+            capacity: Quantidade máxima de respostas armazenadas
+            policy: Política de remoção ("lru" ou "lfu")
+
+        Raises:
+            ValueError: Se a capacidade for negativa ou a política inválida
+        """
+        if policy not in CACHE_POLICIES:
+            raise ValueError("Política de cache inválida. Use 'lru' ou 'lfu'")
+        if capacity < 0:
+            raise ValueError("A capacidade do cache não pode ser negativa")
+        self.policy = policy
+        self.capacity = capacity
+        self._store = _LRUStore() if policy == "lru" else _LFUStore()
+        # Contadores por operação: [acertos, falhas, remoções]
+        self._counters: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _counter(self, operation: str) -> List[int]:
+        counter = self._counters.get(operation)
+        if counter is None:
+            counter = self._counters[operation] = [0, 0, 0]
+        return counter
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        """
+        Busca uma resposta no cache.
+
+        Args:
+            key: Tupla (tipo_da_operação, *argumentos)
+
+        Returns:
+            A resposta armazenada ou None se não houver entrada
+        """
+        value = self._store.get(key)
+        self._counter(key[0])[0 if value is not None else 1] += 1
+        return value
+
+    def put(self, key: Tuple[Any, ...], value: Any):
+        """
+        Armazena uma resposta, removendo entradas se a capacidade for excedida.
+
+        Args:
+            key: Tupla (tipo_da_operação, *argumentos)
+            value: Resposta a ser armazenada
+        """
+        if self.capacity == 0:
+            return
+        if key not in self._store:
+            # Remover antes de inserir para que a nova entrada não seja a
+            # própria candidata à remoção na política LFU
+            self._shrink(self.capacity - 1)
+        self._store.put(key, value)
+
+    def _shrink(self, limit: int):
+        while len(self._store) > limit:
+            evicted = self._store.evict()
+            self._counter(evicted[0])[2] += 1
+
+    def resize(self, capacity: int):
+        """
+        Altera a capacidade do cache, removendo entradas se necessário.
+
+        Args:
+            capacity: Nova capacidade máxima
+        """
+        if capacity < 0:
+            raise ValueError("A capacidade do cache não pode ser negativa")
+        self.capacity = capacity
+        self._shrink(capacity)
+
+    def clear(self, reset_stats: bool = False):
+        """
+        Remove todas as entradas do cache.
+
+        Args:
+            reset_stats: Se True, também zera os contadores
+        """
+        self._store.clear()
+        if reset_stats:
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna as estatísticas do cache.
+
+        Returns:
+            Dict: Política, capacidade, tamanho, totais e contadores por
+            operação (hits, misses, evictions)
+        """
+        operations = {
+            operation: {"hits": hits, "misses": misses, "evictions": evictions}
+            for operation, (hits, misses, evictions) in self._counters.items()
+        }
+        return {
+            "policy": self.policy,
+            "capacity": self.capacity,
+            "size": len(self._store),
+            "hits": sum(counter["hits"] for counter in operations.values()),
+            "misses": sum(counter["misses"] for counter in operations.values()),
+            "evictions": sum(counter["evictions"] for counter in operations.values()),
+            "operations": operations
+        }
@@ -0,0 +1,92 @@
+"""
+Conversão Numérica da Calculadora Moderna
+
+Este módulo contém a camada única de conversão de entradas numéricas usada pelo
+motor de cálculo, pelas operações em lote e pelo controlador. Cada valor é
+convertido uma única vez: o resultado é o float correspondente ou uma falha
+tipada (InvalidNumber) descrevendo o motivo da rejeição.
+"""
+
+from typing import Any, Union
+
+
+class InvalidNumber:
+    """
+    Falha de conversão de um valor numérico.
+
+    As instâncias são pré-construídas (uma por motivo) e compartilhadas.
+    """
+
+    __slots__ = ("reason",)
+
+    def __init__(self, reason: str):
+        """
+        Inicializa a falha.
+
+        Args:
+            reason: Motivo da rejeição (empty, format, type, overflow)
+        """
+        self.reason = reason
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"InvalidNumber({self.reason!r})"
+
+
+EMPTY = InvalidNumber("empty")
+INVALID_FORMAT = InvalidNumber("format")
+INVALID_TYPE = InvalidNumber("type")
+OUT_OF_RANGE = InvalidNumber("overflow")
+
+
+def parse_number(value: Any) -> Union[float, InvalidNumber]:
+    """
+    Converte um valor de entrada para float.
+
+    Valores int/float são aceitos sem nova análise; textos aceitam vírgula
+    como separador decimal ("3,5").
+
+    Args:
+        value: Valor a ser convertido
+
+    Returns:
+        float | InvalidNumber: Valor convertido ou a falha correspondente
+    """
+    cls = value.__class__
+    if cls is float:
+        return value
+    if cls is int:
+        try:
+            return float(value)
+        except OverflowError:
+            return OUT_OF_RANGE
+
+    if cls is str:
+        if not value:
+            return EMPTY
+        if ',' in value:
+            value = value.replace(',', '.')
+
+    try:
+        return float(value)
+    except ValueError:
+        return INVALID_FORMAT
+    except TypeError:
+        return INVALID_TYPE
+    except OverflowError:
+        return OUT_OF_RANGE
+
+
+def is_number(value: Any) -> bool:
+    """
+    Verifica se um valor pode ser convertido para número.
+
+    Args:
+        value: Valor a ser verificado
+
+    Returns:
+        bool: True se parse_number aceitar o valor
+    """
+    return not isinstance(parse_number(value), InvalidNumber)
@@ -6,9 +6,46 @@ entre a interface gráfica e o motor de cálculo, gerenciando o estado da
 aplicação e processando comandos de entrada.
 """
 
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Union
+from typing import Callable, Iterable, Iterator, List, Dict, Any, NamedTuple, Optional, Union
+from calculator_coercion import is_number
 from calculator_engine import CalculatorEngine
+from calculator_expression import ExpressionCompiler, ExpressionError
+from calculator_history import (
+    ColumnarHistory, Instant, RingHistory, ThroughputMeter, quantize_seconds
+)
+from calculator_registry import OPERATIONS, OperationRegistry
+
+
+# Quantidade máxima de linhas formatadas mantidas em cache (as mais recentes)
+FORMATTED_CACHE_SIZE = 1024
+
+# Eventos de alteração do histórico enviados aos ouvintes
+HISTORY_APPENDED = "appended"
+HISTORY_EVICTED = "evicted"
+HISTORY_CLEARED = "cleared"
+
+# Ouvinte: função(evento) com evento = {"type": ..., "lines" ou "count"}
+HistoryListener = Callable[[Dict[str, Any]], None]
+
+
+def format_history_entry(entry: Dict[str, Any]) -> str:
+    """
+    Formata uma entrada do histórico para exibição.
+    
+    Args:
+        entry: Entrada do histórico
+    
+    Returns:
+        str: "[HH:MM:SS] operação = resultado" (ou "= Erro: mensagem")
+    """
+    timestamp = entry["timestamp"].strftime("%H:%M:%S")
+    if entry["success"]:
+        return f"[{timestamp}] {entry['operation']} = {entry['result']}"
+    return f"[{timestamp}] {entry['operation']} = Erro: {entry['result']}"
 
 
 class CalculatorState:
@@ -16,6 +53,9 @@ class CalculatorState:
     Classe para gerenciar o estado atual da calculadora.
     """
     
+    __slots__ = ("current_value", "previous_value", "operator",
+                 "waiting_for_operand", "last_operation", "display_value")
+    
     def __init__(self):
         """Inicializa o estado da calculadora."""
         self.current_value: str = "0"
@@ -35,20 +75,128 @@ class CalculatorState:
         self.display_value = "0"
 
 
+class StateSnapshot(NamedTuple):
+    """Cópia imutável do estado da calculadora em um instante."""
+    
+    current_value: str
+    previous_value: str
+    operator: str
+    waiting_for_operand: bool
+    last_operation: str
+    display_value: str
+
+
 class CalculatorController:
     """
     Controlador principal da calculadora que gerencia a comunicação entre
     a interface gráfica e o motor de cálculo.
     """
     
-    def __init__(self):
-        """Inicializa o controlador da calculadora."""
-        self.engine = CalculatorEngine()
+    def __init__(self, operations: Optional[OperationRegistry] = None,
+                 history_size: int = 10, compact_history: bool = False,
+                 history_path: Optional[str] = None, throughput_window: float = 10.0,
+                 engine: Optional[CalculatorEngine] = None,
+                 expression_compiler: Optional[ExpressionCompiler] = None):
+        """
+        Inicializa o controlador da calculadora.
+        
+        Args:
+            operations: Registro de operações de execute_operation (padrão:
+                o registro compartilhado calculator_registry.OPERATIONS)
+            history_size: Capacidade inicial do histórico
+            compact_history: Se o histórico deve usar o armazenamento em
+                colunas (ColumnarHistory), indicado para históricos grandes
+            history_path: Arquivo SQLite para um histórico persistente
+                (SQLiteHistory); nesse caso history_size e compact_history
+                são ignorados e o histórico não tem limite de tamanho
+            throughput_window: Janela, em segundos, da taxa de operações por
+                segundo informada por get_history_summary
+            engine: Motor de cálculo (padrão: um novo); pode ser compartilhado
+                entre controladores, junto com seu cache de resultados
+            expression_compiler: Compilador de expressões (padrão: um novo,
+                ligado ao motor); pode ser compartilhado junto com seu cache
+        """
+        self.engine = engine if engine is not None else CalculatorEngine()
+        self.operations = operations if operations is not None else OPERATIONS
+        self.expression_compiler = (
+            expression_compiler if expression_compiler is not None
+            else ExpressionCompiler(self.engine)
+        )
         self.state = CalculatorState()
-        self.history: List[Dict[str, Any]] = []
-        self.max_history_size = 10
+        if history_path is not None:
+            from calculator_history_sqlite import SQLiteHistory
+            self.history = SQLiteHistory(history_path)
+        else:
+            history_class = ColumnarHistory if compact_history else RingHistory
+            self.history = history_class(history_size)
+        
+        # Quantidade de entradas, mantida aqui para que os eventos e as janelas
+        # formatadas não consultem o armazenamento a cada operação
+        self._history_count = len(self.history)
+        # Linhas formatadas das entradas mais recentes (as últimas
+        # len(self._formatted_lines) entradas do histórico)
+        self._formatted_lines = RingHistory(self._formatted_cache_size())
+        self._history_listeners: List[HistoryListener] = []
+        self._throughput = ThroughputMeter(throughput_window)
+        # Gravador das chamadas de process_input e execute_operation
+        self._recorder = None
+    
+    @property
+    def max_history_size(self) -> Optional[int]:
+        """Capacidade do histórico (alterável em tempo de execução; None = sem limite)."""
+        return self.history.capacity
+    
+    @max_history_size.setter
+    def max_history_size(self, capacity: int):
+        # O histórico em SQLite informa só a quantidade de descartes, sem
+        # carregar as entradas removidas
+        set_capacity = getattr(self.history, "set_capacity", None)
+        if set_capacity is not None:
+            evicted = set_capacity(capacity)
+        else:
+            evicted = len(self.history.resize(capacity))
+        self._formatted_lines.resize(self._formatted_cache_size())
+        if evicted:
+            self._history_count -= evicted
+            self._notify_history({"type": HISTORY_EVICTED, "count": evicted})
+    
+    def _formatted_cache_size(self) -> int:
+        capacity = self.history.capacity
+        return FORMATTED_CACHE_SIZE if capacity is None else min(capacity, FORMATTED_CACHE_SIZE)
     
-    def _add_to_history(self, operation: str, result: str, success: bool):
+    def add_history_listener(self, listener: HistoryListener):
+        """
+        Registra um ouvinte das alterações do histórico.
+        
+        O ouvinte recebe um dicionário por alteração, na ordem em que ocorrem:
+        {"type": HISTORY_EVICTED, "count": n} quando as n entradas mais
+        antigas são descartadas, {"type": HISTORY_APPENDED, "lines": [...]}
+        com as linhas formatadas das novas entradas e
+        {"type": HISTORY_CLEARED} quando o histórico é limpo.
+        
+        Args:
+            listener: Função chamada com cada evento
+        """
+        self._history_listeners.append(listener)
+    
+    def remove_history_listener(self, listener: HistoryListener):
+        """
+        Remove um ouvinte registrado com add_history_listener.
+        
+        Args:
+            listener: Ouvinte a ser removido
+        
+        Raises:
+            ValueError: Se o ouvinte não estiver registrado
+        """
+        self._history_listeners.remove(listener)
+    
+    def _notify_history(self, event: Dict[str, Any]):
+        for listener in self._history_listeners:
+            listener(event)
+    
+    def _add_to_history(self, operation: str, result: str, success: bool,
+                        operation_type: str = ""):
         """
         Adiciona uma operação ao histórico.
         
@@ -56,19 +204,74 @@ class CalculatorController:
             operation: Descrição da operação realizada
             result: Resultado da operação
             success: Se a operação foi bem-sucedida
+            operation_type: Tipo da operação (ex.: "basic_operation")
         """
-        history_entry = {
-            "timestamp": datetime.now(),
-            "operation": operation,
-            "result": result,
-            "success": success
-        }
+        timestamp = time.time()
+        self._record_history(operation, result, success, operation_type, timestamp)
+        self._throughput.record(timestamp)
+    
+    def _record_history(self, operation: str, result: str, success: bool,
+                        operation_type: str, timestamp: float):
+        """Grava uma entrada e atualiza a contagem, o cache de linhas e os ouvintes."""
+        # O buffer circular descarta a entrada mais antiga quando está cheio
+        self.history.add(operation, result, success, timestamp=timestamp,
+                         operation_type=operation_type)
+        line = None
+        if self._history_listeners:
+            line = format_history_entry({
+                "timestamp": datetime.fromtimestamp(timestamp),
+                "operation": operation,
+                "result": result,
+                "success": success
+            })
+        
+        # A linha é formatada uma única vez; sem ouvintes, só quando for pedida
+        self._formatted_lines.append(line)
+        
+        capacity = self.history.capacity
+        if capacity is not None and self._history_count == capacity:
+            self._notify_history({"type": HISTORY_EVICTED, "count": 1})
+        else:
+            self._history_count += 1
+        if line is not None:
+            self._notify_history({"type": HISTORY_APPENDED, "lines": [line]})
+    
+    def load_history(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insere entradas já existentes (por exemplo, importadas de um arquivo)
+        no histórico, mantendo seus horários.
+        
+        As entradas devem estar em ordem de horário e não ser anteriores às
+        já registradas, como as produzidas por uma exportação do histórico:
+        as consultas por horário dependem dessa ordem. Elas não entram na
+        taxa de operações por segundo.
+        
+        Args:
+            entries: Entradas no formato de get_history (consumidas sob demanda)
         
-        self.history.append(history_entry)
+        Returns:
+            int: Quantidade de entradas inseridas
         
-        # Manter apenas as últimas 10 operações
-        if len(self.history) > self.max_history_size:
-            self.history.pop(0)
+        Raises:
+            ValueError: Se uma entrada for anterior à última do histórico (as
+                entradas lidas antes dela permanecem inseridas)
+        """
+        last = quantize_seconds(self.history[-1]["timestamp"].timestamp()) if self.history else None
+        count = 0
+        for entry in entries:
+            timestamp = quantize_seconds(entry["timestamp"].timestamp())
+            if last is not None and timestamp < last:
+                raise ValueError(
+                    f"Entrada {count + 1} fora de ordem: {entry['timestamp']} é anterior "
+                    "à última entrada do histórico"
+                )
+            self._record_history(
+                entry["operation"], entry["result"], entry["success"],
+                entry.get("operation_type", ""), timestamp
+            )
+            last = timestamp
+            count += 1
+        return count
     
     def _format_result(self, result: Union[float, int, str]) -> str:
         """
@@ -107,12 +310,11 @@ class CalculatorController:
             return False
         
         # Verificar se é um número válido
-        try:
-            float(input_data.replace(',', '.'))
+        if is_number(input_data):
             return True
-        except ValueError:
-            # Verificar se é um operador válido
-            return input_data in ['+', '-', '*', '/', '=', 'C', '←', '.']
+        
+        # Verificar se é um operador válido
+        return input_data in ['+', '-', '*', '/', '=', 'C', '←', '±', '.']
     
     def process_input(self, input_data: str) -> str:
         """
@@ -125,22 +327,27 @@ class CalculatorController:
             str: Valor a ser exibido no display
         """
         if not self._validate_input(input_data):
-            return self.state.display_value
-        
+            display = self.state.display_value
         # Processar comandos especiais
-        if input_data == 'C':
-            return self.clear_all()
+        elif input_data == 'C':
+            display = self.clear_all()
         elif input_data == '←':
-            return self._backspace()
+            display = self._backspace()
+        elif input_data == '±':
+            display = self._toggle_sign()
         elif input_data == '=':
-            return self._calculate()
+            display = self._calculate()
         elif input_data in ['+', '-', '*', '/']:
-            return self._set_operator(input_data)
+            display = self._set_operator(input_data)
         elif input_data == '.':
-            return self._add_decimal()
+            display = self._add_decimal()
         else:
             # É um número
-            return self._add_digit(input_data)
+            display = self._add_digit(input_data)
+        
+        if self._recorder is not None:
+            self._recorder.record_input(input_data, display)
+        return display
     
     def _add_digit(self, digit: str) -> str:
         """
@@ -196,6 +403,23 @@ class CalculatorController:
         self.state.display_value = self.state.current_value
         return self.state.display_value
     
+    def _toggle_sign(self) -> str:
+        """
+        Alterna o sinal do valor exibido (positivo/negativo).
+        
+        Zero e mensagens de erro não são alterados.
+        
+        Returns:
+            str: Novo valor do display
+        """
+        value = self.state.display_value
+        if value != "0" and is_number(value):
+            value = value[1:] if value.startswith("-") else "-" + value
+            self.state.current_value = value
+            self.state.display_value = value
+        
+        return self.state.display_value
+    
     def _set_operator(self, operator: str) -> str:
         """
         Define o operador para a próxima operação.
@@ -244,13 +468,15 @@ class CalculatorController:
                 self.state.last_operation = f"{operation_str} = {formatted_result}"
                 
                 # Adicionar ao histórico
-                self._add_to_history(operation_str, formatted_result, True)
+                self._add_to_history(operation_str, formatted_result, True, "basic_operation")
             else:
                 self.state.display_value = "Erro"
                 self.state.last_operation = f"{operation_str} = Erro: {result['error_message']}"
                 
                 # Adicionar erro ao histórico
-                self._add_to_history(operation_str, result["error_message"], False)
+                self._add_to_history(
+                    operation_str, result["error_message"], False, "basic_operation"
+                )
             
             # Resetar estado para próxima operação
             self.state.operator = ""
@@ -264,7 +490,8 @@ class CalculatorController:
             self._add_to_history(
                 f"{self.state.previous_value} {self.state.operator} {self.state.current_value}",
                 f"Erro interno: {str(e)}",
-                False
+                False,
+                "basic_operation"
             )
             return self.state.display_value
     
@@ -279,63 +506,20 @@ class CalculatorController:
         Returns:
             str: Resultado formatado da operação
         """
+        result = self._execute_operation(operation_type, kwargs)
+        if self._recorder is not None:
+            self._recorder.record_operation(operation_type, kwargs, self.state.display_value)
+        return result
+    
+    def _execute_operation(self, operation_type: str, kwargs: Dict[str, Any]) -> str:
+        spec = self.operations.get(operation_type)
+        if spec is None:
+            return "Operação não reconhecida"
+        
         try:
-            result = None
-            operation_str = ""
-            
-            if operation_type == "percentage":
-                number = kwargs.get("number")
-                percent = kwargs.get("percent")
-
-                if number is None:
-                    if self.state.previous_value:
-                        number = self.state.previous_value
-                    else:
-                        number = self.state.current_value
-
-                if percent is None:
-                    percent = self.state.current_value
-
-                result = self.engine.percentage(number, percent)
-                operation_str = f"{percent}% de {number}"
-
-            elif operation_type == "square_root":
-                number = kwargs.get("number", self.state.current_value)
-                result = self.engine.square_root(number)
-                operation_str = f"√{number}"
-
-            elif operation_type == "trigonometric":
-                number = kwargs.get("number", self.state.current_value)
-                function = kwargs.get("function", "sin")
-                unit = kwargs.get("unit", "degrees")
-                result = self.engine.trigonometric(number, function, unit)
-                unit_symbol = "°" if unit == "degrees" else "rad"
-                operation_str = f"{function}({number}{unit_symbol})"
-                
-            elif operation_type == "circle_area":
-                radius = kwargs.get("radius", self.state.current_value)
-                result = self.engine.circle_area(radius)
-                operation_str = f"Área círculo (r={radius})"
-                
-            elif operation_type == "sphere_volume":
-                radius = kwargs.get("radius", self.state.current_value)
-                result = self.engine.sphere_volume(radius)
-                operation_str = f"Volume esfera (r={radius})"
-                
-            elif operation_type == "is_even_odd":
-                number = kwargs.get("number", self.state.current_value)
-                result = self.engine.is_even_odd(number)
-                operation_str = f"{number} é par/ímpar?"
-                
-            elif operation_type == "degrees_to_radians":
-                degrees = kwargs.get("degrees", self.state.current_value)
-                result = self.engine.degrees_to_radians(degrees)
-                operation_str = f"{degrees}° → rad"
-                
-            elif operation_type == "radians_to_degrees":
-                radians = kwargs.get("radians", self.state.current_value)
-                result = self.engine.radians_to_degrees(radians)
-                operation_str = f"{radians}rad → °"
+            args = spec.resolve_arguments(self.state, kwargs)
+            result = spec.call(self.engine, args)
+            operation_str = spec.describe(*args)
             
             if result:
                 if result["success"]:
@@ -344,19 +528,21 @@ class CalculatorController:
                     self.state.display_value = formatted_result
                     self.state.waiting_for_operand = True
 
-                    if operation_type == "percentage":
+                    if spec.clears_pending:
                         self.state.previous_value = ""
                         self.state.operator = ""
 
                     # Adicionar ao histórico
-                    self._add_to_history(operation_str, formatted_result, True)
+                    self._add_to_history(operation_str, formatted_result, True, operation_type)
                     
                     return formatted_result
                 else:
                     self.state.display_value = "Erro"
                     
                     # Adicionar erro ao histórico
-                    self._add_to_history(operation_str, result["error_message"], False)
+                    self._add_to_history(
+                        operation_str, result["error_message"], False, operation_type
+                    )
                     
                     return result["error_message"]
             
@@ -365,70 +551,276 @@ class CalculatorController:
         except Exception as e:
             error_msg = f"Erro interno: {str(e)}"
             self.state.display_value = "Erro"
-            self._add_to_history(operation_type, error_msg, False)
+            self._add_to_history(operation_type, error_msg, False, operation_type)
+            return error_msg
+    
+    def evaluate_expression(self, expression: str, **variables) -> str:
+        """
+        Avalia uma expressão completa (ex.: "2 + 3 * sqrt(16)").
+        
+        A expressão é compilada uma única vez e reaproveitada do cache do
+        compilador nas avaliações seguintes.
+        
+        Args:
+            expression: Expressão infixa
+            **variables: Valores das variáveis usadas na expressão
+            
+        Returns:
+            str: Resultado formatado ou mensagem de erro
+        """
+        try:
+            result = self.expression_compiler.evaluate(expression, **variables)
+        except ExpressionError as e:
+            error_msg = str(e) if str(e).startswith("Erro") else f"Erro: {e}"
+            self.state.display_value = "Erro"
+            self._add_to_history(expression, error_msg, False, "expression")
             return error_msg
+        
+        formatted_result = self._format_result(result)
+        self.state.current_value = str(result)
+        self.state.display_value = formatted_result
+        self.state.waiting_for_operand = True
+        self.state.last_operation = f"{expression} = {formatted_result}"
+        self._add_to_history(expression, formatted_result, True, "expression")
+        return formatted_result
     
-    def get_history(self) -> List[Dict[str, Any]]:
+    def get_history(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retorna o histórico de operações.
         
+        Args:
+            start: Índice inicial da janela, como em fatias do Python
+                (get_history(-50) retorna as 50 últimas operações)
+            stop: Índice final da janela, exclusivo (None = até a última)
+        
         Returns:
-            List: Lista com as últimas operações realizadas
+            List: Operações da janela, da mais antiga para a mais recente
         """
-        return self.history.copy()
+        return self.history.window(start, stop)
     
-    def get_formatted_history(self) -> List[str]:
+    def get_formatted_history(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
         """
         Retorna o histórico formatado para exibição na interface.
         
+        Args:
+            start: Índice inicial da janela, como em get_history
+            stop: Índice final da janela, exclusivo (None = até a última)
+        
         Returns:
             List[str]: Lista de strings formatadas com as operações
         """
+        start, stop, _ = slice(start, stop).indices(self._history_count)
+        if start >= stop:
+            return []
+        
+        # Entradas mais antigas que o cache são formatadas na hora
+        first_cached = self._history_count - len(self._formatted_lines)
         formatted_history = []
+        if start < first_cached:
+            formatted_history = [
+                format_history_entry(entry)
+                for entry in self.history.window(start, min(stop, first_cached))
+            ]
+            start = first_cached
         
-        for entry in self.history:
-            timestamp = entry["timestamp"].strftime("%H:%M:%S")
-            operation = entry["operation"]
-            result = entry["result"]
-            
-            if entry["success"]:
-                formatted_entry = f"[{timestamp}] {operation} = {result}"
-            else:
-                formatted_entry = f"[{timestamp}] {operation} = Erro: {result}"
-            
-            formatted_history.append(formatted_entry)
+        if start < stop:
+            lines = self._formatted_lines.window(start - first_cached, stop - first_cached)
+            # Linhas ainda não formatadas (registradas sem ouvintes) são
+            # formatadas uma única vez e guardadas no cache
+            if None in lines:
+                entries = self.history.window(start, stop)
+                for offset, line in enumerate(lines):
+                    if line is None:
+                        line = lines[offset] = format_history_entry(entries[offset])
+                        self._formatted_lines[start - first_cached + offset] = line
+            formatted_history.extend(lines)
         
         return formatted_history
     
+    def query_history(self, start_time: Optional[Instant] = None,
+                      end_time: Optional[Instant] = None,
+                      operation_type: Optional[str] = None,
+                      success: Optional[bool] = None,
+                      contains: Optional[str] = None,
+                      limit: Optional[int] = None,
+                      offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta o histórico de operações com filtros.
+        
+        Os filtros de horário, tipo de operação e sucesso usam os índices do
+        armazenamento do histórico, sem percorrer as demais entradas, e as
+        entradas são produzidas sob demanda.
+        
+        Args:
+            start_time: Horário inicial, inclusivo (datetime ou segundos)
+            end_time: Horário final, exclusivo (datetime ou segundos)
+            operation_type: Tipo da operação (ex.: "square_root", "expression")
+            success: True para operações bem-sucedidas, False para erros
+            contains: Trecho do texto da operação
+            limit: Quantidade máxima de entradas (None = sem limite)
+            offset: Quantidade de entradas encontradas a pular
+        
+        Returns:
+            Iterator: Entradas encontradas, da mais antiga para a mais recente
+        
+        Raises:
+            ValueError: Se limit ou offset forem negativos
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("limit e offset não podem ser negativos")
+        return self.history.query(
+            start_time=start_time, end_time=end_time, operation_type=operation_type,
+            success=success, contains=contains, limit=limit, offset=offset
+        )
+    
+    def get_history_count(self) -> int:
+        """
+        Retorna a quantidade de operações no histórico.
+        
+        Returns:
+            int: Quantidade de entradas
+        """
+        return self._history_count
+    
     def clear_history(self):
         """
         Limpa todo o histórico de operações.
         """
         self.history.clear()
+        self._formatted_lines.clear()
+        self._history_count = 0
+        self._notify_history({"type": HISTORY_CLEARED})
     
     def get_history_summary(self) -> Dict[str, Any]:
         """
         Retorna um resumo do histórico de operações.
         
+        O custo não depende do tamanho do histórico: as contagens são
+        mantidas a cada inserção e descarte, e a taxa de operações vem de uma
+        janela móvel de contadores.
+        
         Returns:
-            Dict: Resumo com estatísticas do histórico
-        """
-        total_operations = len(self.history)
-        successful_operations = sum(1 for entry in self.history if entry["success"])
-        failed_operations = total_operations - successful_operations
+            Dict: Resumo com estatísticas do histórico, incluindo error_rate,
+            operations (total, successful, failed e error_rate por tipo de
+            operação) e operations_per_second (operações registradas nos
+            últimos throughput_window_seconds segundos, incluindo as que já
+            saíram do histórico)
+        """
+        # Cada armazenamento responde com sua própria estrutura (contagens em
+        # memória ou agregados indexados no SQLite), sem percorrer as entradas
+        summary = self.history.summary()
         
-        last_operation_time = None
-        if self.history:
-            last_operation_time = self.history[-1]["timestamp"]
+        operations = {}
+        for operation_type, counts in summary["operations"].items():
+            total = counts["successful"] + counts["failed"]
+            operations[operation_type] = {
+                "total": total,
+                "successful": counts["successful"],
+                "failed": counts["failed"],
+                "error_rate": counts["failed"] / total if total else 0.0
+            }
         
         return {
-            "total_operations": total_operations,
-            "successful_operations": successful_operations,
-            "failed_operations": failed_operations,
-            "last_operation_time": last_operation_time,
+            "total_operations": summary["total"],
+            "successful_operations": summary["successful"],
+            "failed_operations": summary["failed"],
+            "error_rate": summary["failed"] / summary["total"] if summary["total"] else 0.0,
+            "operations": operations,
+            "operations_per_second": self._throughput.rate(),
+            "throughput_window_seconds": self._throughput.window,
+            "last_operation_time": summary["last_timestamp"],
             "max_history_size": self.max_history_size
         }
     
+    def reset(self):
+        """
+        Restaura o controlador ao estado inicial, para ser reaproveitado.
+        
+        Limpa o display, o histórico e a taxa de operações e remove os
+        ouvintes do histórico (sem notificá-los). Uma gravação em andamento
+        é encerrada, para que o próximo usuário não grave no arquivo dela. O
+        motor, o compilador de expressões e a capacidade do histórico são
+        mantidos.
+        """
+        self.stop_recording()
+        self.state.reset()
+        self.history.clear()
+        self._formatted_lines.clear()
+        self._history_count = 0
+        self._history_listeners.clear()
+        self._throughput.clear()
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Estima a memória ocupada pelos objetos próprios do controlador.
+        
+        O motor, o compilador de expressões e o registro de operações não
+        entram na conta, pois podem ser compartilhados entre controladores.
+        
+        Returns:
+            Dict: Bytes de state, history, formatted_cache, other (objeto
+            do controlador, medidor de taxa e ouvintes) e o total em bytes
+        """
+        state = sys.getsizeof(self.state) + sum(
+            sys.getsizeof(getattr(self.state, name)) for name in CalculatorState.__slots__
+        )
+        history = self.history.memory_usage()["bytes"]
+        formatted_cache = self._formatted_lines.memory_usage()["bytes"]
+        other = (
+            sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+            + sys.getsizeof(self._throughput) + sys.getsizeof(self._throughput.__dict__)
+            + sys.getsizeof(self._throughput._counts) + sys.getsizeof(self._throughput._periods)
+            + sys.getsizeof(self._history_listeners)
+        )
+        return {
+            "state": state,
+            "history": history,
+            "formatted_cache": formatted_cache,
+            "other": other,
+            "bytes": state + history + formatted_cache + other
+        }
+    
+    def start_recording(self, path: str):
+        """
+        Passa a gravar as chamadas de process_input e execute_operation,
+        com seus horários e o display resultante (ver calculator_replay).
+        
+        Uma gravação em andamento é encerrada antes.
+        
+        Args:
+            path: Arquivo da gravação (comprimido com gzip se terminar em .gz)
+        
+        Returns:
+            KeystrokeRecorder: Gravador em uso
+        """
+        from calculator_replay import KeystrokeRecorder
+        self.stop_recording()
+        self._recorder = KeystrokeRecorder(path)
+        return self._recorder
+    
+    def stop_recording(self) -> int:
+        """
+        Encerra a gravação em andamento, se houver, e fecha o arquivo.
+        
+        Returns:
+            int: Quantidade de eventos gravados (0 sem gravação)
+        """
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return 0
+        recorder.close()
+        return recorder.events
+    
+    def close(self):
+        """
+        Libera os recursos do histórico (grava as entradas pendentes de um
+        histórico persistente e fecha o banco) e encerra a gravação.
+        """
+        self.stop_recording()
+        close = getattr(self.history, "close", None)
+        if close is not None:
+            close()
+    
     def clear_all(self) -> str:
         """
         Limpa todos os valores e reseta a calculadora.
@@ -455,4 +847,154 @@ class CalculatorController:
         Returns:
             str: Descrição da última operação
         """
-        return self.state.last_operation
\ No newline at end of file
+        return self.state.last_operation
+    
+    def get_state_snapshot(self) -> StateSnapshot:
+        """
+        Retorna uma cópia imutável do estado atual.
+        
+        Returns:
+            StateSnapshot: Valores atuais do estado
+        """
+        state = self.state
+        return StateSnapshot(
+            state.current_value, state.previous_value, state.operator,
+            state.waiting_for_operand, state.last_operation, state.display_value
+        )
+
+
+class ThreadSafeCalculatorController(CalculatorController):
+    """
+    Controlador que pode ser usado por várias threads ao mesmo tempo.
+    
+    Cada operação que altera o estado ou o histórico é aplicada por inteiro
+    sob uma trava de escrita, de modo que as sequências de teclas e as
+    inserções no histórico de threads diferentes não se misturam. Ao fim de
+    cada operação, uma cópia imutável do estado (StateSnapshot) é publicada
+    com uma única atribuição; get_current_display, get_last_operation e
+    get_state_snapshot leem essa cópia sem travar, e nunca veem um estado
+    pela metade.
+    
+    Os ouvintes do histórico são chamados com a trava obtida (podem chamar o
+    controlador na mesma thread). Um motor ou compilador compartilhado com
+    controladores usados em outras threads não é protegido por esta trava.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Inicializa o controlador (mesmos argumentos de CalculatorController).
+        """
+        self._lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+        self._publish()
+    
+    def _publish(self):
+        self._snapshot = CalculatorController.get_state_snapshot(self)
+    
+    @property
+    def max_history_size(self) -> Optional[int]:
+        """Capacidade do histórico (alterável em tempo de execução; None = sem limite)."""
+        return self.history.capacity
+    
+    @max_history_size.setter
+    def max_history_size(self, capacity: int):
+        with self._lock:
+            CalculatorController.max_history_size.fset(self, capacity)
+    
+    def add_history_listener(self, listener: HistoryListener):
+        with self._lock:
+            super().add_history_listener(listener)
+    
+    def remove_history_listener(self, listener: HistoryListener):
+        with self._lock:
+            super().remove_history_listener(listener)
+    
+    def load_history(self, entries: Iterable[Dict[str, Any]]) -> int:
+        with self._lock:
+            return super().load_history(entries)
+    
+    def process_input(self, input_data: str) -> str:
+        with self._lock:
+            display = super().process_input(input_data)
+            self._publish()
+            return display
+    
+    def execute_operation(self, operation_type: str, **kwargs) -> str:
+        with self._lock:
+            result = super().execute_operation(operation_type, **kwargs)
+            self._publish()
+            return result
+    
+    def evaluate_expression(self, expression: str, **variables) -> str:
+        with self._lock:
+            result = super().evaluate_expression(expression, **variables)
+            self._publish()
+            return result
+    
+    def get_history(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return super().get_history(start, stop)
+    
+    def get_formatted_history(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        with self._lock:
+            return super().get_formatted_history(start, stop)
+    
+    def query_history(self, *args, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta o histórico como em CalculatorController.query_history.
+        
+        As entradas encontradas são copiadas com a trava obtida, então o
+        iterador pode ser consumido enquanto outras threads inserem entradas.
+        """
+        with self._lock:
+            return iter(list(super().query_history(*args, **kwargs)))
+    
+    def clear_history(self):
+        with self._lock:
+            super().clear_history()
+    
+    def get_history_summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return super().get_history_summary()
+    
+    def reset(self):
+        with self._lock:
+            super().reset()
+            self._publish()
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        with self._lock:
+            return super().memory_usage()
+    
+    def start_recording(self, path: str):
+        with self._lock:
+            return super().start_recording(path)
+    
+    def stop_recording(self) -> int:
+        with self._lock:
+            return super().stop_recording()
+    
+    def close(self):
+        with self._lock:
+            super().close()
+    
+    def clear_all(self) -> str:
+        with self._lock:
+            display = super().clear_all()
+            self._publish()
+            return display
+    
+    def get_state_snapshot(self) -> StateSnapshot:
+        """
+        Retorna a cópia imutável do estado publicada pela última operação.
+        
+        Returns:
+            StateSnapshot: Estado consistente, lido sem travar
+        """
+        return self._snapshot
+    
+    def get_current_display(self) -> str:
+        return self._snapshot.display_value
+    
+    def get_last_operation(self) -> str:
+        return self._snapshot.last_operation
\ No newline at end of file
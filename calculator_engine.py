@@ -7,7 +7,123 @@ cálculos geométricos e trigonométricos.
 """
 
 import math
-from typing import Dict, Union, Any
+from typing import Any, Callable, Dict, Optional, Union
+
+import calculator_batch
+from calculator_cache import ResultCache
+from calculator_coercion import InvalidNumber, parse_number
+from calculator_instrumentation import EngineInstrumentation
+from calculator_registry import BINARY_OPERATORS, TRIGONOMETRIC_FUNCTIONS, format_choices
+from calculator_result import CalculationResult
+
+
+# Respostas de erro fixas, pré-construídas e compartilhadas entre chamadas
+_BASIC_INVALID_FIRST = CalculationResult(
+    False,
+    error_message="Primeiro número inválido",
+    operation_type="basic_operation"
+)
+_BASIC_INVALID_SECOND = CalculationResult(
+    False,
+    error_message="Segundo número inválido",
+    operation_type="basic_operation"
+)
+_BASIC_INVALID_OPERATOR = CalculationResult(
+    False,
+    error_message="Operador inválido. Use +, -, * ou /",
+    operation_type="basic_operation"
+)
+_BASIC_DIVISION_BY_ZERO = CalculationResult(
+    False,
+    error_message="Erro: Divisão por zero não é permitida",
+    operation_type="basic_operation"
+)
+_PERCENTAGE_INVALID = CalculationResult(
+    False,
+    error_message="Valores inválidos para cálculo de porcentagem",
+    operation_type="percentage"
+)
+_SQRT_INVALID = CalculationResult(
+    False,
+    error_message="Valor inválido para raiz quadrada",
+    operation_type="square_root"
+)
+_SQRT_NEGATIVE = CalculationResult(
+    False,
+    error_message="Erro: Raiz quadrada de número negativo não é permitida",
+    operation_type="square_root"
+)
+_TRIG_INVALID = CalculationResult(
+    False,
+    error_message="Valor inválido para função trigonométrica",
+    operation_type="trigonometric"
+)
+_TRIG_INVALID_FUNCTION = CalculationResult(
+    False,
+    error_message="Função trigonométrica inválida. Use sin, cos ou tan",
+    operation_type="trigonometric"
+)
+_TRIG_INVALID_UNIT = CalculationResult(
+    False,
+    error_message="Unidade inválida. Use 'radians' ou 'degrees'",
+    operation_type="trigonometric"
+)
+_DEG_TO_RAD_INVALID = CalculationResult(
+    False,
+    error_message="Valor inválido para conversão",
+    operation_type="degrees_to_radians"
+)
+_RAD_TO_DEG_INVALID = CalculationResult(
+    False,
+    error_message="Valor inválido para conversão",
+    operation_type="radians_to_degrees"
+)
+_CIRCLE_INVALID = CalculationResult(
+    False,
+    error_message="Valor inválido para o raio",
+    operation_type="circle_area"
+)
+_CIRCLE_NEGATIVE = CalculationResult(
+    False,
+    error_message="Erro: O raio deve ser um valor positivo",
+    operation_type="circle_area"
+)
+_SPHERE_INVALID = CalculationResult(
+    False,
+    error_message="Valor inválido para o raio",
+    operation_type="sphere_volume"
+)
+_SPHERE_NEGATIVE = CalculationResult(
+    False,
+    error_message="Erro: O raio deve ser um valor positivo",
+    operation_type="sphere_volume"
+)
+_EVEN_ODD_INVALID = CalculationResult(
+    False,
+    error_message="Valor inválido para verificação par/ímpar",
+    operation_type="is_even_odd"
+)
+_EVEN_ODD_NOT_INTEGER = CalculationResult(
+    False,
+    error_message="Erro: Apenas números inteiros são aceitos para verificação par/ímpar",
+    operation_type="is_even_odd"
+)
+
+
+# Operações públicas instrumentadas por enable_instrumentation
+INSTRUMENTED_OPERATIONS = (
+    "basic_operation",
+    "basic_operation_batch",
+    "percentage",
+    "square_root",
+    "trigonometric",
+    "trigonometric_batch",
+    "degrees_to_radians",
+    "radians_to_degrees",
+    "circle_area",
+    "sphere_volume",
+    "is_even_odd",
+)
 
 
 class CalculatorEngine:
@@ -18,9 +134,124 @@ class CalculatorEngine:
     avançadas, cálculos geométricos e validação de entrada.
     """
     
-    def __init__(self):
-        """Inicializa o motor de cálculo."""
-        pass
+    def __init__(self, cache_size: int = 0, cache_policy: str = "lru"):
+        """
+        Inicializa o motor de cálculo.
+        
+        Args:
+            cache_size: Capacidade do cache de resultados (0 = desativado)
+            cache_policy: Política de remoção do cache ("lru" ou "lfu")
+        """
+        self._cache: Optional[ResultCache] = None
+        self._instrumentation: Optional[EngineInstrumentation] = None
+        if cache_size:
+            self.enable_cache(cache_size, cache_policy)
+    
+    def enable_cache(self, capacity: int = 1024, policy: str = "lru"):
+        """
+        Ativa a memorização das funções puras do motor.
+        
+        São memorizadas: square_root, trigonometric, degrees_to_radians,
+        radians_to_degrees, circle_area e sphere_volume. A chave usa o valor
+        numérico já convertido, então "16", 16 e 16.0 compartilham a entrada.
+        
+        Args:
+            capacity: Quantidade máxima de respostas memorizadas
+            policy: Política de remoção ("lru" ou "lfu")
+        """
+        self._cache = ResultCache(capacity, policy)
+    
+    def disable_cache(self):
+        """Desativa a memorização e descarta o cache atual."""
+        self._cache = None
+    
+    def clear_cache(self):
+        """Remove todas as respostas memorizadas, mantendo as estatísticas."""
+        if self._cache is not None:
+            self._cache.clear()
+    
+    def resize_cache(self, capacity: int):
+        """
+        Altera a capacidade do cache em tempo de execução.
+        
+        Args:
+            capacity: Nova capacidade máxima
+        """
+        if self._cache is not None:
+            self._cache.resize(capacity)
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Retorna as estatísticas do cache de resultados.
+        
+        Returns:
+            Dict: Estatísticas do cache, ou None se ele estiver desativado
+        """
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+    
+    def enable_instrumentation(self, instrumentation: Optional[EngineInstrumentation] = None
+                               ) -> EngineInstrumentation:
+        """
+        Ativa a instrumentação das operações públicas desta instância.
+        
+        Cada operação de INSTRUMENTED_OPERATIONS passa a registrar chamadas,
+        erros e latências, e a chamar os hooks de rastreamento registrados.
+        
+        Args:
+            instrumentation: Instrumentação a ser usada (uma nova por padrão);
+                pode ser compartilhada entre vários motores
+            
+        Returns:
+            EngineInstrumentation: Instrumentação ativa
+        """
+        self.disable_instrumentation()
+        if instrumentation is None:
+            instrumentation = EngineInstrumentation()
+        for operation_type in INSTRUMENTED_OPERATIONS:
+            method = getattr(self, operation_type)
+            setattr(self, operation_type, instrumentation.wrap(operation_type, method))
+        self._instrumentation = instrumentation
+        return instrumentation
+    
+    def disable_instrumentation(self):
+        """Desativa a instrumentação, restaurando os métodos originais."""
+        for operation_type in INSTRUMENTED_OPERATIONS:
+            self.__dict__.pop(operation_type, None)
+        self._instrumentation = None
+    
+    def get_instrumentation_stats(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Retorna as estatísticas por tipo de operação.
+        
+        Returns:
+            Dict: operation_type -> {calls, errors, error_rate, latency}, ou
+            None se a instrumentação estiver desativada
+        """
+        if self._instrumentation is None:
+            return None
+        return self._instrumentation.stats()
+    
+    def _cached(self, operation_type: str, args: tuple,
+                compute: Callable[..., CalculationResult]) -> CalculationResult:
+        """
+        Busca a resposta no cache ou a calcula e memoriza.
+        
+        Args:
+            operation_type: Tipo da operação (primeiro elemento da chave)
+            args: Argumentos já convertidos da operação
+            compute: Função que calcula a resposta a partir dos argumentos
+            
+        Returns:
+            CalculationResult: Resposta memorizada ou recém-calculada
+        """
+        key = (operation_type,) + args
+        response = self._cache.get(key)
+        if response is None:
+            response = compute(*args)
+            self._cache.put(key, response)
+        return response
     
     def _validate_number(self, value: Any) -> bool:
         """
@@ -32,15 +263,12 @@ class CalculatorEngine:
         Returns:
             bool: True se for um número válido, False caso contrário
         """
-        try:
-            float(value)
-            return True
-        except (ValueError, TypeError):
-            return False
+        return not isinstance(parse_number(value), InvalidNumber)
     
     def _create_response(self, success: bool, result: Union[float, str] = None, 
                         error_message: str = None, formula_used: str = None,
-                        operation_type: str = "") -> Dict[str, Any]:
+                        operation_type: str = "",
+                        formula_args: tuple = None) -> CalculationResult:
         """
         Cria uma resposta padronizada para as operações.
         
@@ -48,22 +276,68 @@ class CalculatorEngine:
             success: Se a operação foi bem-sucedida
             result: Resultado da operação
             error_message: Mensagem de erro, se houver
-            formula_used: Fórmula utilizada no cálculo
+            formula_used: Fórmula utilizada no cálculo (ou modelo str.format)
             operation_type: Tipo da operação realizada
+            formula_args: Argumentos do modelo, formatados só quando
+                formula_used for lido
             
         Returns:
-            Dict: Resposta padronizada
+            CalculationResult: Resposta padronizada (acessível como dicionário)
+        """
+        return CalculationResult(
+            success, result, error_message, formula_used, formula_args,
+            operation_type
+        )
+
+    def _create_batch_response(self, results: Any, error_mask: Any,
+                               operation_type: str) -> Dict[str, Any]:
+        """
+        Cria uma resposta padronizada para operações em lote.
+
+        Args:
+            results: Vetor de resultados (NaN nas posições com erro)
+            error_mask: Vetor com o código de erro de cada elemento
+            operation_type: Tipo da operação realizada
+
+        Returns:
+            Dict: Resposta padronizada acrescida da máscara de erros
         """
         return {
-            "success": success,
-            "result": result,
+            "success": True,
+            "result": results,
+            "error_message": None,
+            "formula_used": None,
+            "operation_type": operation_type,
+            "error_mask": error_mask,
+            "error_count": calculator_batch.count_errors(error_mask)
+        }
+
+    def _create_batch_error(self, error_message: str,
+                            operation_type: str) -> Dict[str, Any]:
+        """
+        Cria a resposta de uma operação em lote com argumentos inválidos.
+
+        Tem as mesmas chaves da resposta de sucesso, sem máscara de erros.
+
+        Args:
+            error_message: Mensagem de erro
+            operation_type: Tipo da operação
+
+        Returns:
+            Dict: Resposta com success False, error_mask None e error_count 0
+        """
+        return {
+            "success": False,
+            "result": None,
             "error_message": error_message,
-            "formula_used": formula_used,
-            "operation_type": operation_type
+            "formula_used": None,
+            "operation_type": operation_type,
+            "error_mask": None,
+            "error_count": 0
         }
     
     def basic_operation(self, num1: Union[float, str], num2: Union[float, str], 
-                       operator: str) -> Dict[str, Any]:
+                       operator: str) -> CalculationResult:
         """
         Executa operações matemáticas básicas (+, -, *, /).
         
@@ -73,48 +347,26 @@ class CalculatorEngine:
             operator: Operador (+, -, *, /)
             
         Returns:
-            Dict: Resultado da operação ou erro
+            CalculationResult: Resultado da operação ou erro
         """
-        # Validar entradas
-        if not self._validate_number(num1):
-            return self._create_response(
-                False, 
-                error_message="Primeiro número inválido",
-                operation_type="basic_operation"
-            )
+        # Validar entradas (cada valor é convertido uma única vez)
+        n1 = parse_number(num1)
+        if isinstance(n1, InvalidNumber):
+            return _BASIC_INVALID_FIRST
         
-        if not self._validate_number(num2):
-            return self._create_response(
-                False,
-                error_message="Segundo número inválido", 
-                operation_type="basic_operation"
-            )
+        n2 = parse_number(num2)
+        if isinstance(n2, InvalidNumber):
+            return _BASIC_INVALID_SECOND
         
-        if operator not in ['+', '-', '*', '/']:
-            return self._create_response(
-                False,
-                error_message="Operador inválido. Use +, -, * ou /",
-                operation_type="basic_operation"
-            )
+        compute = BINARY_OPERATORS.get(operator)
+        if compute is None:
+            return _BASIC_INVALID_OPERATOR
         
         try:
-            n1 = float(num1)
-            n2 = float(num2)
-            
-            if operator == '+':
-                result = n1 + n2
-            elif operator == '-':
-                result = n1 - n2
-            elif operator == '*':
-                result = n1 * n2
-            elif operator == '/':
-                if n2 == 0:
-                    return self._create_response(
-                        False,
-                        error_message="Erro: Divisão por zero não é permitida",
-                        operation_type="basic_operation"
-                    )
-                result = n1 / n2
+            try:
+                result = compute(n1, n2)
+            except ZeroDivisionError:
+                return _BASIC_DIVISION_BY_ZERO
             
             # Formatar resultado para até 10 casas decimais
             if result == int(result):
@@ -125,7 +377,8 @@ class CalculatorEngine:
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"{n1} {operator} {n2}",
+                formula_used="{} {} {}",
+                formula_args=(n1, operator, n2),
                 operation_type="basic_operation"
             )
             
@@ -135,8 +388,47 @@ class CalculatorEngine:
                 error_message=f"Erro no cálculo: {str(e)}",
                 operation_type="basic_operation"
             )
-    
-    def percentage(self, number: Union[float, str], percent: Union[float, str]) -> Dict[str, Any]:
+
+    def basic_operation_batch(self, num1_values: Any, num2_values: Any,
+                              operator: str) -> Dict[str, Any]:
+        """
+        Executa uma operação básica (+, -, *, /) sobre vetores de operandos.
+
+        Aceita arrays NumPy, objetos com protocolo de buffer ou sequências
+        comuns; um dos lados pode ser um escalar. Erros por elemento não
+        interrompem o lote: são indicados na máscara "error_mask" com os
+        códigos de calculator_batch (BATCH_INVALID_INPUT,
+        BATCH_DIVISION_BY_ZERO, BATCH_CALCULATION_ERROR).
+
+        Args:
+            num1_values: Vetor com os primeiros números
+            num2_values: Vetor com os segundos números
+            operator: Operador (+, -, *, /)
+
+        Returns:
+            Dict: Resposta com o vetor de resultados, máscara e total de erros
+            (com argumentos inválidos, error_mask é None e error_count é 0)
+        """
+        if operator not in BINARY_OPERATORS:
+            return self._create_batch_error(
+                f"Operador inválido. Use {format_choices(BINARY_OPERATORS)}",
+                "basic_operation_batch"
+            )
+
+        try:
+            results, error_mask = calculator_batch.basic_operation(
+                num1_values, num2_values, operator
+            )
+        except ValueError as e:
+            return self._create_batch_error(
+                f"Erro no cálculo em lote: {str(e)}", "basic_operation_batch"
+            )
+
+        return self._create_batch_response(
+            results, error_mask, "basic_operation_batch"
+        )
+
+    def percentage(self, number: Union[float, str], percent: Union[float, str]) -> CalculationResult:
         """
         Calcula a porcentagem de um número.
         
@@ -145,18 +437,14 @@ class CalculatorEngine:
             percent: Porcentagem a ser calculada
             
         Returns:
-            Dict: Resultado do cálculo de porcentagem
+            CalculationResult: Resultado do cálculo de porcentagem
         """
-        if not self._validate_number(number) or not self._validate_number(percent):
-            return self._create_response(
-                False,
-                error_message="Valores inválidos para cálculo de porcentagem",
-                operation_type="percentage"
-            )
+        n = parse_number(number)
+        p = parse_number(percent)
+        if isinstance(n, InvalidNumber) or isinstance(p, InvalidNumber):
+            return _PERCENTAGE_INVALID
         
         try:
-            n = float(number)
-            p = float(percent)
             result = (n * p) / 100
             
             if result == int(result):
@@ -167,7 +455,8 @@ class CalculatorEngine:
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"{p}% de {n}",
+                formula_used="{}% de {}",
+                formula_args=(p, n),
                 operation_type="percentage"
             )
             
@@ -178,7 +467,7 @@ class CalculatorEngine:
                 operation_type="percentage"
             )
     
-    def square_root(self, number: Union[float, str]) -> Dict[str, Any]:
+    def square_root(self, number: Union[float, str]) -> CalculationResult:
         """
         Calcula a raiz quadrada de um número.
         
@@ -186,24 +475,21 @@ class CalculatorEngine:
             number: Número para calcular a raiz quadrada
             
         Returns:
-            Dict: Resultado da raiz quadrada ou erro
+            CalculationResult: Resultado da raiz quadrada ou erro
         """
-        if not self._validate_number(number):
-            return self._create_response(
-                False,
-                error_message="Valor inválido para raiz quadrada",
-                operation_type="square_root"
-            )
+        n = parse_number(number)
+        if isinstance(n, InvalidNumber):
+            return _SQRT_INVALID
         
+        if self._cache is not None:
+            return self._cached("square_root", (n,), self._square_root)
+        return self._square_root(n)
+
+    def _square_root(self, n: float) -> CalculationResult:
+        """Calcula a raiz quadrada de um número já convertido."""
         try:
-            n = float(number)
-            
             if n < 0:
-                return self._create_response(
-                    False,
-                    error_message="Erro: Raiz quadrada de número negativo não é permitida",
-                    operation_type="square_root"
-                )
+                return _SQRT_NEGATIVE
             
             result = math.sqrt(n)
             
@@ -215,7 +501,8 @@ class CalculatorEngine:
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"√{n}",
+                formula_used="√{}",
+                formula_args=(n,),
                 operation_type="square_root"
             )
             
@@ -227,7 +514,7 @@ class CalculatorEngine:
             )
     
     def trigonometric(self, number: Union[float, str], function: str,
-                     unit: str = "degrees") -> Dict[str, Any]:
+                     unit: str = "degrees") -> CalculationResult:
         """
         Calcula funções trigonométricas (seno, cosseno, tangente).
         
@@ -237,42 +524,29 @@ class CalculatorEngine:
             unit: Unidade do ângulo (radians ou degrees)
             
         Returns:
-            Dict: Resultado da função trigonométrica
+            CalculationResult: Resultado da função trigonométrica
         """
-        if not self._validate_number(number):
-            return self._create_response(
-                False,
-                error_message="Valor inválido para função trigonométrica",
-                operation_type="trigonometric"
-            )
+        angle = parse_number(number)
+        if isinstance(angle, InvalidNumber):
+            return _TRIG_INVALID
         
-        if function not in ['sin', 'cos', 'tan']:
-            return self._create_response(
-                False,
-                error_message="Função trigonométrica inválida. Use sin, cos ou tan",
-                operation_type="trigonometric"
-            )
+        if function not in TRIGONOMETRIC_FUNCTIONS:
+            return _TRIG_INVALID_FUNCTION
         
         if unit not in ['radians', 'degrees']:
-            return self._create_response(
-                False,
-                error_message="Unidade inválida. Use 'radians' ou 'degrees'",
-                operation_type="trigonometric"
-            )
+            return _TRIG_INVALID_UNIT
 
+        if self._cache is not None:
+            return self._cached("trigonometric", (angle, function, unit), self._trigonometric)
+        return self._trigonometric(angle, function, unit)
+
+    def _trigonometric(self, angle: float, function: str, unit: str) -> CalculationResult:
+        """Calcula a função trigonométrica de um ângulo já validado."""
         try:
-            n = float(number)
+            # Converter graus para radianos se necessário
+            n = math.radians(angle) if unit == "degrees" else angle
 
-            # Converter graus para radianos se necessário
-            if unit == "degrees":
-                n = math.radians(n)
-
-            if function == 'sin':
-                result = math.sin(n)
-            elif function == 'cos':
-                result = math.cos(n)
-            elif function == 'tan':
-                result = math.tan(n)
+            result = TRIGONOMETRIC_FUNCTIONS[function](n)
 
             # Arredondar para evitar problemas de precisão
             result = round(result, 10)
@@ -281,7 +555,8 @@ class CalculatorEngine:
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"{function}({float(number)}{unit_symbol})",
+                formula_used="{}({}{})",
+                formula_args=(function, angle, unit_symbol),
                 operation_type="trigonometric"
             )
             
@@ -291,8 +566,43 @@ class CalculatorEngine:
                 error_message=f"Erro no cálculo trigonométrico: {str(e)}",
                 operation_type="trigonometric"
             )
+
+    def trigonometric_batch(self, values: Any, function: str,
+                            unit: str = "degrees") -> Dict[str, Any]:
+        """
+        Calcula funções trigonométricas sobre um vetor de ângulos.
+
+        A conversão de graus e o cálculo são feitos em uma única passada sobre
+        o vetor. Entradas inválidas e tangentes próximas de uma assíntota
+        (BATCH_NEAR_POLE) são indicadas na máscara "error_mask".
+
+        Args:
+            values: Vetor de ângulos
+            function: Função trigonométrica (sin, cos, tan)
+            unit: Unidade dos ângulos (radians ou degrees)
+
+        Returns:
+            Dict: Resposta com o vetor de resultados, máscara e total de erros
+            (com argumentos inválidos, error_mask é None e error_count é 0)
+        """
+        if function not in TRIGONOMETRIC_FUNCTIONS:
+            return self._create_batch_error(
+                "Função trigonométrica inválida. "
+                f"Use {format_choices(TRIGONOMETRIC_FUNCTIONS)}",
+                "trigonometric_batch"
+            )
+
+        if unit not in ['radians', 'degrees']:
+            return self._create_batch_error(
+                "Unidade inválida. Use 'radians' ou 'degrees'", "trigonometric_batch"
+            )
+
+        results, error_mask = calculator_batch.trigonometric(values, function, unit)
+        return self._create_batch_response(
+            results, error_mask, "trigonometric_batch"
+        )
     
-    def degrees_to_radians(self, degrees: Union[float, str]) -> Dict[str, Any]:
+    def degrees_to_radians(self, degrees: Union[float, str]) -> CalculationResult:
         """
         Converte graus para radianos.
         
@@ -300,24 +610,27 @@ class CalculatorEngine:
             degrees: Ângulo em graus
             
         Returns:
-            Dict: Ângulo convertido para radianos
+            CalculationResult: Ângulo convertido para radianos
         """
-        if not self._validate_number(degrees):
-            return self._create_response(
-                False,
-                error_message="Valor inválido para conversão",
-                operation_type="degrees_to_radians"
-            )
+        d = parse_number(degrees)
+        if isinstance(d, InvalidNumber):
+            return _DEG_TO_RAD_INVALID
         
+        if self._cache is not None:
+            return self._cached("degrees_to_radians", (d,), self._degrees_to_radians)
+        return self._degrees_to_radians(d)
+
+    def _degrees_to_radians(self, d: float) -> CalculationResult:
+        """Converte para radianos um ângulo já convertido para float."""
         try:
-            d = float(degrees)
             result = math.radians(d)
             result = round(result, 10)
             
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"{d}° → rad",
+                formula_used="{}° → rad",
+                formula_args=(d,),
                 operation_type="degrees_to_radians"
             )
             
@@ -328,7 +641,7 @@ class CalculatorEngine:
                 operation_type="degrees_to_radians"
             )
     
-    def radians_to_degrees(self, radians: Union[float, str]) -> Dict[str, Any]:
+    def radians_to_degrees(self, radians: Union[float, str]) -> CalculationResult:
         """
         Converte radianos para graus.
         
@@ -336,24 +649,27 @@ class CalculatorEngine:
             radians: Ângulo em radianos
             
         Returns:
-            Dict: Ângulo convertido para graus
+            CalculationResult: Ângulo convertido para graus
         """
-        if not self._validate_number(radians):
-            return self._create_response(
-                False,
-                error_message="Valor inválido para conversão",
-                operation_type="radians_to_degrees"
-            )
+        r = parse_number(radians)
+        if isinstance(r, InvalidNumber):
+            return _RAD_TO_DEG_INVALID
         
+        if self._cache is not None:
+            return self._cached("radians_to_degrees", (r,), self._radians_to_degrees)
+        return self._radians_to_degrees(r)
+
+    def _radians_to_degrees(self, r: float) -> CalculationResult:
+        """Converte para graus um ângulo já convertido para float."""
         try:
-            r = float(radians)
             result = math.degrees(r)
             result = round(result, 10)
             
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"{r}rad → °",
+                formula_used="{}rad → °",
+                formula_args=(r,),
                 operation_type="radians_to_degrees"
             )
             
@@ -364,7 +680,7 @@ class CalculatorEngine:
                 operation_type="radians_to_degrees"
             )
     
-    def circle_area(self, radius: Union[float, str]) -> Dict[str, Any]:
+    def circle_area(self, radius: Union[float, str]) -> CalculationResult:
         """
         Calcula a área do círculo usando a fórmula A = πr².
         
@@ -372,24 +688,21 @@ class CalculatorEngine:
             radius: Raio do círculo
             
         Returns:
-            Dict: Resultado do cálculo da área ou erro
+            CalculationResult: Resultado do cálculo da área ou erro
         """
-        if not self._validate_number(radius):
-            return self._create_response(
-                False,
-                error_message="Valor inválido para o raio",
-                operation_type="circle_area"
-            )
+        r = parse_number(radius)
+        if isinstance(r, InvalidNumber):
+            return _CIRCLE_INVALID
         
+        if self._cache is not None:
+            return self._cached("circle_area", (r,), self._circle_area)
+        return self._circle_area(r)
+
+    def _circle_area(self, r: float) -> CalculationResult:
+        """Calcula a área do círculo para um raio já convertido."""
         try:
-            r = float(radius)
-            
             if r < 0:
-                return self._create_response(
-                    False,
-                    error_message="Erro: O raio deve ser um valor positivo",
-                    operation_type="circle_area"
-                )
+                return _CIRCLE_NEGATIVE
             
             result = math.pi * r * r
             result = round(result, 10)
@@ -397,7 +710,8 @@ class CalculatorEngine:
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"A = πr² = π × {r}²",
+                formula_used="A = πr² = π × {}²",
+                formula_args=(r,),
                 operation_type="circle_area"
             )
             
@@ -408,7 +722,7 @@ class CalculatorEngine:
                 operation_type="circle_area"
             )
     
-    def sphere_volume(self, radius: Union[float, str]) -> Dict[str, Any]:
+    def sphere_volume(self, radius: Union[float, str]) -> CalculationResult:
         """
         Calcula o volume da esfera usando a fórmula V = (4/3)πr³.
         
@@ -416,24 +730,21 @@ class CalculatorEngine:
             radius: Raio da esfera
             
         Returns:
-            Dict: Resultado do cálculo do volume ou erro
+            CalculationResult: Resultado do cálculo do volume ou erro
         """
-        if not self._validate_number(radius):
-            return self._create_response(
-                False,
-                error_message="Valor inválido para o raio",
-                operation_type="sphere_volume"
-            )
+        r = parse_number(radius)
+        if isinstance(r, InvalidNumber):
+            return _SPHERE_INVALID
         
+        if self._cache is not None:
+            return self._cached("sphere_volume", (r,), self._sphere_volume)
+        return self._sphere_volume(r)
+
+    def _sphere_volume(self, r: float) -> CalculationResult:
+        """Calcula o volume da esfera para um raio já convertido."""
         try:
-            r = float(radius)
-            
             if r < 0:
-                return self._create_response(
-                    False,
-                    error_message="Erro: O raio deve ser um valor positivo",
-                    operation_type="sphere_volume"
-                )
+                return _SPHERE_NEGATIVE
             
             result = (4/3) * math.pi * r * r * r
             result = round(result, 10)
@@ -441,7 +752,8 @@ class CalculatorEngine:
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"V = (4/3)πr³ = (4/3)π × {r}³",
+                formula_used="V = (4/3)πr³ = (4/3)π × {}³",
+                formula_args=(r,),
                 operation_type="sphere_volume"
             )
             
@@ -452,7 +764,7 @@ class CalculatorEngine:
                 operation_type="sphere_volume"
             )
     
-    def is_even_odd(self, number: Union[int, str]) -> Dict[str, Any]:
+    def is_even_odd(self, number: Union[int, str]) -> CalculationResult:
         """
         Verifica se um número é par ou ímpar.
         
@@ -460,25 +772,16 @@ class CalculatorEngine:
             number: Número inteiro para verificação
             
         Returns:
-            Dict: Resultado da verificação (par ou ímpar) ou erro
+            CalculationResult: Resultado da verificação (par ou ímpar) ou erro
         """
-        if not self._validate_number(number):
-            return self._create_response(
-                False,
-                error_message="Valor inválido para verificação par/ímpar",
-                operation_type="is_even_odd"
-            )
+        n = parse_number(number)
+        if isinstance(n, InvalidNumber):
+            return _EVEN_ODD_INVALID
         
         try:
-            n = float(number)
-            
             # Verificar se é um número inteiro
             if n != int(n):
-                return self._create_response(
-                    False,
-                    error_message="Erro: Apenas números inteiros são aceitos para verificação par/ímpar",
-                    operation_type="is_even_odd"
-                )
+                return _EVEN_ODD_NOT_INTEGER
             
             n = int(n)
             
@@ -491,7 +794,8 @@ class CalculatorEngine:
             return self._create_response(
                 True,
                 result=result,
-                formula_used=f"{n} é {result}",
+                formula_used="{} é {}",
+                formula_args=(n, result),
                 operation_type="is_even_odd"
             )
             
@@ -0,0 +1,625 @@
+"""
+Compilador de Expressões da Calculadora Moderna
+
+Este módulo contém a classe ExpressionCompiler, que transforma expressões
+infixas completas (com precedência, parênteses, menos unário, variáveis e
+chamadas às funções do CalculatorEngine) em uma árvore sintática e, a partir
+dela, em uma função Python pronta para ser avaliada repetidas vezes.
+
+As expressões compiladas ficam em um cache LRU limitado, indexado pelo texto
+normalizado da expressão, de modo que reavaliar a mesma fórmula não passa
+novamente pela análise sintática.
+"""
+
+import math
+import operator as _operator
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from calculator_coercion import InvalidNumber, parse_number
+from calculator_engine import CalculatorEngine
+
+
+class ExpressionError(ValueError):
+    """Erro de análise ou de avaliação de uma expressão."""
+
+
+# Funções disponíveis: nome -> (método do motor, aridade, argumentos extras)
+# O argumento extra "unit" das funções trigonométricas é preenchido na
+# compilação com a unidade configurada no compilador.
+FUNCTIONS: Dict[str, Tuple[str, int, Tuple[str, ...]]] = {
+    "sqrt": ("square_root", 1, ()),
+    "square_root": ("square_root", 1, ()),
+    "sin": ("trigonometric", 1, ("sin",)),
+    "cos": ("trigonometric", 1, ("cos",)),
+    "tan": ("trigonometric", 1, ("tan",)),
+    "circle_area": ("circle_area", 1, ()),
+    "sphere_volume": ("sphere_volume", 1, ()),
+    "percentage": ("percentage", 2, ()),
+    "degrees_to_radians": ("degrees_to_radians", 1, ()),
+    "radians_to_degrees": ("radians_to_degrees", 1, ()),
+}
+
+CONSTANTS: Dict[str, float] = {
+    "pi": math.pi,
+    "π": math.pi,
+}
+
+# Símbolos exibidos na interface aceitos como operadores
+_SYMBOL_ALIASES = {'×': '*', '÷': '/', '−': '-'}
+
+_OPERATORS = '+-*/()'
+
+# Níveis máximos de parênteses, chamadas e sinais aninhados. O analisador e o
+# compilador são recursivos: sem o limite, uma entrada como "((((...1))))"
+# esgotaria a pilha do Python
+MAX_NESTING = 100
+
+
+# ---------------------------------------------------------------------------
+# Árvore sintática
+# ---------------------------------------------------------------------------
+
+class Number:
+    """Literal numérico."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float):
+        self.value = value
+
+
+class Variable:
+    """Referência a uma variável fornecida na avaliação."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class UnaryOp:
+    """Operação unária (+x ou -x)."""
+
+    __slots__ = ("operator", "operand")
+
+    def __init__(self, operator: str, operand: Any):
+        self.operator = operator
+        self.operand = operand
+
+
+class BinaryOp:
+    """Operação binária (+, -, *, /)."""
+
+    __slots__ = ("operator", "left", "right")
+
+    def __init__(self, operator: str, left: Any, right: Any):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+
+class Call:
+    """Chamada a uma função do motor de cálculo."""
+
+    __slots__ = ("name", "args")
+
+    def __init__(self, name: str, args: List[Any]):
+        self.name = name
+        self.args = args
+
+
+# ---------------------------------------------------------------------------
+# Análise léxica e sintática
+# ---------------------------------------------------------------------------
+
+def normalize_expression(text: str) -> str:
+    """
+    Normaliza o texto de uma expressão para uso como chave de cache.
+
+    Args:
+        text: Expressão digitada pelo usuário
+
+    Returns:
+        str: Expressão sem espaços e com os símbolos da interface convertidos
+    """
+    normalized = "".join(text.split())
+    for symbol, replacement in _SYMBOL_ALIASES.items():
+        normalized = normalized.replace(symbol, replacement)
+    return normalized
+
+
+def tokenize(text: str) -> List[Tuple[str, Any]]:
+    """
+    Divide uma expressão normalizada em tokens.
+
+    Args:
+        text: Expressão normalizada
+
+    Returns:
+        List: Tokens no formato (tipo, valor), tipo em number/name/op/comma
+
+    Raises:
+        ExpressionError: Se houver caracteres inválidos
+    """
+    tokens = []
+    position = 0
+    length = len(text)
+
+    while position < length:
+        char = text[position]
+
+        if char.isdigit() or char == '.':
+            start = position
+            while position < length and (text[position].isdigit() or text[position] == '.'):
+                position += 1
+            # Notação científica (1e-3)
+            if position < length and text[position] in 'eE':
+                exponent = position + 1
+                if exponent < length and text[exponent] in '+-':
+                    exponent += 1
+                if exponent < length and text[exponent].isdigit():
+                    position = exponent
+                    while position < length and text[position].isdigit():
+                        position += 1
+            literal = text[start:position]
+            try:
+                tokens.append(("number", float(literal)))
+            except ValueError:
+                raise ExpressionError(f"Número inválido: {literal}")
+            continue
+
+        if char.isalpha() or char == '_':
+            start = position
+            while position < length and (text[position].isalnum() or text[position] == '_'):
+                position += 1
+            tokens.append(("name", text[start:position]))
+            continue
+
+        if char in _OPERATORS:
+            tokens.append(("op", char))
+        elif char == ',':
+            tokens.append(("comma", char))
+        else:
+            raise ExpressionError(f"Caractere inválido na expressão: '{char}'")
+        position += 1
+
+    return tokens
+
+
+class _Parser:
+    """Analisador descendente recursivo para expressões infixas."""
+
+    def __init__(self, tokens: List[Tuple[str, Any]]):
+        self.tokens = tokens
+        self.position = 0
+        self.nesting = 0
+
+    def _enter(self):
+        self.nesting += 1
+        if self.nesting > MAX_NESTING:
+            raise ExpressionError(
+                f"Expressão aninhada demais (limite de {MAX_NESTING} níveis)"
+            )
+
+    def _peek(self) -> Optional[Tuple[str, Any]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _advance(self) -> Tuple[str, Any]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _expect(self, kind: str, value: Any = None):
+        token = self._peek()
+        if token is None or token[0] != kind or (value is not None and token[1] != value):
+            expected = value if value is not None else kind
+            raise ExpressionError(f"Esperado '{expected}' na expressão")
+        self.position += 1
+
+    def parse(self) -> Any:
+        if not self.tokens:
+            raise ExpressionError("Expressão vazia")
+        node = self._expression()
+        if self._peek() is not None:
+            raise ExpressionError(f"Token inesperado: '{self._peek()[1]}'")
+        return node
+
+    def _expression(self) -> Any:
+        node = self._term()
+        token = self._peek()
+        while token is not None and token[0] == "op" and token[1] in '+-':
+            self._advance()
+            node = BinaryOp(token[1], node, self._term())
+            token = self._peek()
+        return node
+
+    def _term(self) -> Any:
+        node = self._unary()
+        token = self._peek()
+        while token is not None and token[0] == "op" and token[1] in '*/':
+            self._advance()
+            node = BinaryOp(token[1], node, self._unary())
+            token = self._peek()
+        return node
+
+    def _unary(self) -> Any:
+        token = self._peek()
+        if token is not None and token[0] == "op" and token[1] in '+-':
+            self._advance()
+            self._enter()
+            operand = self._unary()
+            self.nesting -= 1
+            return UnaryOp(token[1], operand)
+        return self._primary()
+
+    def _primary(self) -> Any:
+        token = self._peek()
+        if token is None:
+            raise ExpressionError("Fim inesperado da expressão")
+
+        kind, value = self._advance()
+
+        if kind == "number":
+            return Number(value)
+
+        if kind == "name":
+            following = self._peek()
+            if following is not None and following == ("op", "("):
+                self._advance()
+                self._enter()
+                args = []
+                if self._peek() != ("op", ")"):
+                    args.append(self._expression())
+                    while self._peek() is not None and self._peek()[0] == "comma":
+                        self._advance()
+                        args.append(self._expression())
+                self._expect("op", ")")
+                self.nesting -= 1
+                return Call(value, args)
+            if value in CONSTANTS:
+                return Number(CONSTANTS[value])
+            return Variable(value)
+
+        if (kind, value) == ("op", "("):
+            self._enter()
+            node = self._expression()
+            self._expect("op", ")")
+            self.nesting -= 1
+            return node
+
+        raise ExpressionError(f"Token inesperado: '{value}'")
+
+
+def parse_expression(text: str) -> Any:
+    """
+    Analisa uma expressão e retorna sua árvore sintática.
+
+    Args:
+        text: Expressão infixa
+
+    Returns:
+        Nó raiz da árvore sintática
+
+    Raises:
+        ExpressionError: Se a expressão for inválida
+    """
+    return _Parser(tokenize(normalize_expression(text))).parse()
+
+
+# ---------------------------------------------------------------------------
+# Compilação
+# ---------------------------------------------------------------------------
+
+class CompiledExpression:
+    """
+    Expressão compilada, pronta para ser avaliada com diferentes variáveis.
+    """
+
+    __slots__ = ("source", "variables", "_function")
+
+    def __init__(self, source: str, variables: frozenset,
+                 function: Callable[[Dict[str, float]], float]):
+        """
+        Inicializa a expressão compilada.
+
+        Args:
+            source: Texto normalizado da expressão
+            variables: Nomes das variáveis usadas pela expressão
+            function: Função gerada pelo compilador
+        """
+        self.source = source
+        self.variables = variables
+        self._function = function
+
+    def __call__(self, **variables: Any) -> float:
+        """
+        Avalia a expressão.
+
+        Args:
+            **variables: Valores das variáveis da expressão
+
+        Returns:
+            float: Resultado arredondado para 10 casas decimais
+
+        Raises:
+            ExpressionError: Em caso de erro de cálculo ou variável ausente
+        """
+        try:
+            result = self._function(variables)
+        except OverflowError as e:
+            raise ExpressionError(f"Erro no cálculo: {str(e)}")
+        except RecursionError:
+            raise ExpressionError("Erro no cálculo: expressão longa demais")
+
+        if not math.isfinite(result):
+            raise ExpressionError("Erro no cálculo: resultado não finito")
+        if result == int(result):
+            return int(result)
+        return round(result, 10)
+
+
+class ExpressionCompiler:
+    """
+    Compilador de expressões infixas com cache LRU de expressões compiladas.
+    """
+
+    def __init__(self, engine: Optional[CalculatorEngine] = None,
+                 cache_size: int = 128, unit: str = "degrees"):
+        """
+        Inicializa o compilador.
+
+        Args:
+            engine: Motor usado nas chamadas de funções (um novo por padrão)
+            cache_size: Quantidade máxima de expressões compiladas em cache
+            unit: Unidade dos ângulos nas funções trigonométricas
+        """
+        if unit not in ['radians', 'degrees']:
+            raise ValueError("Unidade inválida. Use 'radians' ou 'degrees'")
+        self.engine = engine if engine is not None else CalculatorEngine()
+        self.unit = unit
+        self.cache_size = max(0, cache_size)
+        self._cache: "OrderedDict[str, CompiledExpression]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def compile(self, text: str) -> CompiledExpression:
+        """
+        Compila uma expressão, reutilizando o cache quando possível.
+
+        Args:
+            text: Expressão infixa
+
+        Returns:
+            CompiledExpression: Expressão pronta para avaliação
+
+        Raises:
+            ExpressionError: Se a expressão for inválida
+        """
+        key = normalize_expression(text)
+        compiled = self._cache.get(key)
+        if compiled is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return compiled
+
+        self._misses += 1
+        tree = _Parser(tokenize(key)).parse()
+        variables = set()
+        try:
+            function, _ = self._compile_node(tree, variables)
+        except RecursionError:
+            # O aninhamento é limitado pelo analisador; isto só ocorre se a
+            # pilha de quem chama já estiver quase esgotada
+            raise ExpressionError("Expressão longa demais")
+        compiled = CompiledExpression(key, frozenset(variables), function)
+
+        if self.cache_size:
+            self._cache[key] = compiled
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return compiled
+
+    def evaluate(self, text: str, **variables: Any) -> float:
+        """
+        Compila (ou busca no cache) e avalia uma expressão.
+
+        Args:
+            text: Expressão infixa
+            **variables: Valores das variáveis da expressão
+
+        Returns:
+            float: Resultado da expressão
+
+        Raises:
+            ExpressionError: Se a expressão for inválida ou o cálculo falhar
+        """
+        return self.compile(text)(**variables)
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Retorna as estatísticas do cache de expressões compiladas.
+
+        Returns:
+            Dict: Acertos, falhas, tamanho atual e capacidade do cache
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._cache),
+            "capacity": self.cache_size
+        }
+
+    def clear_cache(self):
+        """Remove todas as expressões do cache e zera as estatísticas."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _compile_node(self, node: Any, variables: set) -> Tuple[Callable, bool]:
+        """
+        Gera a função de avaliação de um nó da árvore sintática.
+
+        Subárvores sem variáveis são avaliadas uma única vez, na compilação.
+
+        Returns:
+            Tuple: (função de avaliação, se o nó é constante); a constância é
+            calculada de baixo para cima, uma vez por nó
+        """
+        if isinstance(node, Number):
+            value = node.value
+            return (lambda env: value), True
+
+        if isinstance(node, Variable):
+            name = node.name
+            variables.add(name)
+
+            def load(env, name=name):
+                try:
+                    value = parse_number(env[name])
+                except KeyError:
+                    raise ExpressionError(f"Variável não definida: {name}")
+                if isinstance(value, InvalidNumber):
+                    raise ExpressionError(f"Valor inválido para a variável {name}")
+                return value
+            return load, False
+
+        if isinstance(node, UnaryOp):
+            operand, constant = self._compile_node(node.operand, variables)
+            if node.operator == '-':
+                function = lambda env: -operand(env)
+            else:
+                function = operand
+            return self._fold(function, constant), constant
+
+        if isinstance(node, BinaryOp):
+            return self._compile_chain(node, variables)
+
+        if isinstance(node, Call):
+            function, constant = self._compile_call(node, variables)
+            return self._fold(function, constant), constant
+
+        raise ExpressionError("Nó de expressão desconhecido")
+
+    def _compile_chain(self, node: BinaryOp, variables: set) -> Tuple[Callable, bool]:
+        """
+        Gera a função de uma cadeia de operações de mesma precedência
+        (a + b - c ou a * b / c).
+
+        A árvore de uma cadeia cresce para a esquerda a cada operador; ela é
+        percorrida e avaliada em laço, sem recursão proporcional ao número de
+        termos. O trecho inicial constante da cadeia é avaliado na compilação.
+        """
+        group = '+-' if node.operator in '+-' else '*/'
+        links = []
+        while isinstance(node, BinaryOp) and node.operator in group:
+            links.append((node.operator, node.right))
+            node = node.left
+        links.reverse()
+
+        first, constant = self._compile_node(node, variables)
+        operations = []
+        prefix = 0
+        for operator, operand in links:
+            function, operand_constant = self._compile_node(operand, variables)
+            operations.append((operator, function))
+            if constant and operand_constant and prefix == len(operations) - 1:
+                prefix += 1
+
+        if prefix:
+            first = self._fold(self._compile_operations(first, operations[:prefix]), True)
+            operations = operations[prefix:]
+            if not operations:
+                return first, True
+        return self._compile_operations(first, operations), False
+
+    def _compile_operations(self, first: Callable,
+                            operations: List[Tuple[str, Callable]]) -> Callable:
+        """Gera a função que aplica as operações, em ordem, ao primeiro termo."""
+        if len(operations) == 1:
+            operator, right = operations[0]
+            return self._compile_binary(operator, first, right)
+
+        steps = [(_CHAIN_OPERATORS[operator], operand) for operator, operand in operations]
+
+        def chain(env):
+            value = first(env)
+            for apply, operand in steps:
+                value = apply(value, operand(env))
+            return value
+        return chain
+
+    def _compile_binary(self, operator: str, left: Callable, right: Callable) -> Callable:
+        """Gera a função de uma operação binária."""
+        if operator == '+':
+            return lambda env: left(env) + right(env)
+        if operator == '-':
+            return lambda env: left(env) - right(env)
+        if operator == '*':
+            return lambda env: left(env) * right(env)
+
+        def divide(env):
+            divisor = right(env)
+            if divisor == 0:
+                raise ExpressionError("Erro: Divisão por zero não é permitida")
+            return left(env) / divisor
+        return divide
+
+    def _compile_call(self, node: Call, variables: set) -> Tuple[Callable, bool]:
+        """Gera a função de uma chamada ao motor de cálculo e sua constância."""
+        if node.name not in FUNCTIONS:
+            raise ExpressionError(f"Função desconhecida: {node.name}")
+
+        method_name, arity, extra = FUNCTIONS[node.name]
+        if len(node.args) != arity:
+            raise ExpressionError(
+                f"A função {node.name} espera {arity} argumento(s)"
+            )
+        if method_name == "trigonometric":
+            extra = extra + (self.unit,)
+
+        method = getattr(self.engine, method_name)
+        compiled = [self._compile_node(arg, variables) for arg in node.args]
+        args = [function for function, _ in compiled]
+
+        def call(env):
+            response = method(*[arg(env) for arg in args], *extra)
+            if not response["success"]:
+                raise ExpressionError(response["error_message"])
+            return response["result"]
+        return call, all(constant for _, constant in compiled)
+
+    def _fold(self, function: Callable, constant: bool) -> Callable:
+        """
+        Substitui a função por uma constante quando o nó não usa variáveis.
+
+        Chamadas ao motor com argumentos constantes são feitas aqui, uma
+        única vez: contam no cache e na instrumentação do motor durante a
+        compilação, e não a cada avaliação. Erros de cálculo em
+        subexpressões constantes são adiados para a avaliação.
+        """
+        if not constant:
+            return function
+        try:
+            value = function({})
+        except (ExpressionError, OverflowError):
+            return function
+        return lambda env: value
+
+
+def _divide(left: float, right: float) -> float:
+    """Divisão que rejeita divisor zero, usada nas cadeias de operações."""
+    if right == 0:
+        raise ExpressionError("Erro: Divisão por zero não é permitida")
+    return left / right
+
+
+# Operações das cadeias avaliadas em laço: operador -> função (a, b)
+_CHAIN_OPERATORS: Dict[str, Callable[[float, float], float]] = {
+    '+': _operator.add,
+    '-': _operator.sub,
+    '*': _operator.mul,
+    '/': _divide,
+}
@@ -1,12 +1,26 @@
 import tkinter as tk
 from tkinter import ttk
-from calculator_controller import CalculatorController
+from calculator_controller import CalculatorController, HISTORY_CLEARED, HISTORY_EVICTED
 
 
 class CalculatorGUI:
     def __init__(self):
         self.controller = CalculatorController()
         self.root = tk.Tk()
+        # Alterações da tela acumuladas até o próximo desenho (after_idle):
+        # rajadas de teclas chegam ao controlador na hora, mas display,
+        # status e histórico são redesenhados uma única vez por quadro
+        self._render_scheduled = False
+        self._pending_display = None
+        self._pending_status = None
+        self._status_timer = None
+        self._flash_timer = None
+        self._display_bg = None
+        self._history_changed = False
+        self._history_cleared = False
+        self._history_evicted = 0
+        self._history_appended = 0
+        self._history_lines = []
         self.setup_window()
         self.create_main_layout()
         self.create_display()
@@ -399,18 +413,14 @@ class CalculatorGUI:
         """Processar clique em número ou decimal"""
         # Processar entrada através do controlador para manter estado consistente
         result = self.controller.process_input(number)
-        # Temporariamente habilitar para atualizar, depois desabilitar
-        self.display.config(state="normal")
-        self.display_var.set(str(result))
-        self.display.config(state="readonly")
+        # O display é redesenhado uma vez por quadro, mesmo em rajadas de teclas
+        self.update_display(result)
             
     def operator_click(self, operator):
         """Processar clique em operador"""
         # Processar operador através do controlador
         result = self.controller.process_input(operator)
-        self.display.config(state="normal")
-        self.display_var.set(str(result))
-        self.display.config(state="readonly")
+        self.update_display(result)
         
         # Mostrar indicador visual de que operador foi selecionado
         operator_names = {'+': 'adição', '-': 'subtração', '*': 'multiplicação', '/': 'divisão'}
@@ -427,30 +437,23 @@ class CalculatorGUI:
         else:
             self._show_success_feedback("cálculo")
         
-        self.display.config(state="normal")
-        self.display_var.set(str(result))
-        self.display.config(state="readonly")
-        # Atualizar histórico após operação
-        self.update_history_display()
+        self.update_display(result)
         
     def clear_all(self):
         """Limpar display e resetar calculadora"""
-        self.controller.clear_all()
-        self.display.config(state="normal")
-        self.display_var.set("0")
-        self.display.config(state="readonly")
+        # Pela tecla "C", para que a limpeza entre nas gravações de sessão
+        self.controller.process_input('C')
+        self.update_display("0")
         self._clear_status_message()
         
     def backspace(self):
         """Remover último caractere do display"""
         result = self.controller.process_input('←')
-        self.display.config(state="normal")
-        self.display_var.set(str(result))
-        self.display.config(state="readonly")
+        self.update_display(result)
     
     def square_root_click(self):
         """Processar clique no botão de raiz quadrada"""
-        current_value = self.display_var.get()
+        current_value = self.controller.get_current_display()
         try:
             result = self.controller.execute_operation("square_root", number=float(current_value))
             if result.startswith("Erro"):
@@ -459,14 +462,13 @@ class CalculatorGUI:
             else:
                 self.update_display(result)
                 self._show_success_feedback("raiz quadrada")
-            self.update_history_display()
         except ValueError:
             self._show_error_feedback("Valor inválido para raiz quadrada")
             self.update_display("Erro")
     
     def trigonometric_click(self, function):
         """Processar clique nos botões trigonométricos"""
-        current_value = self.display_var.get()
+        current_value = self.controller.get_current_display()
         try:
             result = self.controller.execute_operation(
                 "trigonometric",
@@ -480,14 +482,13 @@ class CalculatorGUI:
             else:
                 self.update_display(result)
                 self._show_success_feedback(f"função {function}")
-            self.update_history_display()
         except ValueError:
             self._show_error_feedback("Valor inválido para função trigonométrica")
             self.update_display("Erro")
     
     def percentage_click(self):
         """Processar clique no botão de porcentagem"""
-        current_value = self.display_var.get()
+        current_value = self.controller.get_current_display()
         try:
             percent_value = float(current_value.replace(',', '.'))
             result = self.controller.execute_operation("percentage", percent=percent_value)
@@ -497,74 +498,59 @@ class CalculatorGUI:
             else:
                 self.update_display(result)
                 self._show_success_feedback("porcentagem")
-            self.update_history_display()
         except ValueError:
             self._show_error_feedback("Valor inválido para porcentagem")
-            self.display_var.set("Erro")
+            self.update_display("Erro")
     
     def circle_area_click(self):
         """Processar clique no botão de área do círculo"""
-        current_value = self.display_var.get()
+        current_value = self.controller.get_current_display()
         try:
             result = self.controller.execute_operation("circle_area", radius=float(current_value))
             if result.startswith("Erro"):
                 self._show_error_feedback(result)
-                self.display_var.set("Erro")
+                self.update_display("Erro")
             else:
-                self.display_var.set(result)
+                self.update_display(result)
                 self._show_success_feedback("área do círculo")
-            self.update_history_display()
         except ValueError:
             self._show_error_feedback("Valor inválido para raio do círculo")
-            self.display_var.set("Erro")
+            self.update_display("Erro")
     
     def sphere_volume_click(self):
         """Processar clique no botão de volume da esfera"""
-        current_value = self.display_var.get()
+        current_value = self.controller.get_current_display()
         try:
             result = self.controller.execute_operation("sphere_volume", radius=float(current_value))
             if result.startswith("Erro"):
                 self._show_error_feedback(result)
-                self.display_var.set("Erro")
+                self.update_display("Erro")
             else:
-                self.display_var.set(result)
+                self.update_display(result)
                 self._show_success_feedback("volume da esfera")
-            self.update_history_display()
         except ValueError:
             self._show_error_feedback("Valor inválido para raio da esfera")
-            self.display_var.set("Erro")
+            self.update_display("Erro")
     
     def even_odd_click(self):
         """Processar clique no botão de verificação par/ímpar"""
-        current_value = self.display_var.get()
+        current_value = self.controller.get_current_display()
         try:
             result = self.controller.execute_operation("is_even_odd", number=int(float(current_value)))
             if result.startswith("Erro"):
                 self._show_error_feedback(result)
-                self.display_var.set("Erro")
+                self.update_display("Erro")
             else:
-                self.display_var.set(result)
+                self.update_display(result)
                 self._show_success_feedback("verificação par/ímpar")
-            self.update_history_display()
         except ValueError:
             self._show_error_feedback("Valor inválido para verificação par/ímpar")
-            self.display_var.set("Erro")
+            self.update_display("Erro")
     
     def toggle_sign(self):
         """Alternar sinal do número atual (positivo/negativo)"""
-        current_value = self.display_var.get()
-        try:
-            if current_value != "0" and current_value != "Erro":
-                if current_value.startswith("-"):
-                    new_value = current_value[1:]
-                else:
-                    new_value = "-" + current_value
-                self.display_var.set(new_value)
-                # Atualizar o controlador com o novo valor
-                self.controller.state.current_value = new_value
-                self.controller.state.display_value = new_value
-        except:
-            pass  # Ignorar erros silenciosamente
+        result = self.controller.process_input('±')
+        self.update_display(result)
 
     def on_key_press(self, event):
         """
@@ -676,9 +662,7 @@ class CalculatorGUI:
         self._show_status_message("Tecla não reconhecida", "warning")
         
         # Piscar o display brevemente para indicar tecla inválida
-        original_bg = self.display.cget('bg')
-        self.display.config(bg='#2d2d1b')  # Cor amarela escura para warning
-        self.root.after(150, lambda: self.display.config(bg=original_bg))
+        self._flash_display('#2d2d1b', 150)
     
     def create_history_panel(self):
         """Criar painel de histórico compacto e moderno"""
@@ -711,10 +695,10 @@ class CalculatorGUI:
         )
         self.history_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Listbox para exibir o histórico
+        # Listbox para exibir o histórico: contém apenas as linhas visíveis,
+        # e a barra de rolagem percorre o histórico inteiro do controlador
         self.history_listbox = tk.Listbox(
             history_list_frame,
-            yscrollcommand=self.history_scrollbar.set,
             font=("Consolas", 9),
             bg="#1a1a1a",
             fg="#cccccc",
@@ -727,8 +711,12 @@ class CalculatorGUI:
         )
         self.history_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Configurar scrollbar
-        self.history_scrollbar.config(command=self.history_listbox.yview)
+        # Configurar scrollbar e roda do mouse sobre a janela virtualizada
+        self.history_scrollbar.config(command=self._scroll_history)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.history_listbox.bind(sequence, self._on_history_wheel)
+        self._history_top = 0
+        self._history_total = 0
         
         # Botão compacto para limpar histórico
         clear_history_btn = tk.Button(
@@ -750,29 +738,140 @@ class CalculatorGUI:
         # Adicionar efeitos modernos ao botão
         self._add_modern_button_effects(clear_history_btn, "#ff4757")
         
+        # Receber do controlador apenas as alterações do histórico
+        self.controller.add_history_listener(self._on_history_event)
+        
         # Inicializar histórico vazio
         self.update_history_display()
     
+    def _history_rows(self):
+        """Quantidade de linhas visíveis no painel de histórico"""
+        return int(self.history_listbox.cget("height"))
+    
     def update_history_display(self):
-        """Atualizar a exibição do histórico com as últimas operações"""
-        # Limpar listbox atual
+        """Redesenhar o histórico, rolando para as últimas operações"""
+        self._history_total = self.controller.get_history_count()
+        self._history_top = max(0, self._history_total - self._history_rows())
+        self._render_history_rows()
+    
+    def _render_history_rows(self):
+        """Exibir apenas as linhas da janela visível do histórico"""
         self.history_listbox.delete(0, tk.END)
+        self._fill_history_rows()
+    
+    def _fill_history_rows(self):
+        """Completar a janela visível com as linhas seguintes do histórico"""
+        # Limitado às entradas já informadas por eventos: durante um descarte,
+        # a entrada nova ainda será anunciada pelo evento seguinte
+        size = self.history_listbox.size()
+        stop = min(self._history_top + self._history_rows(), self._history_total)
+        if self._history_top + size < stop:
+            lines = self.controller.get_formatted_history(self._history_top + size, stop)
+            if lines:
+                self.history_listbox.insert(tk.END, *lines)
+        self._update_history_scrollbar()
+    
+    def _update_history_scrollbar(self):
+        """Posicionar a barra de rolagem conforme a janela no histórico completo"""
+        if not self._history_total:
+            self.history_scrollbar.set(0.0, 1.0)
+            return
+        first = self._history_top / self._history_total
+        last = (self._history_top + self.history_listbox.size()) / self._history_total
+        self.history_scrollbar.set(first, min(last, 1.0))
+    
+    def _on_history_event(self, event):
+        """Acumular a alteração informada pelo controlador até o próximo desenho"""
+        if event["type"] == HISTORY_CLEARED:
+            self._history_cleared = True
+            self._history_evicted = 0
+            self._history_appended = 0
+            self._history_lines = []
+        elif event["type"] == HISTORY_EVICTED:
+            self._history_evicted += event["count"]
+        else:
+            lines = event["lines"]
+            self._history_appended += len(lines)
+            self._history_lines.extend(lines)
+            # Só as últimas linhas podem aparecer na janela visível
+            excess = len(self._history_lines) - self._history_rows()
+            if excess > 0:
+                del self._history_lines[:excess]
+        self._history_changed = True
+        self._schedule_render()
+    
+    def _render_history_changes(self):
+        """Aplicar ao painel, uma vez por quadro, as alterações acumuladas"""
+        rows = self._history_rows()
+        listbox = self.history_listbox
+        lines = self._history_lines
+        evicted = self._history_evicted
+        cleared = self._history_cleared
+        following = self._history_top + listbox.size() >= self._history_total
+        total = self._history_total + self._history_appended - evicted
+        self._history_changed = False
+        self._history_cleared = False
+        self._history_evicted = 0
+        self._history_appended = 0
+        self._history_lines = []
+        
+        if cleared:
+            # Após uma limpeza a janela é redesenhada a partir do controlador
+            self._history_total = self.controller.get_history_count()
+            self._history_top = max(0, self._history_total - rows)
+            self._render_history_rows()
+            return
         
-        # Obter histórico formatado do controlador
-        formatted_history = self.controller.get_formatted_history()
+        # Linhas visíveis descartadas saem do topo; as demais só mudam de índice
+        removed = min(max(evicted - self._history_top, 0), listbox.size())
+        if removed:
+            listbox.delete(0, removed - 1)
+        self._history_top = max(self._history_top - evicted, 0)
+        self._history_total = total
         
-        # Adicionar cada entrada do histórico à listbox
-        for entry in formatted_history:
-            self.history_listbox.insert(tk.END, entry)
+        if not following:
+            # Rolado para cima: apenas completar a janela, se ficou incompleta
+            self._fill_history_rows()
+            return
         
-        # Rolar para o final (última operação)
-        if formatted_history:
-            self.history_listbox.see(tk.END)
+        # Acompanhando o fim: inserir as novas linhas que ainda estão no
+        # histórico e remover as do topo
+        lines = lines[max(len(lines) - total, 0):]
+        if self._history_top + listbox.size() != total - len(lines):
+            # Mais linhas novas do que cabem na janela: exibir só as novas
+            listbox.delete(0, tk.END)
+            self._history_top = total - len(lines)
+        if lines:
+            listbox.insert(tk.END, *lines)
+        excess = listbox.size() - rows
+        if excess > 0:
+            listbox.delete(0, excess - 1)
+            self._history_top += excess
+        self._update_history_scrollbar()
+    
+    def _scroll_history(self, *args):
+        """Rolar a janela visível (comando da barra de rolagem)"""
+        # Aplicar antes as alterações ainda não desenhadas do histórico
+        if self._history_changed:
+            self._render_history_changes()
+        rows = self._history_rows()
+        if args[0] == "moveto":
+            top = int(float(args[1]) * self._history_total)
+        else:
+            step = rows if args[2] == "pages" else 1
+            top = self._history_top + int(args[1]) * step
+        self._history_top = max(0, min(top, self._history_total - rows))
+        self._render_history_rows()
+    
+    def _on_history_wheel(self, event):
+        """Rolar o histórico com a roda do mouse"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self._scroll_history("scroll", direction, "units")
+        return "break"
     
     def clear_history(self):
         """Limpar todo o histórico de operações"""
         self.controller.clear_history()
-        self.update_history_display()
         self._show_status_message("Histórico limpo", "success")
     
     def _show_status_message(self, message, message_type="info"):
@@ -790,18 +889,39 @@ class CalculatorGUI:
             "error": "#e17055"
         }
         
-        self.status_label.config(
-            text=message,
-            fg=colors.get(message_type, "#888888")
-        )
-        
-        # Limpar mensagem após 3 segundos
-        self.root.after(3000, self._clear_status_message)
+        # Exibida no próximo desenho; mensagens seguidas no mesmo quadro
+        # substituem as anteriores
+        self._pending_status = (message, colors.get(message_type, "#888888"))
+        self._schedule_render()
     
     def _clear_status_message(self):
         """Limpar mensagem de status"""
+        self._pending_status = None
+        if self._status_timer is not None:
+            self.root.after_cancel(self._status_timer)
+            self._status_timer = None
         self.status_label.config(text="", fg="#888888")
     
+    def _flash_display(self, color, duration):
+        """
+        Piscar o fundo do display, cancelando a piscada anterior.
+        
+        Args:
+            color: Cor temporária do fundo
+            duration: Duração da piscada em milissegundos
+        """
+        if self._flash_timer is not None:
+            self.root.after_cancel(self._flash_timer)
+        else:
+            self._display_bg = self.display.cget('bg')
+        self.display.config(bg=color)
+        self._flash_timer = self.root.after(duration, self._end_flash)
+    
+    def _end_flash(self):
+        """Restaurar o fundo do display após a piscada"""
+        self._flash_timer = None
+        self.display.config(bg=self._display_bg)
+    
     def _show_error_feedback(self, error_message):
         """
         Mostrar feedback visual para erros.
@@ -813,9 +933,7 @@ class CalculatorGUI:
         self._show_status_message(f"Erro: {error_message}", "error")
         
         # Piscar o display em vermelho escuro
-        original_bg = self.display.cget('bg')
-        self.display.config(bg='#2d1b1b')
-        self.root.after(200, lambda: self.display.config(bg=original_bg))
+        self._flash_display('#2d1b1b', 200)
     
     def _show_success_feedback(self, operation_type=""):
         """
@@ -828,20 +946,45 @@ class CalculatorGUI:
             self._show_status_message(f"Operação {operation_type} realizada", "success")
         
         # Piscar o display em verde escuro
-        original_bg = self.display.cget('bg')
-        self.display.config(bg='#1b2d1b')
-        self.root.after(200, lambda: self.display.config(bg=original_bg))
+        self._flash_display('#1b2d1b', 200)
 
     def update_display(self, value):
-        """Atualizar o display com novo valor"""
-        self.display.config(state="normal")
-        self.display_var.set(str(value))
-        self.display.config(
-            state="readonly",
-            bg="#000000",  # Garantir fundo preto
-            fg="#00ff00",  # Garantir texto verde
-            readonlybackground="#000000"
-        )
+        """Atualizar o display com novo valor (no próximo desenho)"""
+        self._pending_display = str(value)
+        self._schedule_render()
+    
+    def _schedule_render(self):
+        """Agendar um único desenho para quando o Tk ficar ocioso"""
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            self.root.after_idle(self._render)
+    
+    def _render(self):
+        """Aplicar à tela as alterações acumuladas desde o último desenho"""
+        self._render_scheduled = False
+        
+        if self._pending_display is not None:
+            # O StringVar atualiza o Entry mesmo em modo somente leitura
+            self.display_var.set(self._pending_display)
+            self._pending_display = None
+            # Garantir as cores do display em modo somente leitura
+            self.display.config(
+                state="readonly",
+                fg="#00ff00",
+                readonlybackground="#000000"
+            )
+        
+        if self._pending_status is not None:
+            message, color = self._pending_status
+            self._pending_status = None
+            self.status_label.config(text=message, fg=color)
+            # Limpar mensagem após 3 segundos, substituindo o prazo anterior
+            if self._status_timer is not None:
+                self.root.after_cancel(self._status_timer)
+            self._status_timer = self.root.after(3000, self._clear_status_message)
+        
+        if self._history_changed:
+            self._render_history_changes()
         
     def show_welcome_screen(self):
         """Mostrar tela de boas-vindas com todas as funcionalidades"""
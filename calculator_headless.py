@@ -0,0 +1,146 @@
+"""
+Ponto de Entrada sem Interface Gráfica da Calculadora Moderna
+
+Este módulo cria o motor e o controlador da calculadora sem importar o
+tkinter (nem o NumPy, carregado apenas pelos núcleos em lote), para uso em
+linha de comando, scripts e serviços. O modo --headless do main.py lê uma
+operação por linha da entrada padrão e escreve o resultado na saída padrão.
+
+Formato das linhas:
+
+    2 + 3 * sqrt(16)              expressão (CalculatorController.evaluate_expression)
+    square_root number=16         operação registrada (execute_operation)
+    trigonometric number=30 function=cos
+
+O tempo de inicialização a frio (importar este módulo e criar um controlador
+em um interpretador novo) é medido por measure_cold_start e deve ficar abaixo
+de STARTUP_BUDGET_SECONDS.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Any, Dict, Optional, TextIO
+
+from calculator_controller import CalculatorController
+from calculator_engine import CalculatorEngine
+
+
+# Orçamento de inicialização a frio (importações + criação do controlador)
+STARTUP_BUDGET_SECONDS = 0.2
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_COLD_START_SCRIPT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import calculator_headless\n"
+    "calculator_headless.create_controller().process_input('1')\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(elapsed, 'tkinter' in sys.modules, 'numpy' in sys.modules)\n"
+)
+
+
+def create_engine(**kwargs) -> CalculatorEngine:
+    """
+    Cria um motor de cálculo sem dependências de interface.
+
+    Args:
+        **kwargs: Argumentos de CalculatorEngine (cache_size, cache_policy)
+
+    Returns:
+        CalculatorEngine: Novo motor de cálculo
+    """
+    return CalculatorEngine(**kwargs)
+
+
+def create_controller(**kwargs) -> CalculatorController:
+    """
+    Cria um controlador da calculadora sem dependências de interface.
+
+    Args:
+        **kwargs: Argumentos de CalculatorController
+
+    Returns:
+        CalculatorController: Novo controlador
+    """
+    return CalculatorController(**kwargs)
+
+
+def execute_line(controller: CalculatorController, line: str) -> str:
+    """
+    Executa uma linha de comando do modo sem interface.
+
+    Args:
+        controller: Controlador da calculadora
+        line: Expressão ou "operação chave=valor ..."
+
+    Returns:
+        str: Resultado formatado ou mensagem de erro
+    """
+    name, _, rest = line.strip().partition(" ")
+    if name in controller.operations:
+        kwargs = {}
+        for item in rest.split():
+            key, separator, value = item.partition("=")
+            if not separator:
+                return f"Erro: argumento inválido '{item}', use chave=valor"
+            kwargs[key] = value
+        return controller.execute_operation(name, **kwargs)
+    return controller.evaluate_expression(line)
+
+
+def run_headless(source: TextIO, target: TextIO,
+                 controller: Optional[CalculatorController] = None) -> int:
+    """
+    Executa as linhas de um arquivo, escrevendo um resultado por linha.
+
+    Args:
+        source: Entrada com uma operação por linha (linhas vazias e
+            iniciadas por "#" são ignoradas)
+        target: Saída dos resultados
+        controller: Controlador a ser usado (um novo por padrão)
+
+    Returns:
+        int: Quantidade de linhas executadas
+    """
+    controller = controller if controller is not None else create_controller()
+    count = 0
+    for line in source:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        target.write(execute_line(controller, line) + "\n")
+        count += 1
+    target.flush()
+    return count
+
+
+def measure_cold_start(python: str = sys.executable) -> Dict[str, Any]:
+    """
+    Mede a inicialização a frio do modo sem interface em um novo interpretador.
+
+    O tempo inclui importar este módulo (motor, controlador e dependências) e
+    criar um controlador; a inicialização do próprio interpretador não entra
+    na medida.
+
+    Args:
+        python: Interpretador usado na medição
+
+    Returns:
+        Dict: seconds, budget_seconds, within_budget, tkinter_loaded e
+        numpy_loaded
+    """
+    completed = subprocess.run(
+        [python, "-c", _COLD_START_SCRIPT], cwd=_ROOT,
+        capture_output=True, text=True, check=True
+    )
+    seconds, tkinter_loaded, numpy_loaded = completed.stdout.split()
+    seconds = float(seconds)
+    return {
+        "seconds": seconds,
+        "budget_seconds": STARTUP_BUDGET_SECONDS,
+        "within_budget": seconds <= STARTUP_BUDGET_SECONDS,
+        "tkinter_loaded": tkinter_loaded == "True",
+        "numpy_loaded": numpy_loaded == "True"
+    }
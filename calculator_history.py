@@ -0,0 +1,847 @@
+"""
+Histórico de Operações da Calculadora Moderna
+
+Este módulo contém os armazenamentos do histórico do CalculatorController.
+Ambos são buffers circulares de capacidade fixa (alterável em tempo de
+execução): inserir e descartar a entrada mais antiga são O(1),
+independentemente da capacidade, e consultas devolvem apenas a janela pedida
+em vez de copiar o histórico inteiro.
+
+- RingHistory: guarda cada entrada como um dicionário (padrão do controlador)
+- ColumnarHistory: guarda as entradas em colunas compactas (horários em um
+  array float64, sucesso em um mapa de bits e textos em UTF-8 numa área
+  contígua), montando os dicionários apenas quando consultados
+
+As entradas retornadas têm sempre o formato
+{"timestamp": datetime, "operation": str, "result": str, "success": bool,
+"operation_type": str}.
+
+Os dois armazenamentos mantêm contagens por tipo de operação (HistoryCounters)
+atualizadas a cada inserção e descarte, de modo que summary() não percorre as
+entradas. ThroughputMeter mede a taxa de operações em uma janela móvel.
+
+query() filtra o histórico por intervalo de horário (busca binária, pois as
+entradas são inseridas em ordem de horário), tipo de operação e sucesso
+(índices secundários em HistoryIndex), retornando um iterador preguiçoso.
+"""
+
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+# Horário aceito nas consultas: datetime ou segundos desde a época
+Instant = Union[datetime, float]
+
+# Posições descartadas no início de uma lista de sequências antes da compactação
+_POSTINGS_COMPACT_MIN = 1024
+
+
+class HistoryCounters:
+    """
+    Contagens de sucessos e falhas por tipo de operação de um histórico.
+    """
+
+    __slots__ = ("_counts", "successful", "failed")
+
+    def __init__(self):
+        """Inicializa as contagens zeradas."""
+        # Tipo de operação -> [sucessos, falhas]
+        self._counts: Dict[str, List[int]] = {}
+        self.successful = 0
+        self.failed = 0
+
+    def add(self, operation_type: str, success: bool):
+        """Conta uma entrada inserida."""
+        counts = self._counts.get(operation_type)
+        if counts is None:
+            counts = self._counts[operation_type] = [0, 0]
+        if success:
+            counts[0] += 1
+            self.successful += 1
+        else:
+            counts[1] += 1
+            self.failed += 1
+
+    def discard(self, operation_type: str, success: bool):
+        """Desconta uma entrada descartada."""
+        counts = self._counts[operation_type]
+        if success:
+            counts[0] -= 1
+            self.successful -= 1
+        else:
+            counts[1] -= 1
+            self.failed -= 1
+        if not counts[0] and not counts[1]:
+            del self._counts[operation_type]
+
+    def clear(self):
+        """Zera as contagens."""
+        self._counts.clear()
+        self.successful = 0
+        self.failed = 0
+
+    def summary(self, last_timestamp: Optional[datetime]) -> Dict[str, Any]:
+        """
+        Monta o resumo no formato de summary() dos armazenamentos.
+
+        Args:
+            last_timestamp: Horário da entrada mais recente (ou None)
+
+        Returns:
+            Dict: total, successful, failed, last_timestamp e operations
+            (contagens {"successful", "failed"} por tipo de operação)
+        """
+        return {
+            "total": self.successful + self.failed,
+            "successful": self.successful,
+            "failed": self.failed,
+            "last_timestamp": last_timestamp,
+            "operations": {
+                operation_type: {"successful": counts[0], "failed": counts[1]}
+                for operation_type, counts in self._counts.items()
+            }
+        }
+
+
+class _Postings:
+    """
+    Números de sequência em ordem crescente, com remoção no início em O(1)
+    amortizado.
+    """
+
+    __slots__ = ("sequences", "head", "generation")
+
+    def __init__(self):
+        self.sequences = array('q')
+        # Posição da primeira sequência válida em sequences
+        self.head = 0
+        # Incrementado a cada compactação, para os iteradores em andamento
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self.sequences) - self.head
+
+    def popleft(self):
+        self.head += 1
+        if self.head >= _POSTINGS_COMPACT_MIN and self.head * 2 >= len(self.sequences):
+            del self.sequences[:self.head]
+            self.head = 0
+            self.generation += 1
+
+    def between(self, first: int, stop: int) -> Iterator[int]:
+        """Itera as sequências em [first, stop), tolerando inserções e descartes."""
+        index = bisect_left(self.sequences, first, self.head)
+        generation = self.generation
+        while True:
+            if generation != self.generation:
+                index = bisect_left(self.sequences, first, self.head)
+                generation = self.generation
+            if index >= len(self.sequences):
+                return
+            sequence = self.sequences[index]
+            if sequence >= stop:
+                return
+            yield sequence
+            first = sequence + 1
+            index += 1
+
+
+class HistoryIndex:
+    """
+    Índices secundários do histórico: números de sequência das entradas por
+    tipo de operação e por sucesso, em ordem de inserção.
+    """
+
+    def __init__(self):
+        """Inicializa os índices vazios."""
+        self._by_type: Dict[str, _Postings] = {}
+        # Índice 0: falhas, 1: sucessos
+        self._by_success = (_Postings(), _Postings())
+
+    def add(self, sequence: int, operation_type: str, success: bool):
+        """Indexa uma entrada inserida (sequências sempre crescentes)."""
+        postings = self._by_type.get(operation_type)
+        if postings is None:
+            postings = self._by_type[operation_type] = _Postings()
+        postings.sequences.append(sequence)
+        self._by_success[bool(success)].sequences.append(sequence)
+
+    def discard(self, operation_type: str, success: bool):
+        """Remove dos índices a entrada mais antiga (a descartada)."""
+        postings = self._by_type[operation_type]
+        postings.popleft()
+        if not postings:
+            del self._by_type[operation_type]
+        self._by_success[bool(success)].popleft()
+
+    def clear(self):
+        """Remove todas as entradas dos índices."""
+        self._by_type.clear()
+        self._by_success = (_Postings(), _Postings())
+
+    def candidates(self, operation_type: Optional[str],
+                   success: Optional[bool]) -> Optional[_Postings]:
+        """
+        Escolhe o índice mais seletivo para os filtros.
+
+        Returns:
+            _Postings ou None se nenhum filtro indexado foi informado
+        """
+        options = []
+        if operation_type is not None:
+            options.append(self._by_type.get(operation_type) or _Postings())
+        if success is not None:
+            options.append(self._by_success[bool(success)])
+        return min(options, key=len) if options else None
+
+    def memory_usage(self) -> int:
+        """Bytes ocupados pelos arrays dos índices."""
+        postings = list(self._by_type.values()) + list(self._by_success)
+        return sum(sys.getsizeof(item.sequences) for item in postings)
+
+
+def quantize_seconds(seconds: float) -> float:
+    """
+    Arredonda um horário em segundos para microssegundos.
+
+    É a precisão do datetime devolvido nas entradas; os armazenamentos gravam
+    os horários já arredondados, para que uma consulta a partir do horário de
+    uma entrada a inclua.
+    """
+    return round(seconds, 6)
+
+
+def to_seconds(instant: Instant) -> float:
+    """Converte um horário (datetime ou segundos desde a época) em segundos."""
+    return quantize_seconds(
+        instant.timestamp() if isinstance(instant, datetime) else float(instant)
+    )
+
+
+def _bisect_time(history: Any, seconds: float, low: int, high: int) -> int:
+    """Primeira posição em [low, high) com horário >= seconds."""
+    while low < high:
+        middle = (low + high) // 2
+        if history._timestamp_at(middle) < seconds:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _query(history: Any, start_time: Optional[Instant], end_time: Optional[Instant],
+           operation_type: Optional[str], success: Optional[bool],
+           contains: Optional[str], limit: Optional[int],
+           offset: int) -> Iterator[Dict[str, Any]]:
+    """Consulta comum de RingHistory e ColumnarHistory (ver RingHistory.query)."""
+    low, high = 0, len(history)
+    if start_time is not None:
+        low = _bisect_time(history, to_seconds(start_time), low, high)
+    if end_time is not None:
+        high = _bisect_time(history, to_seconds(end_time), low, high)
+
+    # Números de sequência não mudam com inserções e descartes, então o
+    # iterador continua válido se o histórico mudar durante a iteração
+    first = history._first_sequence
+    postings = history._index.candidates(operation_type, success)
+    if postings is None:
+        sequences: Iterable[int] = range(first + low, first + high)
+    else:
+        sequences = postings.between(first + low, first + high)
+
+    def matches() -> Iterator[Dict[str, Any]]:
+        for sequence in sequences:
+            position = sequence - history._first_sequence
+            if not 0 <= position < len(history):
+                continue
+            entry = history[position]
+            if operation_type is not None and entry["operation_type"] != operation_type:
+                continue
+            if success is not None and entry["success"] != bool(success):
+                continue
+            if contains is not None and contains not in entry["operation"]:
+                continue
+            yield entry
+
+    return islice(matches(), offset, None if limit is None else offset + limit)
+
+
+class ThroughputMeter:
+    """
+    Taxa de operações por segundo em uma janela móvel.
+
+    A janela é dividida em intervalos de mesma duração, cada um com seu
+    contador, reaproveitados de forma circular: registrar uma operação e
+    calcular a taxa não dependem da quantidade de operações registradas.
+    """
+
+    def __init__(self, window: float = 10.0, buckets: int = 10):
+        """
+        Inicializa o medidor.
+
+        Args:
+            window: Duração da janela, em segundos
+            buckets: Quantidade de intervalos da janela
+
+        Raises:
+            ValueError: Se a janela ou a quantidade de intervalos forem inválidas
+        """
+        if window <= 0 or buckets < 1:
+            raise ValueError("A janela e a quantidade de intervalos devem ser positivas")
+        self.window = window
+        self._width = window / buckets
+        self._counts = [0] * buckets
+        # Número do intervalo (horário // largura) a que cada contador pertence
+        self._periods = [-1] * buckets
+
+    def record(self, timestamp: Optional[float] = None):
+        """
+        Registra uma operação.
+
+        Args:
+            timestamp: Horário em segundos desde a época (padrão: agora)
+        """
+        period = int((time.time() if timestamp is None else timestamp) // self._width)
+        slot = period % len(self._counts)
+        if self._periods[slot] != period:
+            self._periods[slot] = period
+            self._counts[slot] = 0
+        self._counts[slot] += 1
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """
+        Calcula a taxa de operações na janela que termina em now.
+
+        Args:
+            now: Horário em segundos desde a época (padrão: agora)
+
+        Returns:
+            float: Operações por segundo
+        """
+        current = int((time.time() if now is None else now) // self._width)
+        oldest = current - len(self._counts)
+        total = sum(
+            count for period, count in zip(self._periods, self._counts)
+            if oldest < period <= current
+        )
+        return total / self.window
+
+    def clear(self):
+        """Descarta as operações registradas."""
+        self._counts = [0] * len(self._counts)
+        self._periods = [-1] * len(self._counts)
+
+
+class RingHistory:
+    """
+    Buffer circular de entradas do histórico, da mais antiga para a mais recente.
+    """
+
+    def __init__(self, capacity: int = 10):
+        """
+        Inicializa o histórico.
+
+        Args:
+            capacity: Quantidade máxima de entradas mantidas
+
+        Raises:
+            ValueError: Se a capacidade for menor que 1
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 1")
+        self._buffer: List[Any] = [None] * capacity
+        self._start = 0
+        self._size = 0
+        # Número de sequência da entrada mais antiga (cresce a cada descarte)
+        self._first_sequence = 0
+        self._counters = HistoryCounters()
+        self._index = HistoryIndex()
+
+    @property
+    def capacity(self) -> int:
+        """Quantidade máxima de entradas mantidas."""
+        return len(self._buffer)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        buffer = self._buffer
+        capacity = len(buffer)
+        for offset in range(self._size):
+            yield buffer[(self._start + offset) % capacity]
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Índice fora do histórico")
+        return self._buffer[(self._start + index) % len(self._buffer)]
+
+    def __setitem__(self, index: int, entry: Any):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Índice fora do histórico")
+        self._buffer[(self._start + index) % len(self._buffer)] = entry
+
+    def append(self, entry: Any) -> Optional[Any]:
+        """
+        Insere uma entrada, descartando a mais antiga se o histórico estiver cheio.
+
+        Args:
+            entry: Entrada do histórico
+
+        Returns:
+            A entrada descartada, ou None se nenhuma foi descartada
+        """
+        buffer = self._buffer
+        capacity = len(buffer)
+        if self._size < capacity:
+            buffer[(self._start + self._size) % capacity] = entry
+            self._size += 1
+            return None
+        evicted = buffer[self._start]
+        buffer[self._start] = entry
+        self._start = (self._start + 1) % capacity
+        self._first_sequence += 1
+        return evicted
+
+    def add(self, operation: str, result: str, success: bool,
+            timestamp: Optional[float] = None,
+            operation_type: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Registra uma operação no histórico.
+
+        Args:
+            operation: Descrição da operação realizada
+            result: Resultado (ou mensagem de erro) da operação
+            success: Se a operação foi bem-sucedida
+            timestamp: Horário em segundos desde a época (padrão: agora)
+            operation_type: Tipo da operação (ex.: "square_root")
+
+        Returns:
+            Dict: A entrada descartada, ou None se nenhuma foi descartada
+        """
+        # Apenas as entradas registradas por add() entram nas contagens e índices
+        self._counters.add(operation_type, success)
+        evicted = self.append({
+            "timestamp": datetime.now() if timestamp is None else datetime.fromtimestamp(timestamp),
+            "operation": operation,
+            "result": result,
+            "success": success,
+            "operation_type": operation_type
+        })
+        if evicted is not None:
+            self._counters.discard(evicted["operation_type"], evicted["success"])
+            self._index.discard(evicted["operation_type"], evicted["success"])
+        self._index.add(self._first_sequence + self._size - 1, operation_type, success)
+        return evicted
+
+    def window(self, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        """
+        Retorna uma janela do histórico, com a semântica de fatias do Python.
+
+        Args:
+            start: Índice inicial (negativo conta a partir da mais recente;
+                window(-50) retorna as 50 últimas)
+            stop: Índice final, exclusivo (None = até a mais recente)
+
+        Returns:
+            List: Entradas da janela, da mais antiga para a mais recente
+        """
+        first, last, _ = slice(start, stop).indices(self._size)
+        if first >= last:
+            return []
+        buffer = self._buffer
+        capacity = len(buffer)
+        begin = (self._start + first) % capacity
+        end = begin + (last - first)
+        if end <= capacity:
+            return buffer[begin:end]
+        return buffer[begin:] + buffer[:end - capacity]
+
+    def resize(self, capacity: int) -> List[Any]:
+        """
+        Altera a capacidade, mantendo as entradas mais recentes.
+
+        Args:
+            capacity: Nova capacidade
+
+        Returns:
+            List: Entradas descartadas, da mais antiga para a mais recente
+
+        Raises:
+            ValueError: Se a capacidade for menor que 1
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 1")
+        entries = self.window()
+        evicted = entries[:-capacity] if len(entries) > capacity else []
+        kept = entries[len(evicted):]
+        self._buffer = kept + [None] * (capacity - len(kept))
+        self._start = 0
+        self._size = len(kept)
+        self._first_sequence += len(evicted)
+        if self._counters.successful or self._counters.failed:
+            for entry in evicted:
+                self._counters.discard(entry["operation_type"], entry["success"])
+                self._index.discard(entry["operation_type"], entry["success"])
+        return evicted
+
+    def clear(self):
+        """Remove todas as entradas, mantendo a capacidade."""
+        self._buffer = [None] * len(self._buffer)
+        self._start = 0
+        self._first_sequence += self._size
+        self._size = 0
+        self._counters.clear()
+        self._index.clear()
+
+    def _timestamp_at(self, index: int) -> float:
+        return quantize_seconds(self[index]["timestamp"].timestamp())
+
+    def query(self, start_time: Optional[Instant] = None, end_time: Optional[Instant] = None,
+              operation_type: Optional[str] = None, success: Optional[bool] = None,
+              contains: Optional[str] = None, limit: Optional[int] = None,
+              offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta o histórico, da entrada mais antiga para a mais recente.
+
+        O intervalo de horário é localizado por busca binária e os filtros de
+        tipo e sucesso usam os índices secundários; só as entradas candidatas
+        são examinadas, à medida que o iterador avança.
+
+        Args:
+            start_time: Horário inicial, inclusivo (datetime ou segundos)
+            end_time: Horário final, exclusivo (datetime ou segundos)
+            operation_type: Tipo da operação (ex.: "square_root")
+            success: True para operações bem-sucedidas, False para erros
+            contains: Trecho do texto da operação
+            limit: Quantidade máxima de entradas (None = sem limite)
+            offset: Quantidade de entradas encontradas a pular
+
+        Returns:
+            Iterator: Entradas encontradas entre as existentes no momento da
+            consulta (as descartadas durante a iteração são puladas)
+        """
+        return _query(self, start_time, end_time, operation_type, success,
+                      contains, limit, offset)
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Estima a memória ocupada pelo histórico.
+
+        Soma o buffer, os índices e os objetos de cada entrada (objetos
+        compartilhados entre entradas são contados uma única vez).
+
+        Returns:
+            Dict: entries, bytes e bytes_per_entry
+        """
+        total = sys.getsizeof(self._buffer)
+        seen = set()
+        for entry in self:
+            total += sys.getsizeof(entry)
+            if isinstance(entry, dict):
+                for value in entry.values():
+                    if id(value) not in seen:
+                        seen.add(id(value))
+                        total += sys.getsizeof(value)
+        total += self._index.memory_usage()
+        return _memory_report(self._size, total)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Resume o histórico a partir das contagens mantidas a cada inserção.
+
+        Returns:
+            Dict: total, successful, failed, last_timestamp (datetime da
+            entrada mais recente ou None) e operations (contagens
+            {"successful", "failed"} por tipo de operação)
+        """
+        return self._counters.summary(self[-1]["timestamp"] if self._size else None)
+
+
+def _memory_report(entries: int, total: int) -> Dict[str, Any]:
+    return {
+        "entries": entries,
+        "bytes": total,
+        "bytes_per_entry": total / entries if entries else 0.0
+    }
+
+
+# Área de texto: o prefixo já descartado é removido quando passa deste tamanho
+# e de um quarto da área, mantendo a remoção com custo amortizado O(1)
+_TEXT_COMPACT_MIN = 64 * 1024
+
+
+class ColumnarHistory:
+    """
+    Histórico em colunas compactas, com a mesma interface de RingHistory.
+
+    Cada entrada ocupa 8 bytes de horário, 1 bit de sucesso, 12 bytes de
+    posição e tamanho do texto e os próprios textos em UTF-8. Como as
+    entradas são descartadas na ordem de inserção, os textos ficam em uma
+    única área contígua que só cresce no final e perde o início, sem um
+    objeto str por texto; o resultado de uma entrada termina onde começa o
+    texto da entrada seguinte.
+    """
+
+    def __init__(self, capacity: int = 10):
+        """
+        Inicializa o histórico.
+
+        Args:
+            capacity: Quantidade máxima de entradas mantidas
+
+        Raises:
+            ValueError: Se a capacidade for menor que 1
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 1")
+        # Número de sequência da entrada mais antiga (cresce a cada descarte)
+        self._first_sequence = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self._timestamps = array('d', bytes(8 * capacity))
+        # Posição lógica do texto de cada entrada (não muda com a compactação)
+        self._offsets = array('Q', bytes(8 * capacity))
+        self._operation_lengths = array('I', bytes(4 * capacity))
+        self._success = bytearray((capacity + 7) // 8)
+        # Tipos de operação internados (poucos valores distintos)
+        self._types = array('H', bytes(2 * capacity))
+        self._type_names: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+        self._text = bytearray()
+        # Posição lógica do primeiro byte de _text
+        self._text_base = 0
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self._counters = HistoryCounters()
+        self._index = HistoryIndex()
+
+    @property
+    def capacity(self) -> int:
+        """Quantidade máxima de entradas mantidas."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._size):
+            yield self._entry((self._start + index) % self._capacity)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Índice fora do histórico")
+        return self._entry((self._start + index) % self._capacity)
+
+    def _succeeded(self, slot: int) -> bool:
+        return bool(self._success[slot >> 3] & (1 << (slot & 7)))
+
+    def _entry(self, slot: int) -> Dict[str, Any]:
+        """Monta o dicionário de uma posição do buffer."""
+        text = self._text
+        begin = self._offsets[slot] - self._text_base
+        middle = begin + self._operation_lengths[slot]
+        if slot == (self._start + self._size - 1) % self._capacity:
+            end = len(text)
+        else:
+            end = self._offsets[(slot + 1) % self._capacity] - self._text_base
+        return {
+            "timestamp": datetime.fromtimestamp(self._timestamps[slot]),
+            "operation": text[begin:middle].decode("utf-8"),
+            "result": text[middle:end].decode("utf-8"),
+            "success": self._succeeded(slot),
+            "operation_type": self._type_names[self._types[slot]]
+        }
+
+    def _store(self, slot: int, timestamp: float, operation: bytes,
+               result: bytes, success: bool, operation_type: str):
+        """Grava as colunas de uma posição do buffer."""
+        type_id = self._type_ids.get(operation_type)
+        if type_id is None:
+            type_id = self._type_ids[operation_type] = len(self._type_names)
+            self._type_names.append(operation_type)
+        self._types[slot] = type_id
+        self._timestamps[slot] = quantize_seconds(timestamp)
+        self._offsets[slot] = self._text_base + len(self._text)
+        self._operation_lengths[slot] = len(operation)
+        self._text += operation
+        self._text += result
+        if success:
+            self._success[slot >> 3] |= 1 << (slot & 7)
+        else:
+            self._success[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+
+    def _compact(self):
+        """Remove da área de texto o prefixo que não pertence a nenhuma entrada."""
+        if self._size:
+            live = self._offsets[self._start]
+        else:
+            live = self._text_base + len(self._text)
+        dead = live - self._text_base
+        if dead >= _TEXT_COMPACT_MIN and dead * 4 >= len(self._text):
+            del self._text[:dead]
+            self._text_base = live
+
+    def add(self, operation: str, result: str, success: bool,
+            timestamp: Optional[float] = None,
+            operation_type: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Registra uma operação no histórico.
+
+        Args:
+            operation: Descrição da operação realizada
+            result: Resultado (ou mensagem de erro) da operação
+            success: Se a operação foi bem-sucedida
+            timestamp: Horário em segundos desde a época (padrão: agora)
+            operation_type: Tipo da operação (ex.: "square_root")
+
+        Returns:
+            Dict: A entrada descartada, ou None se nenhuma foi descartada
+        """
+        evicted = None
+        if self._size < self._capacity:
+            slot = (self._start + self._size) % self._capacity
+            self._size += 1
+        else:
+            slot = self._start
+            evicted = self._entry(slot)
+            self._counters.discard(evicted["operation_type"], evicted["success"])
+            self._index.discard(evicted["operation_type"], evicted["success"])
+            self._start = (self._start + 1) % self._capacity
+            self._first_sequence += 1
+
+        self._counters.add(operation_type, success)
+        self._index.add(self._first_sequence + self._size - 1, operation_type, success)
+        self._store(
+            slot, time.time() if timestamp is None else timestamp,
+            operation.encode("utf-8"), result.encode("utf-8"), success,
+            operation_type
+        )
+        if evicted is not None:
+            self._compact()
+        return evicted
+
+    def window(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Retorna uma janela do histórico, com a semântica de fatias do Python.
+
+        Args:
+            start: Índice inicial (negativo conta a partir da mais recente)
+            stop: Índice final, exclusivo (None = até a mais recente)
+
+        Returns:
+            List: Entradas da janela, da mais antiga para a mais recente
+        """
+        first, last, _ = slice(start, stop).indices(self._size)
+        return [
+            self._entry((self._start + index) % self._capacity)
+            for index in range(first, last)
+        ]
+
+    def resize(self, capacity: int) -> List[Dict[str, Any]]:
+        """
+        Altera a capacidade, mantendo as entradas mais recentes.
+
+        Args:
+            capacity: Nova capacidade
+
+        Returns:
+            List: Entradas descartadas, da mais antiga para a mais recente
+
+        Raises:
+            ValueError: Se a capacidade for menor que 1
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 1")
+        dropped = max(0, self._size - capacity)
+        evicted = self.window(0, dropped)
+        kept = self.window(dropped)
+
+        self._allocate(capacity)
+        self._first_sequence += dropped
+        for slot, entry in enumerate(kept):
+            self._store(
+                slot, entry["timestamp"].timestamp(),
+                entry["operation"].encode("utf-8"), entry["result"].encode("utf-8"),
+                entry["success"], entry["operation_type"]
+            )
+            self._counters.add(entry["operation_type"], entry["success"])
+            self._index.add(self._first_sequence + slot, entry["operation_type"],
+                            entry["success"])
+        self._size = len(kept)
+        return evicted
+
+    def clear(self):
+        """Remove todas as entradas, mantendo a capacidade."""
+        self._first_sequence += self._size
+        self._allocate(self._capacity)
+
+    def _timestamp_at(self, index: int) -> float:
+        return self._timestamps[(self._start + index) % self._capacity]
+
+    def query(self, start_time: Optional[Instant] = None, end_time: Optional[Instant] = None,
+              operation_type: Optional[str] = None, success: Optional[bool] = None,
+              contains: Optional[str] = None, limit: Optional[int] = None,
+              offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta o histórico, da entrada mais antiga para a mais recente.
+
+        Mesma semântica de RingHistory.query; o intervalo de horário é
+        localizado por busca binária diretamente na coluna de horários.
+
+        Returns:
+            Iterator: Entradas encontradas
+        """
+        return _query(self, start_time, end_time, operation_type, success,
+                      contains, limit, offset)
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Calcula a memória ocupada pelo histórico.
+
+        Returns:
+            Dict: entries, bytes e bytes_per_entry (colunas pré-alocadas
+            para toda a capacidade mais a área de texto)
+        """
+        columns = sum(
+            column.buffer_info()[1] * column.itemsize
+            for column in (self._timestamps, self._offsets,
+                           self._operation_lengths, self._types)
+        )
+        total = (columns + len(self._success) + sys.getsizeof(self._text)
+                 + self._index.memory_usage())
+        return _memory_report(self._size, total)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Resume o histórico a partir das contagens mantidas a cada inserção.
+
+        Returns:
+            Dict: total, successful, failed, last_timestamp (datetime da
+            entrada mais recente ou None) e operations (contagens
+            {"successful", "failed"} por tipo de operação)
+        """
+        last_timestamp = None
+        if self._size:
+            last = (self._start + self._size - 1) % self._capacity
+            last_timestamp = datetime.fromtimestamp(self._timestamps[last])
+        return self._counters.summary(last_timestamp)
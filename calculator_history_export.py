@@ -0,0 +1,265 @@
+"""
+Exportação e Importação do Histórico da Calculadora Moderna
+
+Este módulo grava o histórico do CalculatorController em CSV ou JSON Lines
+(opcionalmente comprimidos com gzip) e carrega esses arquivos de volta. A
+exportação é um gerador de blocos de texto: as entradas são lidas do
+histórico sob demanda (CalculatorController.query_history) e escritas a cada
+bloco de linhas, sem montar a lista formatada inteira em memória.
+
+Colunas (CSV) e chaves (JSON Lines):
+
+    timestamp,operation_type,operation,result,success
+    2024-05-01T10:15:30.123456,square_root,√16,4,True
+
+O formato é deduzido da extensão (.csv, .jsonl, com .gz opcional).
+Este módulo não depende do tkinter.
+"""
+
+import csv
+import gzip
+import io
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+from calculator_controller import CalculatorController
+
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+EXPORT_FIELDS = ["timestamp", "operation_type", "operation", "result", "success"]
+
+# Linhas por bloco de texto escrito no arquivo
+DEFAULT_CHUNK_ROWS = 1000
+
+
+def detect_format(path: str) -> Tuple[str, bool]:
+    """
+    Deduz o formato e a compressão pela extensão do arquivo.
+
+    Args:
+        path: Caminho do arquivo (ex.: "historico.jsonl.gz")
+
+    Returns:
+        Tuple: (formato, se o arquivo é comprimido com gzip)
+
+    Raises:
+        ValueError: Se a extensão não corresponder a um formato conhecido
+    """
+    name = path.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    for export_format in EXPORT_FORMATS:
+        if name.endswith("." + export_format):
+            return export_format, compressed
+    raise ValueError(f"Formato de histórico não reconhecido: {path}")
+
+
+def _resolve_format(path: str, export_format: Optional[str],
+                    compress: Optional[bool]) -> Tuple[str, bool]:
+    """Completa o formato e a compressão não informados a partir da extensão."""
+    if export_format is None or compress is None:
+        detected_format, detected_compress = detect_format(path)
+        export_format = export_format or detected_format
+        compress = detected_compress if compress is None else compress
+    return export_format, compress
+
+
+@contextmanager
+def open_history_file(path: str, mode: str, compress: bool) -> Iterator[TextIO]:
+    """
+    Abre um arquivo de histórico em modo texto UTF-8.
+
+    Args:
+        path: Caminho do arquivo
+        mode: "r" ou "w"
+        compress: Se o arquivo é comprimido com gzip
+
+    Returns:
+        Iterator: Gerenciador de contexto com o arquivo aberto
+    """
+    if compress:
+        # Nível 6: quase a mesma taxa de compressão do padrão (9), bem mais rápido
+        handle = gzip.open(path, mode + "t", compresslevel=6, encoding="utf-8", newline="")
+    else:
+        handle = open(path, mode, encoding="utf-8", newline="")
+    with handle:
+        yield handle
+
+
+def export_chunks(entries: Iterable[Dict[str, Any]], export_format: str = "csv",
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[str]:
+    """
+    Converte entradas do histórico em blocos de texto.
+
+    Args:
+        entries: Entradas do histórico (consumidas sob demanda)
+        export_format: "csv" (com cabeçalho) ou "jsonl"
+        chunk_rows: Quantidade máxima de linhas por bloco
+
+    Returns:
+        Iterator[str]: Blocos de texto prontos para escrita
+
+    Raises:
+        ValueError: Se o formato não for suportado
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportação não suportado: {export_format}")
+
+    buffer = io.StringIO()
+    if export_format == "csv":
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        write = lambda entry: writer.writerow([
+            entry["timestamp"].isoformat(), entry["operation_type"],
+            entry["operation"], entry["result"], entry["success"]
+        ])
+    else:
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        write = lambda entry: buffer.write(dumps({
+            "timestamp": entry["timestamp"].isoformat(),
+            "operation_type": entry["operation_type"],
+            "operation": entry["operation"],
+            "result": entry["result"],
+            "success": entry["success"]
+        }) + "\n")
+
+    rows = 0
+    for entry in entries:
+        write(entry)
+        rows += 1
+        if rows == chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_history(controller: CalculatorController, path: str,
+                   export_format: Optional[str] = None, compress: Optional[bool] = None,
+                   chunk_rows: int = DEFAULT_CHUNK_ROWS, **filters) -> Dict[str, Any]:
+    """
+    Exporta o histórico do controlador para um arquivo.
+
+    Args:
+        controller: Controlador cujo histórico será exportado
+        path: Caminho do arquivo de saída
+        export_format: "csv" ou "jsonl" (padrão: deduzido da extensão)
+        compress: Se a saída deve ser comprimida com gzip (padrão: deduzido
+            da extensão .gz)
+        chunk_rows: Quantidade de linhas por bloco escrito
+        **filters: Filtros de CalculatorController.query_history (ex.:
+            operation_type="square_root", start_time=...)
+
+    Returns:
+        Dict: Estatísticas (rows, elapsed_seconds, rows_per_second)
+    """
+    export_format, compress = _resolve_format(path, export_format, compress)
+
+    rows = 0
+    start = time.perf_counter()
+
+    def counted(entries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        nonlocal rows
+        for entry in entries:
+            rows += 1
+            yield entry
+
+    with open_history_file(path, "w", compress) as handle:
+        for chunk in export_chunks(counted(controller.query_history(**filters)),
+                                   export_format, chunk_rows):
+            handle.write(chunk)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "elapsed_seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def _parse_success(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("true", "1")
+
+
+def read_history(path: str, export_format: Optional[str] = None,
+                 compress: Optional[bool] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lê as entradas de um arquivo exportado, uma a uma.
+
+    Args:
+        path: Caminho do arquivo
+        export_format: "csv" ou "jsonl" (padrão: deduzido da extensão)
+        compress: Se o arquivo é comprimido com gzip (padrão: deduzido da
+            extensão .gz)
+
+    Returns:
+        Iterator: Entradas no formato do histórico
+
+    Raises:
+        ValueError: Se uma linha não puder ser interpretada
+    """
+    export_format, compress = _resolve_format(path, export_format, compress)
+
+    with open_history_file(path, "r", compress) as handle:
+        if export_format == "csv":
+            records: Iterable[Any] = csv.DictReader(handle)
+        else:
+            records = (line for line in handle if line.strip())
+        for line_number, record in enumerate(records, start=1):
+            try:
+                if export_format != "csv":
+                    record = json.loads(record)
+                yield {
+                    "timestamp": datetime.fromisoformat(record["timestamp"]),
+                    "operation": record["operation"],
+                    "result": record["result"],
+                    "success": _parse_success(record["success"]),
+                    "operation_type": record.get("operation_type") or ""
+                }
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Linha {line_number} inválida em {path}: {e}") from e
+
+
+def import_history(controller: CalculatorController, path: str,
+                   export_format: Optional[str] = None,
+                   compress: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Carrega um arquivo exportado no histórico do controlador.
+
+    As entradas mantêm os horários originais e são inseridas depois das
+    existentes (com a capacidade do histórico, as mais antigas são
+    descartadas como em qualquer inserção). Por isso o arquivo não pode ter
+    entradas anteriores à última do histórico: importe-o em um histórico
+    vazio ou limpo, ou antes das novas operações.
+
+    Args:
+        controller: Controlador que recebe as entradas
+        path: Caminho do arquivo
+        export_format: "csv" ou "jsonl" (padrão: deduzido da extensão)
+        compress: Se o arquivo é comprimido com gzip (padrão: deduzido da
+            extensão .gz)
+
+    Returns:
+        Dict: Estatísticas (rows, elapsed_seconds, rows_per_second)
+
+    Raises:
+        ValueError: Se uma entrada for anterior à última do histórico (veja
+            CalculatorController.load_history)
+    """
+    start = time.perf_counter()
+    rows = controller.load_history(read_history(path, export_format, compress))
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "elapsed_seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed > 0 else 0.0
+    }
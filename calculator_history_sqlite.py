@@ -0,0 +1,530 @@
+"""
+Histórico Persistente em SQLite da Calculadora Moderna
+
+Este módulo contém a classe SQLiteHistory, um armazenamento do histórico do
+CalculatorController gravado em um banco SQLite (módulo sqlite3 da biblioteca
+padrão), com a mesma interface de RingHistory e ColumnarHistory.
+
+- O banco usa o modo WAL, de modo que leituras não bloqueiam a gravação.
+- As inserções são enfileiradas e gravadas em lotes por uma thread de
+  gravação em segundo plano; add() não espera pelo disco. Toda consulta
+  aguarda a gravação do que já foi enfileirado, então as leituras sempre
+  veem as operações registradas antes delas.
+- Há índices por horário, tipo de operação e sucesso, e uma tabela de
+  contagens por (tipo de operação, sucesso) mantida por gatilhos, usada por
+  summary() sem percorrer as linhas.
+"""
+
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from calculator_history import Instant, quantize_seconds, to_seconds
+
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    operation_type TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    result TEXT NOT NULL,
+    success INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_timestamp ON history (timestamp);
+CREATE INDEX IF NOT EXISTS history_type ON history (operation_type, timestamp);
+CREATE INDEX IF NOT EXISTS history_success ON history (success, timestamp);
+
+CREATE TABLE IF NOT EXISTS history_counts (
+    operation_type TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (operation_type, success)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS history_count_insert AFTER INSERT ON history
+BEGIN
+    INSERT INTO history_counts (operation_type, success, count)
+    VALUES (NEW.operation_type, NEW.success, 1)
+    ON CONFLICT (operation_type, success) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS history_count_delete AFTER DELETE ON history
+BEGIN
+    UPDATE history_counts SET count = count - 1
+    WHERE operation_type = OLD.operation_type AND success = OLD.success;
+END;
+"""
+
+_INSERT = (
+    "INSERT INTO history (timestamp, operation_type, operation, result, success) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+_COLUMNS = "timestamp, operation, result, success, operation_type"
+
+# Linha do banco: (timestamp, operation, result, success, operation_type)
+Row = Tuple[float, str, str, int, str]
+
+# Marcador de parada da thread de gravação
+_STOP = object()
+
+# Históricos abertos, fechados na saída do interpretador para gravar a fila
+_open_histories: "weakref.WeakSet[SQLiteHistory]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_histories():
+    for history in list(_open_histories):
+        history.close()
+
+
+def _query_sql(conditions: List[str]) -> str:
+    """Monta a consulta paginada de query() na ordem dos índices de horário."""
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+    return (f"SELECT id, {_COLUMNS} FROM history {where}"
+            "ORDER BY timestamp, id LIMIT ? OFFSET ?")
+
+
+def _entry(row: Row) -> Dict[str, Any]:
+    """Converte uma linha do banco no formato de entrada do histórico."""
+    timestamp, operation, result, success, operation_type = row
+    return {
+        "timestamp": datetime.fromtimestamp(timestamp),
+        "operation": operation,
+        "result": result,
+        "success": bool(success),
+        "operation_type": operation_type
+    }
+
+
+class SQLiteHistory:
+    """
+    Histórico persistente em SQLite, da entrada mais antiga para a mais recente.
+    """
+
+    def __init__(self, path: str, capacity: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        Abre (ou cria) o banco do histórico e inicia a thread de gravação.
+
+        Args:
+            path: Caminho do arquivo SQLite
+            capacity: Quantidade máxima de entradas mantidas (None = sem limite)
+            batch_size: Quantidade máxima de entradas gravadas por transação
+            flush_interval: Tempo máximo, em segundos, que uma entrada espera
+                na fila antes de ser gravada
+
+        Raises:
+            ValueError: Se a capacidade ou o tamanho do lote forem inválidos
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 1")
+        if batch_size < 1:
+            raise ValueError("O tamanho do lote deve ser pelo menos 1")
+        self.path = path
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+        self._reader = sqlite3.connect(path, check_same_thread=False)
+        self._reader.execute("PRAGMA journal_mode=WAL")
+        self._reader.executescript(_SCHEMA)
+        self._reader.commit()
+        self._read_lock = threading.Lock()
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        # Falha ao abrir a conexão de gravação: permanente, ao contrário de _error
+        self._connect_error: Optional[BaseException] = None
+        self._writer_ready = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._write_loop, name="calculator-history-writer", daemon=True
+        )
+        self._writer.start()
+        _open_histories.add(self)
+
+    # ------------------------------------------------------------------
+    # Gravação em segundo plano
+    # ------------------------------------------------------------------
+
+    def _write_loop(self):
+        """Grava as entradas enfileiradas em lotes, até receber _STOP."""
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA synchronous=NORMAL")
+        except Exception as e:
+            self._connect_error = e
+            self._writer_ready.set()
+            self._discard_queue()
+            return
+        self._writer_ready.set()
+        try:
+            while True:
+                item = self._queue.get()
+                batch = []
+                stop = False
+                deadline = time.monotonic() + self._flush_interval
+                while True:
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self._batch_size:
+                        break
+                    timeout = deadline - time.monotonic()
+                    try:
+                        item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                try:
+                    if batch:
+                        self._write_batch(connection, batch)
+                except Exception as e:
+                    self._error = e
+                finally:
+                    for _ in range(len(batch) + stop):
+                        self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    def _discard_queue(self):
+        """Descarta as entradas enfileiradas, para que flush() não fique bloqueado."""
+        while True:
+            item = self._queue.get()
+            self._queue.task_done()
+            if item is _STOP:
+                return
+
+    def _write_batch(self, connection: sqlite3.Connection, batch: List[Any]):
+        """Insere um lote e aplica o limite de capacidade em uma transação."""
+        with connection:
+            for item in batch:
+                if item[0] == "row":
+                    connection.execute(_INSERT, item[1])
+                else:
+                    # Comandos de manutenção, aplicados na ordem da fila
+                    connection.execute(item[1], item[2])
+            if self._capacity is not None:
+                connection.execute(
+                    "DELETE FROM history WHERE id <= "
+                    "(SELECT MAX(id) FROM history) - ?",
+                    (self._capacity,)
+                )
+
+    def flush(self):
+        """
+        Aguarda a gravação de todas as entradas enfileiradas.
+
+        Raises:
+            sqlite3.Error: Se a gravação em segundo plano tiver falhado ou a
+                thread de gravação não tiver conseguido abrir o banco
+        """
+        self._writer_ready.wait()
+        self._queue.join()
+        if self._connect_error is not None:
+            raise self._connect_error
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Grava as entradas pendentes, encerra a thread e fecha o banco."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        with self._read_lock:
+            self._reader.close()
+
+    def __enter__(self) -> "SQLiteHistory":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, operation: str, result: str, success: bool,
+            timestamp: Optional[float] = None,
+            operation_type: str = "") -> None:
+        """
+        Enfileira uma operação para gravação.
+
+        Args:
+            operation: Descrição da operação realizada
+            result: Resultado (ou mensagem de erro) da operação
+            success: Se a operação foi bem-sucedida
+            timestamp: Horário em segundos desde a época (padrão: agora)
+            operation_type: Tipo da operação (ex.: "square_root")
+
+        Returns:
+            None: Entradas descartadas pelo limite de capacidade são removidas
+            pela thread de gravação
+
+        Raises:
+            ValueError: Se o histórico já tiver sido fechado
+            sqlite3.Error: Se a thread de gravação não tiver conseguido abrir
+                o banco
+        """
+        if self._closed:
+            raise ValueError("O histórico já foi fechado")
+        if self._connect_error is not None:
+            raise self._connect_error
+        self._queue.put(("row", (
+            quantize_seconds(time.time() if timestamp is None else timestamp),
+            operation_type, operation, result, int(bool(success))
+        )))
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, parameters: tuple = ()) -> List[tuple]:
+        self.flush()
+        with self._read_lock:
+            return self._reader.execute(sql, parameters).fetchall()
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Quantidade máxima de entradas mantidas (None = sem limite)."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._query("SELECT COALESCE(SUM(count), 0) FROM history_counts")[0][0]
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # Percorre em páginas pela chave primária, sem carregar o banco inteiro
+        last_id = 0
+        while True:
+            rows = self._query(
+                f"SELECT id, {_COLUMNS} FROM history WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, self._batch_size)
+            )
+            if not rows:
+                return
+            for row in rows:
+                yield _entry(row[1:])
+            last_id = rows[-1][0]
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        entries = self.window(index, index + 1 if index != -1 else None)
+        if not entries:
+            raise IndexError("Índice fora do histórico")
+        return entries[0]
+
+    def window(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Retorna uma janela do histórico, com a semântica de fatias do Python.
+
+        Janelas próximas do fim (as mais comuns) são lidas em ordem
+        decrescente pela chave primária, sem percorrer as entradas antigas.
+
+        Args:
+            start: Índice inicial (negativo conta a partir da mais recente)
+            stop: Índice final, exclusivo (None = até a mais recente)
+
+        Returns:
+            List: Entradas da janela, da mais antiga para a mais recente
+        """
+        size = len(self)
+        first, last, _ = slice(start, stop).indices(size)
+        if first >= last:
+            return []
+        count = last - first
+        if first <= size - last:
+            rows = self._query(
+                f"SELECT {_COLUMNS} FROM history ORDER BY id LIMIT ? OFFSET ?",
+                (count, first)
+            )
+        else:
+            rows = self._query(
+                f"SELECT {_COLUMNS} FROM history ORDER BY id DESC LIMIT ? OFFSET ?",
+                (count, size - last)
+            )
+            rows.reverse()
+        return [_entry(row) for row in rows]
+
+    def query(self, start_time: Optional[Instant] = None, end_time: Optional[Instant] = None,
+              operation_type: Optional[str] = None, success: Optional[bool] = None,
+              contains: Optional[str] = None, limit: Optional[int] = None,
+              offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta o histórico, da entrada mais antiga para a mais recente.
+
+        Os filtros de horário, tipo e sucesso usam os índices do banco. As
+        linhas são lidas em páginas, à medida que o iterador avança, pela
+        ordem dos próprios índices: (timestamp, id), continuando após a
+        última linha lida, sem ordenação temporária nem deslocamentos.
+
+        Args:
+            start_time: Horário inicial, inclusivo (datetime ou segundos)
+            end_time: Horário final, exclusivo (datetime ou segundos)
+            operation_type: Tipo da operação (ex.: "square_root")
+            success: True para operações bem-sucedidas, False para erros
+            contains: Trecho do texto da operação
+            limit: Quantidade máxima de entradas (None = sem limite)
+            offset: Quantidade de entradas encontradas a pular
+
+        Returns:
+            Iterator: Entradas encontradas
+        """
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if start_time is not None:
+            conditions.append("timestamp >= ?")
+            parameters.append(to_seconds(start_time))
+        if end_time is not None:
+            conditions.append("timestamp < ?")
+            parameters.append(to_seconds(end_time))
+        if operation_type is not None:
+            conditions.append("operation_type = ?")
+            parameters.append(operation_type)
+        if success is not None:
+            conditions.append("success = ?")
+            parameters.append(int(bool(success)))
+        if contains is not None:
+            conditions.append("instr(operation, ?) > 0")
+            parameters.append(contains)
+        first_sql = _query_sql(conditions)
+        next_sql = _query_sql(conditions + ["(timestamp, id) > (?, ?)"])
+
+        last: Tuple[Any, ...] = ()
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page = self._batch_size if remaining is None else min(remaining, self._batch_size)
+            if last:
+                rows = self._query(next_sql, (*parameters, *last, page, 0))
+            else:
+                # O deslocamento só se aplica à primeira página
+                rows = self._query(first_sql, (*parameters, page, offset))
+            if not rows:
+                return
+            for row in rows:
+                yield _entry(row[1:])
+            last = (rows[-1][1], rows[-1][0])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def resize(self, capacity: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        Altera a capacidade, mantendo as entradas mais recentes.
+
+        Args:
+            capacity: Nova capacidade (None = sem limite)
+
+        Returns:
+            List: Entradas descartadas, da mais antiga para a mais recente
+
+        Raises:
+            ValueError: Se a capacidade for menor que 1
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 1")
+        evicted = []
+        if capacity is not None:
+            size = len(self)
+            if size > capacity:
+                evicted = self.window(0, size - capacity)
+        self.set_capacity(capacity)
+        return evicted
+
+    def set_capacity(self, capacity: Optional[int]) -> int:
+        """
+        Altera a capacidade como resize(), sem ler as entradas descartadas.
+
+        A quantidade de descartes vem da tabela de contagens; reduzir um banco
+        grande não carrega na memória as linhas que serão removidas.
+
+        Args:
+            capacity: Nova capacidade (None = sem limite)
+
+        Returns:
+            int: Quantidade de entradas descartadas
+
+        Raises:
+            ValueError: Se a capacidade for menor que 1
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 1")
+        # Contar antes de trocar a capacidade: a gravação das entradas ainda
+        # na fila já aplicaria a nova capacidade
+        evicted = max(len(self) - capacity, 0) if capacity is not None else 0
+        self._capacity = capacity
+        if evicted:
+            self._queue.put(("sql",
+                             "DELETE FROM history WHERE id <= (SELECT MAX(id) FROM history) - ?",
+                             (capacity,)))
+            self.flush()
+        return evicted
+
+    def clear(self):
+        """Remove todas as entradas do banco."""
+        self._queue.put(("sql", "DELETE FROM history", ()))
+        self.flush()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Resume o histórico a partir da tabela de contagens e do índice de horário.
+
+        Returns:
+            Dict: total, successful, failed, last_timestamp (datetime da
+            entrada mais recente ou None) e operations (contagens
+            {"successful", "failed"} por tipo de operação)
+        """
+        operations: Dict[str, Dict[str, int]] = {}
+        successful = 0
+        failed = 0
+        for operation_type, success, count in self._query(
+                "SELECT operation_type, success, count FROM history_counts WHERE count > 0"):
+            counts = operations.setdefault(operation_type, {"successful": 0, "failed": 0})
+            if success:
+                counts["successful"] += count
+                successful += count
+            else:
+                counts["failed"] += count
+                failed += count
+        last = self._query("SELECT MAX(timestamp) FROM history")[0][0]
+        return {
+            "total": successful + failed,
+            "successful": successful,
+            "failed": failed,
+            "last_timestamp": datetime.fromtimestamp(last) if last is not None else None,
+            "operations": operations
+        }
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Informa o espaço ocupado pelo histórico no disco.
+
+        Returns:
+            Dict: entries, bytes (tamanho do banco e do arquivo WAL) e
+            bytes_per_entry
+        """
+        size = len(self)
+        total = 0
+        for suffix in ("", "-wal"):
+            try:
+                total += os.path.getsize(self.path + suffix)
+            except OSError:
+                pass
+        return {
+            "entries": size,
+            "bytes": total,
+            "bytes_per_entry": total / size if size else 0.0
+        }
@@ -0,0 +1,312 @@
+"""
+Instrumentação do Motor de Cálculo da Calculadora Moderna
+
+Este módulo contém a classe EngineInstrumentation, que registra, por tipo de
+operação (os mesmos valores de operation_type das respostas do motor), a
+quantidade de chamadas, a quantidade de erros e um histograma de latências,
+além de permitir o registro de funções de rastreamento chamadas antes e
+depois de cada operação.
+
+A instrumentação é opcional: CalculatorEngine.enable_instrumentation substitui
+os métodos públicos da instância por versões instrumentadas, e
+disable_instrumentation as remove. Com a instrumentação desativada, as
+chamadas resolvem diretamente para os métodos da classe, sem custo adicional.
+
+O histograma usa baldes no estilo HDR: valores pequenos têm baldes exatos e,
+a partir daí, cada potência de dois é dividida em um número fixo de baldes
+lineares, mantendo o erro relativo limitado com memória constante.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Hooks de rastreamento
+PreHook = Callable[[str, tuple, dict], None]
+PostHook = Callable[[str, tuple, dict, Any, int], None]
+
+DEFAULT_PRECISION_BITS = 5
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências em nanossegundos com baldes no estilo HDR.
+
+    Com precision_bits = p, valores abaixo de 2**p têm baldes exatos e cada
+    potência de dois acima disso é dividida em 2**(p-1) baldes, o que limita
+    o erro relativo a 2**-(p-1) (p = 5: cerca de 6%).
+    """
+
+    def __init__(self, precision_bits: int = DEFAULT_PRECISION_BITS):
+        """
+        Inicializa o histograma.
+
+        Args:
+            precision_bits: Bits significativos de cada balde (1 a 16)
+
+        Raises:
+            ValueError: Se a precisão estiver fora do intervalo aceito
+        """
+        if not 1 <= precision_bits <= 16:
+            raise ValueError("A precisão do histograma deve estar entre 1 e 16 bits")
+        self.precision_bits = precision_bits
+        self._linear_limit = 1 << precision_bits
+        self._half = 1 << (precision_bits - 1)
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._linear_limit:
+            return value
+        shift = value.bit_length() - self.precision_bits
+        top = value >> shift
+        return self._linear_limit + (shift - 1) * self._half + (top - self._half)
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        if index < self._linear_limit:
+            return index, index
+        offset = index - self._linear_limit
+        shift = offset // self._half + 1
+        top = offset % self._half + self._half
+        return top << shift, ((top + 1) << shift) - 1
+
+    def record(self, value: int):
+        """
+        Registra uma latência.
+
+        Args:
+            value: Latência em nanossegundos (valores negativos contam como 0)
+        """
+        value = value if value > 0 else 0
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percent: float) -> int:
+        """
+        Retorna a latência do percentil indicado.
+
+        Args:
+            percent: Percentil (0 a 100)
+
+        Returns:
+            int: Limite superior do balde que contém o percentil (limitado ao
+            máximo registrado), ou 0 se o histograma estiver vazio
+        """
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._bounds(index)[1], self.max)
+        return self.max
+
+    def buckets(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Percorre os baldes não vazios em ordem crescente.
+
+        Returns:
+            Iterator: Tuplas (limite_inferior_ns, limite_superior_ns, contagem)
+        """
+        for index in sorted(self._counts):
+            low, high = self._bounds(index)
+            yield low, high, self._counts[index]
+
+    def clear(self):
+        """Descarta todas as latências registradas."""
+        self._counts.clear()
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Retorna um resumo do histograma.
+
+        Returns:
+            Dict: count, min_ns, max_ns, mean_ns e os percentis de PERCENTILES
+            (p50_ns, p90_ns, p99_ns, p99.9_ns)
+        """
+        summary = {
+            "count": self.count,
+            "min_ns": self.min,
+            "max_ns": self.max,
+            "mean_ns": self.total / self.count if self.count else 0.0
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent:g}_ns"] = self.percentile(percent)
+        return summary
+
+
+class OperationStats:
+    """
+    Contadores e histograma de latências de um tipo de operação.
+    """
+
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self, precision_bits: int = DEFAULT_PRECISION_BITS):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram(precision_bits)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": self.errors / self.calls if self.calls else 0.0,
+            "latency": self.latency.summary()
+        }
+
+
+class EngineInstrumentation:
+    """
+    Estatísticas por operação e hooks de rastreamento de um motor de cálculo.
+    """
+
+    def __init__(self, precision_bits: int = DEFAULT_PRECISION_BITS):
+        """
+        Inicializa a instrumentação.
+
+        Args:
+            precision_bits: Bits significativos dos histogramas de latência
+        """
+        self.precision_bits = precision_bits
+        self._operations: Dict[str, OperationStats] = {}
+        self._pre_hooks: List[PreHook] = []
+        self._post_hooks: List[PostHook] = []
+
+    def add_pre_hook(self, hook: PreHook) -> PreHook:
+        """
+        Registra uma função chamada antes de cada operação.
+
+        Args:
+            hook: Função (operation_type, args, kwargs)
+
+        Returns:
+            A própria função (permite uso como decorador)
+        """
+        self._pre_hooks.append(hook)
+        return hook
+
+    def add_post_hook(self, hook: PostHook) -> PostHook:
+        """
+        Registra uma função chamada depois de cada operação.
+
+        Args:
+            hook: Função (operation_type, args, kwargs, resposta, latência_ns);
+                a resposta é None se a operação lançou uma exceção
+
+        Returns:
+            A própria função (permite uso como decorador)
+        """
+        self._post_hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: Callable[..., None]):
+        """
+        Remove uma função registrada como hook (anterior ou posterior).
+
+        Args:
+            hook: Função registrada
+        """
+        for hooks in (self._pre_hooks, self._post_hooks):
+            while hook in hooks:
+                hooks.remove(hook)
+
+    def _stats_for(self, operation_type: str) -> OperationStats:
+        stats = self._operations.get(operation_type)
+        if stats is None:
+            stats = self._operations[operation_type] = OperationStats(self.precision_bits)
+        return stats
+
+    def wrap(self, operation_type: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Cria a versão instrumentada de um método do motor.
+
+        Args:
+            operation_type: Tipo da operação usado como chave das estatísticas
+            method: Método original (já vinculado à instância)
+
+        Returns:
+            Callable: Função com a mesma assinatura do método
+        """
+        stats = self._stats_for(operation_type)
+        record = stats.latency.record
+        pre_hooks = self._pre_hooks
+        post_hooks = self._post_hooks
+        clock = time.perf_counter_ns
+
+        def instrumented(*args, **kwargs):
+            for hook in pre_hooks:
+                hook(operation_type, args, kwargs)
+            start = clock()
+            try:
+                response = method(*args, **kwargs)
+            except Exception:
+                elapsed = clock() - start
+                stats.calls += 1
+                stats.errors += 1
+                record(elapsed)
+                for hook in post_hooks:
+                    hook(operation_type, args, kwargs, None, elapsed)
+                raise
+            elapsed = clock() - start
+            stats.calls += 1
+            if not response["success"]:
+                stats.errors += 1
+            record(elapsed)
+            for hook in post_hooks:
+                hook(operation_type, args, kwargs, response, elapsed)
+            return response
+
+        instrumented.__name__ = getattr(method, "__name__", operation_type)
+        instrumented.__doc__ = getattr(method, "__doc__", None)
+        instrumented.__wrapped__ = method
+        return instrumented
+
+    def reset(self):
+        """Zera os contadores e histogramas, mantendo os hooks registrados."""
+        for stats in self._operations.values():
+            stats.calls = 0
+            stats.errors = 0
+            stats.latency.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna as estatísticas das operações já chamadas.
+
+        Returns:
+            Dict: operation_type -> {calls, errors, error_rate, latency}
+        """
+        return {
+            operation_type: stats.to_dict()
+            for operation_type, stats in self._operations.items()
+            if stats.calls
+        }
+
+    def histogram(self, operation_type: str) -> Optional[LatencyHistogram]:
+        """
+        Retorna o histograma de latências de uma operação.
+
+        Args:
+            operation_type: Tipo da operação
+
+        Returns:
+            LatencyHistogram ou None se a operação não for instrumentada
+        """
+        stats = self._operations.get(operation_type)
+        return stats.latency if stats is not None else None
@@ -0,0 +1,144 @@
+"""
+Transformação de Colunas Binárias da Calculadora Moderna
+
+Este módulo aplica uma operação unária do motor de cálculo (área do círculo,
+volume da esfera, raiz quadrada, conversões de ângulo ou trigonometria) a um
+arquivo binário de float64 (ordem de bytes nativa), escrevendo o resultado em
+outro arquivo do mesmo formato.
+
+Os dois arquivos são mapeados em memória (mmap) e processados bloco a bloco,
+de modo que o arquivo nunca é carregado por inteiro. Com o NumPy disponível
+cada bloco é calculado de forma vetorizada, sem criar objetos Python por
+elemento; sem o NumPy é usado o núcleo em Python puro de calculator_batch.
+
+Entradas inválidas (raio negativo, raiz de número negativo, valores não
+finitos) são escritas como NaN e contabilizadas separadamente.
+"""
+
+import mmap
+import os
+import time
+from typing import Any, Dict
+
+import calculator_batch
+from calculator_registry import TRIGONOMETRIC_FUNCTIONS, format_choices
+
+
+DEFAULT_CHUNK_ELEMENTS = 1 << 20
+
+TRANSFORM_OPERATIONS = calculator_batch.UNARY_OPERATIONS + ("trigonometric",)
+
+_ITEM_SIZE = 8
+
+
+def _apply(values: Any, operation: str, function: str, unit: str):
+    """Aplica o núcleo vetorizado da operação a um bloco de valores."""
+    if operation == "trigonometric":
+        return calculator_batch.trigonometric(values, function, unit)
+    return calculator_batch.unary_operation(values, operation)
+
+
+def _transform_numpy(source: mmap.mmap, target: mmap.mmap, count: int,
+                     operation: str, function: str, unit: str,
+                     chunk_elements: int) -> int:
+    """Transforma o arquivo usando visões NumPy sobre os mapeamentos."""
+    np = calculator_batch.np
+    values = np.frombuffer(source, dtype=np.float64, count=count)
+    output = np.frombuffer(target, dtype=np.float64, count=count)
+    errors = 0
+    for start in range(0, count, chunk_elements):
+        stop = min(start + chunk_elements, count)
+        results, mask = _apply(values[start:stop], operation, function, unit)
+        output[start:stop] = results
+        errors += calculator_batch.count_errors(mask)
+    # Liberar as visões antes de fechar os mapeamentos
+    del values, output
+    return errors
+
+
+def _transform_python(source: mmap.mmap, target: mmap.mmap, count: int,
+                      operation: str, function: str, unit: str,
+                      chunk_elements: int) -> int:
+    """Transforma o arquivo usando memoryview e o módulo array."""
+    errors = 0
+    with memoryview(source) as source_view:
+        for start in range(0, count, chunk_elements):
+            stop = min(start + chunk_elements, count)
+            with source_view[start * _ITEM_SIZE:stop * _ITEM_SIZE].cast('d') as chunk:
+                results, mask = _apply(chunk, operation, function, unit)
+            target[start * _ITEM_SIZE:stop * _ITEM_SIZE] = results.tobytes()
+            errors += calculator_batch.count_errors(mask)
+    return errors
+
+
+def transform_file(input_path: str, output_path: str, operation: str,
+                   function: str = "sin", unit: str = "degrees",
+                   chunk_elements: int = DEFAULT_CHUNK_ELEMENTS) -> Dict[str, Any]:
+    """
+    Aplica uma operação unária a um arquivo binário de float64.
+
+    Args:
+        input_path: Arquivo de entrada (float64 na ordem de bytes nativa)
+        output_path: Arquivo de saída (criado ou sobrescrito; não pode ser o
+            arquivo de entrada)
+        operation: Uma das TRANSFORM_OPERATIONS
+        function: Função trigonométrica (sin, cos, tan) se operation for
+            "trigonometric"
+        unit: Unidade dos ângulos (radians ou degrees) se operation for
+            "trigonometric"
+        chunk_elements: Quantidade de valores processados por bloco
+
+    Returns:
+        Dict: Estatísticas (elements, errors, elapsed_seconds,
+        elements_per_second)
+
+    Raises:
+        ValueError: Se a operação, os parâmetros ou o arquivo forem inválidos
+    """
+    if operation not in TRANSFORM_OPERATIONS:
+        raise ValueError(f"Operação inválida para transformação: {operation}")
+    if operation == "trigonometric":
+        if function not in TRIGONOMETRIC_FUNCTIONS:
+            raise ValueError(
+                "Função trigonométrica inválida. "
+                f"Use {format_choices(TRIGONOMETRIC_FUNCTIONS)}"
+            )
+        if unit not in ['radians', 'degrees']:
+            raise ValueError("Unidade inválida. Use 'radians' ou 'degrees'")
+    if chunk_elements <= 0:
+        raise ValueError("O tamanho do bloco deve ser positivo")
+
+    # A saída é truncada ao ser aberta; se fosse o próprio arquivo de
+    # entrada, os dados seriam destruídos antes da leitura
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        raise ValueError("O arquivo de saída não pode ser o próprio arquivo de entrada")
+
+    size = os.path.getsize(input_path)
+    if size % _ITEM_SIZE:
+        raise ValueError("O arquivo de entrada não contém apenas valores float64")
+    count = size // _ITEM_SIZE
+
+    start = time.perf_counter()
+    errors = 0
+
+    with open(input_path, "rb") as source_file, open(output_path, "w+b") as target_file:
+        target_file.truncate(size)
+        if count:
+            with mmap.mmap(source_file.fileno(), size, access=mmap.ACCESS_READ) as source, \
+                    mmap.mmap(target_file.fileno(), size, access=mmap.ACCESS_WRITE) as target:
+                transform = (
+                    _transform_numpy if calculator_batch.numpy_available()
+                    else _transform_python
+                )
+                errors = transform(
+                    source, target, count, operation, function, unit, chunk_elements
+                )
+                target.flush()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "elements": count,
+        "errors": errors,
+        "elapsed_seconds": elapsed,
+        "elements_per_second": count / elapsed if elapsed > 0 else 0.0
+    }
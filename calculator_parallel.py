@@ -0,0 +1,152 @@
+"""
+Processamento em Lote Paralelo da Calculadora Moderna
+
+Este módulo distribui o processamento de arquivos CSV do modo de lote entre
+vários processos. O arquivo de entrada é lido em streaming e dividido em
+blocos de linhas; cada bloco é interpretado, avaliado e formatado como texto
+CSV por um processo do ProcessPoolExecutor (com seu próprio CalculatorEngine).
+O processo principal apenas lê, distribui e escreve os blocos prontos na
+ordem original, para que o trabalho serial seja o menor possível.
+
+A quantidade de blocos em andamento é limitada, de modo que o consumo de
+memória depende do tamanho dos blocos e do número de processos, e não do
+tamanho do arquivo.
+"""
+
+import io
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from calculator_engine import CalculatorEngine
+from calculator_stream import (
+    evaluate_rows, format_rows, open_text, parse_rows, read_rows, write_rows
+)
+
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Blocos em andamento por processo (mantém os processos ocupados enquanto
+# o processo principal escreve a saída)
+_IN_FLIGHT_PER_WORKER = 2
+
+# Motor de cálculo de cada processo do pool
+_worker_engine: Optional[CalculatorEngine] = None
+
+
+def _init_worker(cache_size: int):
+    """Cria o motor de cálculo do processo."""
+    global _worker_engine
+    _worker_engine = CalculatorEngine(cache_size=cache_size)
+
+
+# Bloco processado: (texto CSV, linhas escritas, linhas com erro)
+ChunkResult = Tuple[str, int, int]
+
+
+def _evaluate_chunk(first_line: int, rows: List[List[str]]) -> ChunkResult:
+    """Interpreta, avalia e formata um bloco de linhas no processo do pool."""
+    buffer = io.StringIO()
+    parsed = parse_rows(rows, first_line)
+    total, errors = write_rows(
+        buffer, format_rows(evaluate_rows(_worker_engine, parsed)), header=False
+    )
+    return buffer.getvalue(), total, errors
+
+
+def chunk_rows(rows: Iterable[List[str]],
+               chunk_size: int) -> Iterator[Tuple[int, List[List[str]]]]:
+    """
+    Agrupa as linhas lidas do CSV em blocos numerados.
+
+    Args:
+        rows: Linhas do CSV
+        chunk_size: Quantidade máxima de linhas por bloco
+
+    Returns:
+        Iterator: Pares (número da primeira linha, linhas do bloco)
+    """
+    iterator = iter(rows)
+    first_line = 1
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield first_line, chunk
+        first_line += len(chunk)
+
+
+def evaluate_parallel(rows: Iterable[List[str]], workers: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      cache_size: int = 0) -> Iterator[ChunkResult]:
+    """
+    Avalia as linhas do CSV em paralelo, preservando a ordem original.
+
+    Args:
+        rows: Linhas do CSV
+        workers: Quantidade de processos
+        chunk_size: Quantidade de linhas por bloco
+        cache_size: Capacidade do cache de resultados de cada processo
+
+    Returns:
+        Iterator: Blocos processados, na ordem do arquivo de entrada
+    """
+    max_in_flight = workers * _IN_FLIGHT_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_size,)) as executor:
+        pending = deque()
+        for first_line, chunk in chunk_rows(rows, chunk_size):
+            pending.append(executor.submit(_evaluate_chunk, first_line, chunk))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_parallel_batch(input_path: str, output_path: str,
+                       workers: Optional[int] = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       cache_size: int = 0) -> Dict[str, Any]:
+    """
+    Processa um arquivo CSV de operações usando vários processos.
+
+    Args:
+        input_path: Caminho do CSV de entrada ("-" para a entrada padrão)
+        output_path: Caminho do CSV de saída ("-" para a saída padrão)
+        workers: Quantidade de processos (padrão: número de CPUs)
+        chunk_size: Quantidade de linhas por bloco
+        cache_size: Capacidade do cache de resultados de cada processo
+
+    Returns:
+        Dict: Estatísticas do processamento, no mesmo formato de run_batch,
+        acrescidas de workers e chunk_size
+    """
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    if chunk_size <= 0:
+        raise ValueError("O tamanho do bloco deve ser positivo")
+
+    start = time.perf_counter()
+
+    total = 0
+    errors = 0
+    with open_text(input_path, "r") as source, open_text(output_path, "w") as target:
+        write_rows(target, (), header=True)
+        for text, chunk_total, chunk_errors in evaluate_parallel(
+                read_rows(source), workers, chunk_size, cache_size):
+            target.write(text)
+            total += chunk_total
+            errors += chunk_errors
+
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": total,
+        "errors": errors,
+        "elapsed_seconds": elapsed,
+        "rows_per_second": total / elapsed if elapsed > 0 else 0.0,
+        "workers": workers,
+        "chunk_size": chunk_size
+    }
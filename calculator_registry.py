@@ -0,0 +1,283 @@
+"""
+Registro de Operações da Calculadora Moderna
+
+Este módulo centraliza o despacho das operações da calculadora em tabelas
+consultadas em tempo constante, no lugar de cadeias if/elif:
+
+- BINARY_OPERATORS: símbolo -> função usada por CalculatorEngine.basic_operation
+- TRIGONOMETRIC_FUNCTIONS: nome -> função usada por CalculatorEngine.trigonometric
+- OperationRegistry: operation_type -> OperationSpec, usado por
+  CalculatorController.execute_operation
+
+Cada OperationSpec descreve o manipulador da operação (nome de um método do
+motor ou uma função), os parâmetros aceitos com seus valores padrão (que
+podem vir do estado da calculadora) e a descrição exibida no histórico.
+Novas operações são incluídas com OperationRegistry.register, sem alterar o
+controlador.
+"""
+
+import math
+import operator
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+
+# Operadores binários: símbolo -> função (a, b). Divisões por zero lançam
+# ZeroDivisionError, tratado pelo motor.
+BINARY_OPERATORS: Dict[str, Callable[[float, float], float]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+# Funções trigonométricas: nome -> função de um ângulo em radianos
+TRIGONOMETRIC_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+}
+
+
+def format_choices(names: Iterable[str]) -> str:
+    """
+    Lista nomes para mensagens de erro ("sin, cos ou tan").
+
+    Args:
+        names: Nomes aceitos, por exemplo as chaves de TRIGONOMETRIC_FUNCTIONS
+
+    Returns:
+        str: Nomes separados por vírgula, com "ou" antes do último
+    """
+    names = list(names)
+    if len(names) < 2:
+        return "".join(names)
+    return f"{', '.join(names[:-1])} ou {names[-1]}"
+
+
+def from_current(state: Any) -> str:
+    """Valor padrão: valor atual da calculadora."""
+    return state.current_value
+
+
+def from_previous_or_current(state: Any) -> str:
+    """Valor padrão: valor anterior (operação pendente) ou o valor atual."""
+    return state.previous_value or state.current_value
+
+
+# Parâmetro: (nome do argumento, valor padrão ou função(estado) -> valor)
+Parameter = Tuple[str, Any]
+
+# Manipulador: nome de um método do motor ou função(engine, *args) -> resposta
+Handler = Union[str, Callable[..., Any]]
+
+
+class OperationSpec:
+    """
+    Descrição de uma operação despachada pelo controlador.
+    """
+
+    __slots__ = ("name", "handler", "parameters", "describe", "clears_pending")
+
+    def __init__(self, name: str, handler: Handler, parameters: Sequence[Parameter],
+                 describe: Callable[..., str], clears_pending: bool = False):
+        """
+        Inicializa a descrição da operação.
+
+        Args:
+            name: Tipo da operação (operation_type)
+            handler: Nome do método do motor ou função(engine, *args)
+            parameters: Parâmetros na ordem dos argumentos do manipulador
+            describe: Função que recebe os argumentos e retorna a descrição
+                exibida no histórico
+            clears_pending: Se a operação pendente (operador e valor anterior)
+                deve ser descartada após o sucesso
+        """
+        self.name = name
+        self.handler = handler
+        self.parameters = tuple(parameters)
+        self.describe = describe
+        self.clears_pending = clears_pending
+
+    def resolve_arguments(self, state: Any, kwargs: Dict[str, Any]) -> tuple:
+        """
+        Monta os argumentos do manipulador.
+
+        Args:
+            state: Estado da calculadora (fonte dos valores padrão)
+            kwargs: Argumentos nomeados recebidos pelo controlador
+
+        Returns:
+            tuple: Argumentos posicionais; argumentos ausentes ou None
+            recebem o valor padrão do parâmetro
+        """
+        args = []
+        for name, default in self.parameters:
+            value = kwargs.get(name)
+            if value is None:
+                value = default(state) if callable(default) else default
+            args.append(value)
+        return tuple(args)
+
+    def call(self, engine: Any, args: tuple) -> Any:
+        """
+        Executa o manipulador da operação.
+
+        Args:
+            engine: Motor de cálculo
+            args: Argumentos posicionais
+
+        Returns:
+            A resposta do manipulador
+        """
+        if isinstance(self.handler, str):
+            return getattr(engine, self.handler)(*args)
+        return self.handler(engine, *args)
+
+
+class OperationRegistry:
+    """
+    Tabela de operações do controlador, indexada por operation_type.
+    """
+
+    def __init__(self, specs: Sequence[OperationSpec] = ()):
+        """
+        Inicializa o registro.
+
+        Args:
+            specs: Operações iniciais
+        """
+        self._operations: Dict[str, OperationSpec] = {}
+        for spec in specs:
+            self._operations[spec.name] = spec
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._operations
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._operations)
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def get(self, name: str) -> Optional[OperationSpec]:
+        """
+        Busca uma operação.
+
+        Args:
+            name: Tipo da operação
+
+        Returns:
+            OperationSpec ou None se a operação não estiver registrada
+        """
+        return self._operations.get(name)
+
+    def register(self, name: str, handler: Optional[Handler] = None,
+                 parameters: Sequence[Parameter] = (),
+                 describe: Optional[Callable[..., str]] = None,
+                 clears_pending: bool = False, replace: bool = False) -> OperationSpec:
+        """
+        Registra uma operação.
+
+        Args:
+            name: Tipo da operação (operation_type)
+            handler: Nome do método do motor ou função(engine, *args)
+                (padrão: o método do motor com o mesmo nome)
+            parameters: Parâmetros (nome, padrão) na ordem dos argumentos
+            describe: Função que gera a descrição do histórico (padrão:
+                "name(arg1, arg2, ...)")
+            clears_pending: Se a operação pendente deve ser descartada após
+                o sucesso
+            replace: Se uma operação já registrada pode ser substituída
+
+        Returns:
+            OperationSpec: Operação registrada
+
+        Raises:
+            ValueError: Se a operação já estiver registrada e replace for False
+        """
+        if name in self._operations and not replace:
+            raise ValueError(f"Operação já registrada: {name}")
+        if describe is None:
+            describe = lambda *args: f"{name}({', '.join(str(arg) for arg in args)})"
+        spec = OperationSpec(
+            name, handler if handler is not None else name, parameters,
+            describe, clears_pending
+        )
+        self._operations[name] = spec
+        return spec
+
+    def unregister(self, name: str):
+        """
+        Remove uma operação registrada.
+
+        Args:
+            name: Tipo da operação
+
+        Raises:
+            KeyError: Se a operação não estiver registrada
+        """
+        del self._operations[name]
+
+    def copy(self) -> "OperationRegistry":
+        """Retorna uma cópia independente do registro."""
+        return OperationRegistry(list(self._operations.values()))
+
+
+def _unit_symbol(unit: str) -> str:
+    return "°" if unit == "degrees" else "rad"
+
+
+def create_default_registry() -> OperationRegistry:
+    """
+    Cria um registro com as operações padrão da calculadora.
+
+    Returns:
+        OperationRegistry: Registro novo e independente
+    """
+    registry = OperationRegistry()
+    registry.register(
+        "percentage",
+        parameters=(("number", from_previous_or_current), ("percent", from_current)),
+        describe=lambda number, percent: f"{percent}% de {number}",
+        clears_pending=True
+    )
+    registry.register(
+        "square_root",
+        parameters=(("number", from_current),),
+        describe=lambda number: f"√{number}"
+    )
+    registry.register(
+        "trigonometric",
+        parameters=(("number", from_current), ("function", "sin"), ("unit", "degrees")),
+        describe=lambda number, function, unit: f"{function}({number}{_unit_symbol(unit)})"
+    )
+    registry.register(
+        "circle_area",
+        parameters=(("radius", from_current),),
+        describe=lambda radius: f"Área círculo (r={radius})"
+    )
+    registry.register(
+        "sphere_volume",
+        parameters=(("radius", from_current),),
+        describe=lambda radius: f"Volume esfera (r={radius})"
+    )
+    registry.register(
+        "is_even_odd",
+        parameters=(("number", from_current),),
+        describe=lambda number: f"{number} é par/ímpar?"
+    )
+    registry.register(
+        "degrees_to_radians",
+        parameters=(("degrees", from_current),),
+        describe=lambda degrees: f"{degrees}° → rad"
+    )
+    registry.register(
+        "radians_to_degrees",
+        parameters=(("radians", from_current),),
+        describe=lambda radians: f"{radians}rad → °"
+    )
+    return registry
+
+
+# Registro compartilhado pelos controladores que não recebem um registro próprio
+OPERATIONS = create_default_registry()
@@ -0,0 +1,208 @@
+"""
+Gravação e Reprodução de Sessões da Calculadora Moderna
+
+Este módulo grava as chamadas de process_input e execute_operation de um
+CalculatorController (CalculatorController.start_recording) e reproduz a
+gravação em um controlador sem interface, o mais rápido possível,
+conferindo o display após cada chamada e medindo as teclas por segundo.
+
+Formato da gravação (texto UTF-8, comprimido com gzip se o nome terminar em
+.gz): uma linha de cabeçalho seguida de um evento JSON por linha.
+
+    {"format": "calculator-keystrokes", "version": 1, "start": 1714558530.12}
+    [0,"7","7"]
+    [152034,"+","7"]
+    [83120,"square_root",{"number":"16"},"4"]
+
+Cada evento tem os microssegundos desde o evento anterior, a tecla (três
+campos) ou o tipo da operação e seus argumentos (quatro campos) e o display
+após a chamada.
+
+Este módulo não depende do tkinter.
+"""
+
+import gzip
+import json
+import time
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from calculator_controller import CalculatorController
+
+
+RECORDING_FORMAT = "calculator-keystrokes"
+RECORDING_VERSION = 1
+
+# Divergências guardadas no relatório da reprodução
+MAX_REPORTED_MISMATCHES = 20
+
+# Evento lido: (microssegundos desde o anterior, tecla ou tipo da operação,
+# argumentos da operação ou None para teclas, display esperado)
+Event = Tuple[int, str, Optional[Dict[str, Any]], str]
+
+
+def _open_recording(path: str, mode: str) -> TextIO:
+    """Abre uma gravação em modo texto UTF-8 ("r" ou "w"), com gzip se terminar em .gz."""
+    if path.lower().endswith(".gz"):
+        return gzip.open(path, mode + "t", compresslevel=6, encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+class KeystrokeRecorder:
+    """
+    Grava eventos de um controlador em um arquivo, um por linha.
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre o arquivo e grava o cabeçalho.
+
+        Args:
+            path: Arquivo da gravação (comprimido com gzip se terminar em .gz)
+        """
+        self.path = path
+        self.events = 0
+        self._file: Optional[TextIO] = _open_recording(path, "w")
+        self._encode = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode
+        self._file.write(self._encode({
+            "format": RECORDING_FORMAT, "version": RECORDING_VERSION, "start": time.time()
+        }) + "\n")
+        self._last = time.perf_counter()
+
+    def _elapsed(self) -> int:
+        now = time.perf_counter()
+        elapsed = int((now - self._last) * 1_000_000)
+        self._last = now
+        return elapsed
+
+    def record_input(self, input_data: str, display: str):
+        """
+        Grava uma chamada de process_input.
+
+        Args:
+            input_data: Tecla recebida
+            display: Display após a chamada
+        """
+        self._file.write(self._encode([self._elapsed(), input_data, display]) + "\n")
+        self.events += 1
+
+    def record_operation(self, operation_type: str, kwargs: Dict[str, Any], display: str):
+        """
+        Grava uma chamada de execute_operation.
+
+        Args:
+            operation_type: Tipo da operação
+            kwargs: Argumentos nomeados da chamada
+            display: Display após a chamada
+        """
+        self._file.write(
+            self._encode([self._elapsed(), operation_type, kwargs, display]) + "\n"
+        )
+        self.events += 1
+
+    def close(self):
+        """Grava os eventos pendentes e fecha o arquivo."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_recording(path: str) -> Iterator[Event]:
+    """
+    Lê os eventos de uma gravação, um a um.
+
+    Args:
+        path: Arquivo da gravação
+
+    Returns:
+        Iterator: Eventos (microssegundos desde o anterior, tecla ou tipo da
+        operação, argumentos ou None, display esperado)
+
+    Raises:
+        ValueError: Se o arquivo não for uma gravação ou uma linha for inválida
+    """
+    with _open_recording(path, "r") as handle:
+        try:
+            header = json.loads(handle.readline() or "null")
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"Arquivo de gravação inválido: {path}")
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Versão de gravação não suportada: {header.get('version')}")
+
+        for line_number, line in enumerate(handle, start=2):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if len(record) == 3:
+                    yield int(record[0]), record[1], None, record[2]
+                elif len(record) == 4 and isinstance(record[2], dict):
+                    yield int(record[0]), record[1], record[2], record[3]
+                else:
+                    raise ValueError("quantidade de campos inesperada")
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Linha {line_number} inválida em {path}: {e}") from e
+
+
+def replay(path: str, controller: Optional[CalculatorController] = None,
+           verify: bool = True) -> Dict[str, Any]:
+    """
+    Reproduz uma gravação em um controlador, o mais rápido possível.
+
+    Os eventos são lidos antes da medição; o tempo informado cobre apenas as
+    chamadas ao controlador (e a conferência do display).
+
+    Args:
+        path: Arquivo da gravação
+        controller: Controlador que recebe os eventos (um novo por padrão)
+        verify: Se o display após cada evento deve ser comparado ao gravado
+
+    Returns:
+        Dict: events, keystrokes (teclas de process_input), operations,
+        mismatches (quantidade de divergências), first_mismatches (até
+        MAX_REPORTED_MISMATCHES, com event, input, expected e actual),
+        elapsed_seconds, keystrokes_per_second (eventos por segundo),
+        recorded_seconds (duração da sessão gravada) e speedup
+    """
+    events: List[Event] = list(read_recording(path))
+    controller = controller if controller is not None else CalculatorController()
+    process_input = controller.process_input
+    execute_operation = controller.execute_operation
+    get_current_display = controller.get_current_display
+
+    mismatches = 0
+    first_mismatches: List[Dict[str, Any]] = []
+    start = time.perf_counter()
+    for number, (_, name, kwargs, expected) in enumerate(events, start=1):
+        if kwargs is None:
+            display = process_input(name)
+        else:
+            execute_operation(name, **kwargs)
+            display = get_current_display()
+        if verify and display != expected:
+            mismatches += 1
+            if len(first_mismatches) < MAX_REPORTED_MISMATCHES:
+                first_mismatches.append({
+                    "event": number,
+                    "input": name if kwargs is None else {name: kwargs},
+                    "expected": expected,
+                    "actual": display
+                })
+    elapsed = time.perf_counter() - start
+
+    operations = sum(1 for event in events if event[2] is not None)
+    recorded = sum(event[0] for event in events) / 1_000_000
+    return {
+        "events": len(events),
+        "keystrokes": len(events) - operations,
+        "operations": operations,
+        "mismatches": mismatches,
+        "first_mismatches": first_mismatches,
+        "elapsed_seconds": elapsed,
+        "keystrokes_per_second": len(events) / elapsed if elapsed > 0 else 0.0,
+        "recorded_seconds": recorded,
+        "speedup": recorded / elapsed if elapsed > 0 else 0.0
+    }
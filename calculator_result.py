@@ -0,0 +1,119 @@
+"""
+Resultados de Cálculo da Calculadora Moderna
+
+Este módulo contém a classe CalculationResult, a resposta padronizada das
+operações do CalculatorEngine. Ela ocupa menos memória que um dicionário
+(__slots__), só formata o texto da fórmula quando ele é lido e continua
+acessível como dicionário (result["success"]) para manter compatibilidade.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+_KEYS = ("success", "result", "error_message", "formula_used", "operation_type")
+
+
+class CalculationResult:
+    """
+    Resposta de uma operação do motor de cálculo.
+
+    As instâncias devem ser tratadas como imutáveis: as respostas de erro
+    fixas são pré-construídas e compartilhadas entre chamadas.
+    """
+
+    __slots__ = ("success", "result", "error_message", "operation_type",
+                 "_formula", "_pending_formula")
+
+    def __init__(self, success: bool, result: Any = None,
+                 error_message: Optional[str] = None,
+                 formula: Optional[str] = None,
+                 formula_args: Optional[Tuple[Any, ...]] = None,
+                 operation_type: str = ""):
+        """
+        Inicializa o resultado.
+
+        Args:
+            success: Se a operação foi bem-sucedida
+            result: Resultado da operação
+            error_message: Mensagem de erro, se houver
+            formula: Fórmula utilizada, ou modelo str.format se formula_args
+                for informado
+            formula_args: Argumentos do modelo da fórmula (formatação adiada)
+            operation_type: Tipo da operação realizada
+        """
+        self.success = success
+        self.result = result
+        self.error_message = error_message
+        self.operation_type = operation_type
+        # Modelo e argumentos ainda não formatados, juntos em um único
+        # atributo para que leitores concorrentes nunca vejam um sem o outro
+        if formula_args is not None:
+            self._formula = None
+            self._pending_formula = (formula, formula_args)
+        else:
+            self._formula = formula
+            self._pending_formula = None
+
+    @property
+    def formula_used(self) -> Optional[str]:
+        """Fórmula utilizada no cálculo, formatada no primeiro acesso."""
+        pending = self._pending_formula
+        if pending is None:
+            return self._formula
+        # Respostas em cache são compartilhadas entre threads: a fórmula é
+        # formatada em uma variável local e publicada antes de o modelo ser
+        # descartado, então quem vê _pending_formula vazio já encontra o texto
+        formula = pending[0].format(*pending[1])
+        self._formula = formula
+        self._pending_formula = None
+        return formula
+
+    # Compatibilidade com a resposta em dicionário
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retorna o valor da chave ou o valor padrão."""
+        if key in _KEYS:
+            return getattr(self, key)
+        return default
+
+    def keys(self) -> Tuple[str, ...]:
+        """Retorna as chaves da resposta."""
+        return _KEYS
+
+    def values(self) -> List[Any]:
+        """Retorna os valores da resposta."""
+        return [getattr(self, key) for key in _KEYS]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Retorna os pares (chave, valor) da resposta."""
+        return [(key, getattr(self, key)) for key in _KEYS]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte a resposta para o dicionário equivalente."""
+        return {key: getattr(self, key) for key in _KEYS}
+
+    def __contains__(self, key: object) -> bool:
+        return key in _KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CalculationResult):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
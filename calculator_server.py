@@ -0,0 +1,364 @@
+"""
+Serviço JSON da Calculadora Moderna
+
+Este módulo expõe as operações do CalculatorEngine a vários clientes por um
+servidor asyncio (somente a biblioteca padrão) que fala JSON delimitado por
+linhas (NDJSON) sobre TCP: cada linha recebida é uma requisição e cada linha
+enviada é a resposta correspondente, na mesma ordem.
+
+Requisições:
+
+    {"id": 1, "op": "square_root", "args": [16]}
+    {"id": 2, "op": "trigonometric", "args": {"number": 30, "function": "cos"}}
+    {"id": 3, "op": "batch", "requests": [{"op": "circle_area", "args": [2]}, ...]}
+
+Respostas:
+
+    {"id": 1, "success": true, "result": 4.0, "error_message": null}
+    {"id": 3, "success": true, "results": [{...}, ...]}
+
+- Pipelining: o cliente pode enviar várias requisições sem esperar as
+  respostas; até max_pipeline respostas pendentes por conexão.
+- Concorrência limitada: no máximo max_concurrency requisições em lote são
+  processadas ao mesmo tempo (as demais aguardam), e cada lote cede o laço de
+  eventos periodicamente para não atrasar as outras conexões.
+- Contrapressão: quando a janela de pipelining está cheia ou o cliente não lê
+  as respostas, o servidor para de ler a conexão, e o TCP repassa a espera ao
+  cliente.
+
+run_load_test mede a vazão do servidor em localhost.
+Este módulo não depende do tkinter.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional, Set, Tuple, Union
+
+from calculator_engine import CalculatorEngine
+from calculator_stream import OPERATIONS
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_MAX_PIPELINE = 256
+DEFAULT_MAX_BATCH = 10000
+DEFAULT_MAX_LINE_BYTES = 1 << 20
+
+# Quantidade de operações de um lote processadas antes de ceder o laço de eventos
+BATCH_YIELD_EVERY = 256
+
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _error(request_id: Any, message: str) -> Dict[str, Any]:
+    return {"id": request_id, "success": False, "result": None, "error_message": message}
+
+
+class CalculatorServer:
+    """
+    Servidor NDJSON que compartilha um motor de cálculo entre os clientes.
+    """
+
+    def __init__(self, engine: Optional[CalculatorEngine] = None,
+                 host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_pipeline: int = DEFAULT_MAX_PIPELINE,
+                 max_batch: int = DEFAULT_MAX_BATCH,
+                 max_line_bytes: int = DEFAULT_MAX_LINE_BYTES):
+        """
+        Inicializa o servidor.
+
+        Args:
+            engine: Motor de cálculo compartilhado (um novo por padrão)
+            host: Endereço de escuta
+            port: Porta de escuta (0 = porta livre escolhida pelo sistema)
+            max_concurrency: Requisições em lote processadas ao mesmo tempo
+            max_pipeline: Respostas pendentes por conexão antes de parar de ler
+            max_batch: Quantidade máxima de operações em um lote
+            max_line_bytes: Tamanho máximo de uma linha de requisição
+        """
+        if max_concurrency < 1 or max_pipeline < 1:
+            raise ValueError("max_concurrency e max_pipeline devem ser pelo menos 1")
+        self.engine = engine if engine is not None else CalculatorEngine()
+        self.host = host
+        self.port = port
+        self.max_concurrency = max_concurrency
+        self.max_pipeline = max_pipeline
+        self.max_batch = max_batch
+        self.max_line_bytes = max_line_bytes
+        self._methods = {name: getattr(self.engine, name) for name in OPERATIONS}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._connections: Set["asyncio.Task[None]"] = set()
+        self.stats = {"connections": 0, "active_connections": 0, "requests": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Despacho
+    # ------------------------------------------------------------------
+
+    def execute(self, request: Any) -> Dict[str, Any]:
+        """
+        Executa uma requisição de operação (não lote).
+
+        Args:
+            request: Requisição decodificada ({"id", "op", "args"})
+
+        Returns:
+            Dict: Resposta (id, success, result, error_message)
+        """
+        self.stats["requests"] += 1
+        if not isinstance(request, dict):
+            self.stats["errors"] += 1
+            return _error(None, "Requisição deve ser um objeto JSON")
+        request_id = request.get("id")
+        operation = request.get("op")
+        # Valores não hashable (listas, objetos) não podem ser buscados no dicionário
+        method = self._methods.get(operation) if isinstance(operation, str) else None
+        if method is None:
+            self.stats["errors"] += 1
+            return _error(request_id, "Operação não reconhecida")
+
+        args = request.get("args", ())
+        try:
+            if isinstance(args, dict):
+                response = method(**args)
+            elif isinstance(args, list):
+                response = method(*args)
+            else:
+                raise TypeError("args deve ser uma lista ou um objeto")
+        except TypeError:
+            self.stats["errors"] += 1
+            return _error(request_id, f"Argumentos inválidos para {request['op']}")
+
+        if not response["success"]:
+            self.stats["errors"] += 1
+        return {
+            "id": request_id,
+            "success": response["success"],
+            "result": response["result"],
+            "error_message": response["error_message"]
+        }
+
+    async def execute_batch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa uma requisição em lote, respeitando o limite de concorrência.
+
+        Args:
+            request: Requisição {"id", "op": "batch", "requests": [...]}
+
+        Returns:
+            Dict: Resposta (id, success, results) ou erro
+        """
+        request_id = request.get("id")
+        items = request.get("requests")
+        if not isinstance(items, list):
+            self.stats["errors"] += 1
+            return _error(request_id, "requests deve ser uma lista")
+        if len(items) > self.max_batch:
+            self.stats["errors"] += 1
+            return _error(request_id, f"Lote maior que o limite de {self.max_batch} operações")
+
+        async with self._semaphore:
+            results = []
+            for index, item in enumerate(items, start=1):
+                results.append(self.execute(item))
+                if index % BATCH_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+        return {"id": request_id, "success": True, "results": results}
+
+    # ------------------------------------------------------------------
+    # Conexões
+    # ------------------------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Atende uma conexão: recebe requisições e envia as respostas na mesma ordem."""
+        self.stats["connections"] += 1
+        self.stats["active_connections"] += 1
+        # Respostas prontas (bytes) ou em andamento (tarefas de lote); a fila
+        # limitada é a janela de pipelining da conexão
+        pending: "asyncio.Queue[Union[bytes, asyncio.Future, None]]" = \
+            asyncio.Queue(self.max_pipeline)
+        sender = asyncio.ensure_future(self._send_responses(pending, writer))
+        receiver = asyncio.ensure_future(self._receive_requests(reader, pending))
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        try:
+            await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver.done():
+                # Fim das requisições: enviar o que falta, a menos que o envio falhe
+                closing = asyncio.ensure_future(pending.put(None))
+                await asyncio.wait({closing, sender}, return_when=asyncio.FIRST_COMPLETED)
+                closing.cancel()
+                await asyncio.wait({sender})
+        except asyncio.CancelledError:
+            # Encerramento pelo close(); a tarefa da conexão termina normalmente
+            # para o asyncio não registrar o cancelamento como erro
+            pass
+        finally:
+            for task in (sender, receiver):
+                task.cancel()
+                if task.done() and not task.cancelled():
+                    task.exception()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            self._connections.discard(connection)
+            self.stats["active_connections"] -= 1
+
+    async def _receive_requests(self, reader: asyncio.StreamReader, pending: asyncio.Queue):
+        """Lê as requisições; espera quando a janela de pipelining está cheia."""
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                self.stats["errors"] += 1
+                await pending.put(_encode(_error(None, "Linha maior que o limite")).encode() + b"\n")
+                return
+            except ConnectionError:
+                return
+            if not line:
+                return
+            if line.strip():
+                await pending.put(self._respond(line))
+
+    def _respond(self, line: bytes) -> Union[bytes, "asyncio.Future"]:
+        """Responde imediatamente a uma operação ou inicia o processamento de um lote."""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            self.stats["errors"] += 1
+            return _encode(_error(None, "JSON inválido")).encode() + b"\n"
+        if isinstance(request, dict) and request.get("op") == "batch":
+            return asyncio.ensure_future(self.execute_batch(request))
+        return _encode(self.execute(request)).encode() + b"\n"
+
+    async def _send_responses(self, pending: asyncio.Queue, writer: asyncio.StreamWriter):
+        """Envia as respostas na ordem das requisições."""
+        while True:
+            item = await pending.get()
+            if item is None:
+                return
+            if not isinstance(item, bytes):
+                item = _encode(await item).encode() + b"\n"
+            writer.write(item)
+            # Só espera quando o buffer de envio passa do limite (cliente lento)
+            await writer.drain()
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    async def start(self) -> Tuple[str, int]:
+        """
+        Começa a aceitar conexões.
+
+        Returns:
+            Tuple: (endereço, porta) efetivos
+        """
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=self.max_line_bytes
+        )
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def serve_forever(self):
+        """Inicia o servidor (se necessário) e atende até ser cancelado."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Para de aceitar conexões, encerra as conexões abertas e aguarda o fechamento."""
+        if self._server is not None:
+            self._server.close()
+            connections = list(self._connections)
+            for connection in connections:
+                connection.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+
+async def run_load_test(host: str, port: int, requests: int = 10000,
+                        connections: int = 4, pipeline: int = 100,
+                        request: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Mede a vazão de um servidor com várias conexões simultâneas.
+
+    Cada conexão envia janelas de pipeline requisições de uma vez e lê as
+    respostas antes de enviar a janela seguinte.
+
+    Args:
+        host: Endereço do servidor
+        port: Porta do servidor
+        requests: Total de requisições (divididas entre as conexões)
+        connections: Conexões simultâneas
+        pipeline: Requisições enviadas sem esperar respostas
+        request: Requisição enviada (padrão: raiz quadrada de 144)
+
+    Returns:
+        Dict: requests, errors, elapsed_seconds e requests_per_second
+    """
+    line = _encode(request or {"op": "square_root", "args": [144]}).encode() + b"\n"
+    errors = 0
+
+    async def client(count: int):
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            remaining = count
+            while remaining:
+                window = min(pipeline, remaining)
+                writer.write(line * window)
+                await writer.drain()
+                for _ in range(window):
+                    response = json.loads(await reader.readline())
+                    if not response["success"]:
+                        errors += 1
+                remaining -= window
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    shares = [requests // connections + (index < requests % connections)
+              for index in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(share) for share in shares if share))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": requests,
+        "errors": errors,
+        "elapsed_seconds": elapsed,
+        "requests_per_second": requests / elapsed if elapsed > 0 else 0.0
+    }
+
+
+async def serve_and_load_test(requests: int = 10000, connections: int = 4,
+                              pipeline: int = 100, **server_options) -> Dict[str, Any]:
+    """
+    Inicia um servidor em uma porta livre de localhost, executa run_load_test
+    contra ele e o encerra.
+
+    Args:
+        requests: Total de requisições
+        connections: Conexões simultâneas
+        pipeline: Requisições enviadas sem esperar respostas
+        **server_options: Argumentos de CalculatorServer
+
+    Returns:
+        Dict: Resultado de run_load_test
+    """
+    server_options.setdefault("port", 0)
+    server = CalculatorServer(**server_options)
+    host, port = await server.start()
+    try:
+        return await run_load_test(host, port, requests, connections, pipeline)
+    finally:
+        await server.close()
@@ -0,0 +1,263 @@
+"""
+Sessões da Calculadora Moderna
+
+Este módulo contém a classe SessionManager, que mantém um CalculatorController
+por sessão (por exemplo, por usuário de um serviço) em um único processo.
+
+- Todas as sessões compartilham o mesmo CalculatorEngine (e seu cache de
+  resultados) e o mesmo ExpressionCompiler (e seu cache de expressões); cada
+  controlador guarda apenas o seu estado e o seu histórico.
+- As sessões ficam em ordem de uso (LRU): ao atingir o limite de sessões, a
+  usada há mais tempo é encerrada, e sessões ociosas por mais de
+  idle_timeout segundos expiram.
+- Controladores de sessões encerradas voltam limpos para um pool e são
+  reaproveitados pelas próximas sessões, sem realocar estado e histórico.
+- memory_usage() estima a memória de cada sessão e do conjunto.
+
+Este módulo não depende do tkinter.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from calculator_controller import CalculatorController
+from calculator_engine import CalculatorEngine
+from calculator_expression import ExpressionCompiler
+
+
+DEFAULT_MAX_SESSIONS = 50000
+
+# Segundos sem uso até a sessão expirar
+DEFAULT_IDLE_TIMEOUT = 1800.0
+
+# Controladores limpos guardados para novas sessões
+DEFAULT_POOL_SIZE = 1024
+
+# Capacidade do cache de resultados do motor compartilhado
+DEFAULT_ENGINE_CACHE_SIZE = 4096
+
+
+class _Session:
+    """Controlador de uma sessão e o horário do último uso."""
+
+    __slots__ = ("controller", "last_used")
+
+    def __init__(self, controller: CalculatorController, last_used: float):
+        self.controller = controller
+        self.last_used = last_used
+
+
+class SessionManager:
+    """
+    Conjunto de sessões com um controlador cada, motor compartilhado e
+    remoção por LRU e por tempo ocioso.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+                 pool_size: int = DEFAULT_POOL_SIZE, history_size: int = 10,
+                 engine: Optional[CalculatorEngine] = None,
+                 expression_compiler: Optional[ExpressionCompiler] = None):
+        """
+        Inicializa o gerenciador.
+
+        Args:
+            max_sessions: Quantidade máxima de sessões abertas
+            idle_timeout: Segundos sem uso até a sessão expirar (None = não
+                expiram)
+            pool_size: Quantidade máxima de controladores guardados para
+                reaproveitamento
+            history_size: Capacidade do histórico de cada sessão
+            engine: Motor compartilhado (padrão: um novo, com cache de
+                resultados)
+            expression_compiler: Compilador compartilhado (padrão: um novo,
+                ligado ao motor)
+
+        Raises:
+            ValueError: Se algum limite for inválido
+        """
+        if max_sessions < 1:
+            raise ValueError("O limite de sessões deve ser pelo menos 1")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("O tempo ocioso deve ser positivo")
+        if pool_size < 0:
+            raise ValueError("O tamanho do pool não pode ser negativo")
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.pool_size = pool_size
+        self.history_size = history_size
+        self.engine = engine if engine is not None else CalculatorEngine(
+            cache_size=DEFAULT_ENGINE_CACHE_SIZE
+        )
+        self.expression_compiler = (
+            expression_compiler if expression_compiler is not None
+            else ExpressionCompiler(self.engine)
+        )
+        # Sessões da usada há mais tempo para a usada mais recentemente
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._pool: List[CalculatorController] = []
+        self.stats = {"created": 0, "reused": 0, "evicted": 0, "expired": 0, "closed": 0}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._sessions))
+
+    def get(self, session_id: str, now: Optional[float] = None) -> CalculatorController:
+        """
+        Retorna o controlador da sessão, abrindo a sessão se necessário.
+
+        Cada chamada conta como uso da sessão. Antes de abrir uma sessão, as
+        sessões ociosas expiram e, no limite de sessões, a usada há mais
+        tempo é encerrada.
+
+        Args:
+            session_id: Identificador da sessão
+            now: Horário atual em segundos (padrão: time.monotonic())
+
+        Returns:
+            CalculatorController: Controlador exclusivo da sessão
+        """
+        if now is None:
+            now = time.monotonic()
+        self.expire(now)
+
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_used = now
+            self._sessions.move_to_end(session_id)
+            return session.controller
+
+        if len(self._sessions) >= self.max_sessions:
+            _, evicted = self._sessions.popitem(last=False)
+            self._release(evicted.controller)
+            self.stats["evicted"] += 1
+
+        controller = self._acquire()
+        self._sessions[session_id] = _Session(controller, now)
+        return controller
+
+    def _acquire(self) -> CalculatorController:
+        if self._pool:
+            self.stats["reused"] += 1
+            return self._pool.pop()
+        self.stats["created"] += 1
+        return CalculatorController(
+            history_size=self.history_size, engine=self.engine,
+            expression_compiler=self.expression_compiler
+        )
+
+    def _release(self, controller: CalculatorController):
+        if len(self._pool) >= self.pool_size:
+            controller.close()
+            return
+        controller.reset()
+        if controller.max_history_size != self.history_size:
+            controller.max_history_size = self.history_size
+        self._pool.append(controller)
+
+    def close_session(self, session_id: str) -> bool:
+        """
+        Encerra uma sessão, devolvendo seu controlador ao pool.
+
+        Args:
+            session_id: Identificador da sessão
+
+        Returns:
+            bool: True se a sessão estava aberta
+        """
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        self._release(session.controller)
+        self.stats["closed"] += 1
+        return True
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Encerra as sessões ociosas há mais de idle_timeout segundos.
+
+        Como as sessões estão em ordem de uso, só as expiradas são visitadas.
+
+        Args:
+            now: Horário atual em segundos (padrão: time.monotonic())
+
+        Returns:
+            int: Quantidade de sessões expiradas
+        """
+        if self.idle_timeout is None:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        deadline = now - self.idle_timeout
+        sessions = self._sessions
+        expired = 0
+        while sessions:
+            session = next(iter(sessions.values()))
+            if session.last_used > deadline:
+                break
+            sessions.popitem(last=False)
+            self._release(session.controller)
+            expired += 1
+        self.stats["expired"] += expired
+        return expired
+
+    def close(self):
+        """Encerra todas as sessões e descarta o pool."""
+        for session in self._sessions.values():
+            session.controller.close()
+        for controller in self._pool:
+            controller.close()
+        self._sessions.clear()
+        self._pool.clear()
+
+    def session_memory(self, session_id: str) -> Dict[str, Any]:
+        """
+        Estima a memória de uma sessão (motor e compilador compartilhados
+        não entram na conta).
+
+        Args:
+            session_id: Identificador da sessão
+
+        Returns:
+            Dict: Bytes por componente, como em CalculatorController.memory_usage
+
+        Raises:
+            KeyError: Se a sessão não estiver aberta
+        """
+        return self._sessions[session_id].controller.memory_usage()
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Estima a memória das sessões abertas e do pool.
+
+        Percorre todas as sessões; indicado para monitoramento, não para cada
+        requisição.
+
+        Returns:
+            Dict: sessions, pooled, session_bytes, pooled_bytes,
+            bytes_per_session e largest_session (identificador e bytes da
+            sessão que mais ocupa memória)
+        """
+        session_bytes = 0
+        largest = (None, 0)
+        for session_id, session in self._sessions.items():
+            size = session.controller.memory_usage()["bytes"]
+            session_bytes += size
+            if size > largest[1]:
+                largest = (session_id, size)
+        pooled_bytes = sum(controller.memory_usage()["bytes"] for controller in self._pool)
+        sessions = len(self._sessions)
+        return {
+            "sessions": sessions,
+            "pooled": len(self._pool),
+            "session_bytes": session_bytes,
+            "pooled_bytes": pooled_bytes,
+            "bytes_per_session": session_bytes / sessions if sessions else 0.0,
+            "largest_session": {"session_id": largest[0], "bytes": largest[1]}
+        }
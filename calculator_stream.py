@@ -0,0 +1,226 @@
+"""
+Processamento em Lote de Arquivos CSV da Calculadora Moderna
+
+Este módulo implementa o modo de lote (--batch) do main.py: cada linha de um
+arquivo CSV descreve uma operação do CalculatorEngine, e o resultado é escrito
+em outro arquivo CSV. O processamento é um pipeline de geradores (ler,
+interpretar, despachar, formatar, escrever), portanto o consumo de memória é
+constante independentemente do tamanho do arquivo.
+
+Formato de entrada (cabeçalho opcional, começando por "operation"):
+
+    operation,arg1,arg2,arg3
+    basic_operation,2,3,+
+    trigonometric,30,sin,degrees
+    circle_area,2.5
+
+Formato de saída:
+
+    line,operation,arguments,success,result,error_message
+
+Este módulo não depende do tkinter.
+"""
+
+import csv
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from calculator_engine import CalculatorEngine
+
+
+# Operações aceitas: nome -> (mínimo, máximo) de argumentos posicionais
+OPERATIONS: Dict[str, Tuple[int, int]] = {
+    "basic_operation": (3, 3),
+    "percentage": (2, 2),
+    "square_root": (1, 1),
+    "trigonometric": (2, 3),
+    "degrees_to_radians": (1, 1),
+    "radians_to_degrees": (1, 1),
+    "circle_area": (1, 1),
+    "sphere_volume": (1, 1),
+    "is_even_odd": (1, 1),
+}
+
+OUTPUT_HEADER = ["line", "operation", "arguments", "success", "result", "error_message"]
+
+# Linha interpretada: (número da linha, operação, argumentos, erro de formato)
+ParsedRow = Tuple[int, str, List[str], Optional[str]]
+
+
+@contextmanager
+def open_text(path: str, mode: str) -> Iterator[TextIO]:
+    """
+    Abre um arquivo de texto para CSV.
+
+    Args:
+        path: Caminho do arquivo ("-" usa a entrada/saída padrão)
+        mode: Modo de abertura ("r" ou "w")
+
+    Returns:
+        Iterator: Gerenciador de contexto com o arquivo aberto
+    """
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+        return
+    with open(path, mode, newline="", encoding="utf-8") as handle:
+        yield handle
+
+
+def read_rows(handle: TextIO) -> Iterator[List[str]]:
+    """
+    Lê as linhas de um arquivo CSV.
+
+    Args:
+        handle: Arquivo de entrada aberto
+
+    Returns:
+        Iterator: Linhas do CSV como listas de strings
+    """
+    return csv.reader(handle)
+
+
+def parse_rows(rows: Iterable[List[str]], first_line: int = 1) -> Iterator[ParsedRow]:
+    """
+    Interpreta as linhas lidas, ignorando cabeçalho e linhas vazias.
+
+    Args:
+        rows: Linhas do CSV
+        first_line: Número da primeira linha recebida (para blocos de um
+            arquivo maior)
+
+    Returns:
+        Iterator: Tuplas (linha, operação, argumentos, erro_de_formato)
+    """
+    for line_number, row in enumerate(rows, start=first_line):
+        cells = [cell.strip() for cell in row]
+        while cells and not cells[-1]:
+            cells.pop()
+        if not cells:
+            continue
+        operation = cells[0]
+        if line_number == 1 and operation.lower() == "operation":
+            continue
+
+        args = cells[1:]
+        error = None
+        if operation not in OPERATIONS:
+            error = "Operação não reconhecida"
+        else:
+            minimum, maximum = OPERATIONS[operation]
+            if not minimum <= len(args) <= maximum:
+                error = f"Número de argumentos inválido para {operation}"
+        yield line_number, operation, args, error
+
+
+def evaluate_rows(engine: CalculatorEngine,
+                  parsed: Iterable[ParsedRow]) -> Iterator[Tuple[ParsedRow, Any]]:
+    """
+    Despacha cada linha interpretada para o método correspondente do motor.
+
+    Args:
+        engine: Motor de cálculo
+        parsed: Linhas interpretadas
+
+    Returns:
+        Iterator: Pares (linha_interpretada, resposta_ou_None)
+    """
+    methods = {name: getattr(engine, name) for name in OPERATIONS}
+    for row in parsed:
+        if row[3] is not None:
+            yield row, None
+        else:
+            yield row, methods[row[1]](*row[2])
+
+
+def format_rows(evaluated: Iterable[Tuple[ParsedRow, Any]]) -> Iterator[List[Any]]:
+    """
+    Converte as respostas do motor em linhas do CSV de saída.
+
+    Args:
+        evaluated: Pares (linha_interpretada, resposta_ou_None)
+
+    Returns:
+        Iterator: Linhas de saída no formato de OUTPUT_HEADER
+    """
+    for (line_number, operation, args, error), response in evaluated:
+        arguments = " ".join(args)
+        if response is None:
+            yield [line_number, operation, arguments, False, "", error]
+        elif response["success"]:
+            yield [line_number, operation, arguments, True, response["result"], ""]
+        else:
+            yield [line_number, operation, arguments, False, "", response["error_message"]]
+
+
+def write_rows(handle: TextIO, rows: Iterable[List[Any]],
+               header: bool = True) -> Tuple[int, int]:
+    """
+    Escreve as linhas de saída e contabiliza erros.
+
+    Args:
+        handle: Arquivo de saída aberto
+        rows: Linhas de saída
+        header: Se o cabeçalho deve ser escrito antes das linhas
+
+    Returns:
+        Tuple: (total de linhas escritas, total de linhas com erro)
+    """
+    writer = csv.writer(handle)
+    if header:
+        writer.writerow(OUTPUT_HEADER)
+    total = 0
+    errors = 0
+    for row in rows:
+        writer.writerow(row)
+        total += 1
+        if not row[3]:
+            errors += 1
+    return total, errors
+
+
+def run_batch(input_path: str, output_path: str,
+              engine: Optional[CalculatorEngine] = None) -> Dict[str, Any]:
+    """
+    Processa um arquivo CSV de operações em modo de streaming.
+
+    Args:
+        input_path: Caminho do CSV de entrada ("-" para a entrada padrão)
+        output_path: Caminho do CSV de saída ("-" para a saída padrão)
+        engine: Motor de cálculo (um novo por padrão)
+
+    Returns:
+        Dict: Estatísticas do processamento (rows, errors, elapsed_seconds,
+        rows_per_second)
+    """
+    engine = engine if engine is not None else CalculatorEngine()
+    start = time.perf_counter()
+
+    with open_text(input_path, "r") as source, open_text(output_path, "w") as target:
+        rows = format_rows(evaluate_rows(engine, parse_rows(read_rows(source))))
+        total, errors = write_rows(target, rows)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": total,
+        "errors": errors,
+        "elapsed_seconds": elapsed,
+        "rows_per_second": total / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """
+    Formata as estatísticas de um processamento em lote para exibição.
+
+    Args:
+        stats: Estatísticas retornadas por run_batch
+
+    Returns:
+        str: Resumo em uma linha
+    """
+    return (
+        f"{stats['rows']} linhas processadas em {stats['elapsed_seconds']:.3f}s "
+        f"({stats['rows_per_second']:.0f} linhas/s), {stats['errors']} com erro"
+    )
@@ -18,26 +18,20 @@ Funcionalidades principais:
 - Histórico de operações com timestamps
 - Feedback visual e tratamento robusto de erros
 - Interface moderna e responsiva
+- Processamento em lote de arquivos CSV (--batch), sem interface gráfica
+- Transformação de arquivos binários de float64 (--transform), sem interface gráfica
+- Modo sem interface gráfica (--headless) que nunca importa o tkinter
+- Serviço JSON em TCP (--serve) que compartilha o motor de cálculo entre clientes
+- Gravação das teclas de uma sessão (--record) e reprodução sem interface (--replay)
 """
 
+import argparse
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox
 
 # Adicionar o diretório atual ao path para importações
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from calculator_gui import CalculatorGUI
-except ImportError as e:
-    print(f"Erro ao importar módulos da calculadora: {e}")
-    print("Verifique se todos os arquivos estão no diretório correto:")
-    print("- calculator_gui.py")
-    print("- calculator_controller.py") 
-    print("- calculator_engine.py")
-    sys.exit(1)
-
 
 def check_dependencies():
     """
@@ -47,10 +41,9 @@ def check_dependencies():
         bool: True se todas as dependências estão OK, False caso contrário
     """
     try:
-        # Verificar se Tkinter está disponível
-        root = tk.Tk()
-        root.withdraw()  # Esconder janela temporária
-        root.destroy()
+        # Verificar se Tkinter está disponível (a janela principal é criada
+        # uma única vez pela interface; erros de exibição surgem como TclError)
+        import tkinter
         
         # Verificar módulos matemáticos
         import math
@@ -97,16 +90,31 @@ def show_startup_info():
     print("-" * 60)
 
 
-def main():
+def main(record_path=None):
     """
     Função principal para executar a Calculadora Moderna.
     
     Realiza verificações de dependências, inicializa a interface gráfica
     e executa a aplicação com tratamento completo de erros.
     
+    Args:
+        record_path: Arquivo onde gravar as teclas da sessão (None = não gravar)
+    
     Returns:
         int: Código de saída (0 = sucesso, 1 = erro)
     """
+    # A interface gráfica só é importada quando for realmente executada
+    try:
+        import tkinter as tk
+        from calculator_gui import CalculatorGUI
+    except ImportError as e:
+        print(f"Erro ao importar módulos da calculadora: {e}")
+        print("Verifique se todos os arquivos estão no diretório correto:")
+        print("- calculator_gui.py")
+        print("- calculator_controller.py") 
+        print("- calculator_engine.py")
+        return 1
+    
     try:
         # Verificar dependências
         if not check_dependencies():
@@ -119,12 +127,19 @@ def main():
         
         # Criar e executar a aplicação
         app = CalculatorGUI()
+        if record_path is not None:
+            app.controller.start_recording(record_path)
         
         print("✅ Calculadora iniciada com sucesso!")
         print("   Janela da aplicação aberta. Use Ctrl+C para encerrar.\n")
         
         # Executar loop principal da interface
-        app.run()
+        try:
+            app.run()
+        finally:
+            if record_path is not None:
+                events = app.controller.stop_recording()
+                print(f"⏺  {events} eventos gravados em {record_path}")
         
         print("\n👋 Calculadora encerrada. Obrigado por usar!")
         return 0
@@ -163,6 +178,257 @@ def main():
         return 1
 
 
+def run_batch_mode(args):
+    """
+    Executa o processamento em lote de um arquivo CSV, sem interface gráfica.
+    
+    Args:
+        args: Argumentos da linha de comando após "--batch"
+        
+    Returns:
+        int: Código de saída (0 = sucesso, 1 = erro)
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py --batch",
+        description="Processa um arquivo CSV de operações da calculadora."
+    )
+    parser.add_argument("input", help="CSV de entrada ('-' para stdin)")
+    parser.add_argument("--out", required=True, help="CSV de saída ('-' para stdout)")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Processos de cálculo (1 = processo único, 0 = número de CPUs)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=5000,
+        help="Linhas por bloco no modo paralelo"
+    )
+    options = parser.parse_args(args)
+    
+    from calculator_stream import format_stats, run_batch
+    
+    try:
+        if options.workers == 1:
+            stats = run_batch(options.input, options.out)
+        else:
+            from calculator_parallel import run_parallel_batch
+            stats = run_parallel_batch(
+                options.input, options.out,
+                workers=options.workers,
+                chunk_size=options.chunk_size
+            )
+    except (OSError, ValueError) as e:
+        print(f"❌ Erro ao acessar arquivo: {e}", file=sys.stderr)
+        return 1
+    
+    print(f"✅ {format_stats(stats)}", file=sys.stderr)
+    return 0
+
+
+def run_transform_mode(args):
+    """
+    Aplica uma operação unária a um arquivo binário de float64, sem interface gráfica.
+    
+    Args:
+        args: Argumentos da linha de comando após "--transform"
+        
+    Returns:
+        int: Código de saída (0 = sucesso, 1 = erro)
+    """
+    from calculator_mmap import DEFAULT_CHUNK_ELEMENTS, TRANSFORM_OPERATIONS, transform_file
+    from calculator_registry import TRIGONOMETRIC_FUNCTIONS
+    
+    parser = argparse.ArgumentParser(
+        prog="main.py --transform",
+        description="Aplica uma operação a um arquivo binário de float64."
+    )
+    parser.add_argument("input", help="Arquivo binário de entrada (float64)")
+    parser.add_argument("--out", required=True, help="Arquivo binário de saída")
+    parser.add_argument("--operation", required=True, choices=TRANSFORM_OPERATIONS)
+    parser.add_argument(
+        "--function", default="sin", choices=list(TRIGONOMETRIC_FUNCTIONS),
+        help="Função da operação trigonometric"
+    )
+    parser.add_argument(
+        "--unit", default="degrees", choices=['radians', 'degrees'],
+        help="Unidade da operação trigonometric"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_ELEMENTS,
+        help="Valores por bloco"
+    )
+    options = parser.parse_args(args)
+    
+    try:
+        stats = transform_file(
+            options.input, options.out, options.operation,
+            function=options.function, unit=options.unit,
+            chunk_elements=options.chunk_size
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ Erro ao acessar arquivo: {e}", file=sys.stderr)
+        return 1
+    
+    print(
+        f"✅ {stats['elements']} valores processados em {stats['elapsed_seconds']:.3f}s "
+        f"({stats['elements_per_second']:.0f} valores/s), {stats['errors']} com erro",
+        file=sys.stderr
+    )
+    return 0
+
+
+def run_headless_mode(args):
+    """
+    Executa a calculadora sem interface gráfica, lendo operações da entrada padrão.
+    
+    Args:
+        args: Argumentos da linha de comando após "--headless"
+        
+    Returns:
+        int: Código de saída (0 = sucesso, 1 = erro)
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py --headless",
+        description="Executa operações da calculadora sem interface gráfica."
+    )
+    parser.add_argument(
+        "--check-startup", action="store_true",
+        help="Mede a inicialização a frio e verifica o orçamento"
+    )
+    options = parser.parse_args(args)
+    
+    from calculator_headless import measure_cold_start, run_headless
+    
+    if options.check_startup:
+        stats = measure_cold_start()
+        status = "✅" if stats["within_budget"] else "❌"
+        print(
+            f"{status} Inicialização a frio: {stats['seconds'] * 1000:.1f} ms "
+            f"(orçamento: {stats['budget_seconds'] * 1000:.0f} ms)"
+        )
+        return 0 if stats["within_budget"] and not stats["tkinter_loaded"] else 1
+    
+    run_headless(sys.stdin, sys.stdout)
+    return 0
+
+
+def run_serve_mode(args):
+    """
+    Executa o serviço JSON (NDJSON sobre TCP) da calculadora.
+    
+    Args:
+        args: Argumentos da linha de comando após "--serve"
+        
+    Returns:
+        int: Código de saída (0 = sucesso, 1 = erro)
+    """
+    import asyncio
+    from calculator_server import (
+        DEFAULT_HOST, DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_PIPELINE, DEFAULT_PORT,
+        CalculatorServer, serve_and_load_test
+    )
+    
+    parser = argparse.ArgumentParser(
+        prog="main.py --serve",
+        description="Atende operações da calculadora em JSON delimitado por linhas."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+        help="Requisições em lote processadas ao mesmo tempo"
+    )
+    parser.add_argument(
+        "--max-pipeline", type=int, default=DEFAULT_MAX_PIPELINE,
+        help="Respostas pendentes por conexão antes de parar de ler"
+    )
+    parser.add_argument(
+        "--load-test", type=int, metavar="N",
+        help="Sobe o servidor em uma porta livre, envia N requisições e mostra a vazão"
+    )
+    parser.add_argument("--connections", type=int, default=4,
+                        help="Conexões simultâneas do teste de carga")
+    parser.add_argument("--pipeline", type=int, default=100,
+                        help="Requisições enviadas sem esperar respostas no teste de carga")
+    options = parser.parse_args(args)
+    server_options = {
+        "max_concurrency": options.max_concurrency,
+        "max_pipeline": options.max_pipeline
+    }
+    
+    if options.load_test is not None:
+        stats = asyncio.run(serve_and_load_test(
+            options.load_test, options.connections, options.pipeline, **server_options
+        ))
+        print(
+            f"✅ {stats['requests']} requisições em {stats['elapsed_seconds']:.3f}s "
+            f"({stats['requests_per_second']:.0f} req/s), {stats['errors']} com erro",
+            file=sys.stderr
+        )
+        return 0
+    
+    server = CalculatorServer(host=options.host, port=options.port, **server_options)
+    
+    async def serve():
+        host, port = await server.start()
+        print(f"✅ Atendendo em {host}:{port} (Ctrl+C para encerrar)", file=sys.stderr)
+        await server.serve_forever()
+    
+    try:
+        asyncio.run(serve())
+    except OSError as e:
+        print(f"❌ Não foi possível iniciar o servidor: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\n👋 Servidor encerrado.", file=sys.stderr)
+    return 0
+
+
+def run_replay_mode(args):
+    """
+    Reproduz uma gravação de sessão em um controlador sem interface.
+    
+    Args:
+        args: Argumentos da linha de comando após "--replay"
+        
+    Returns:
+        int: Código de saída (0 = sucesso, 1 = divergências ou erro)
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py --replay",
+        description="Reproduz uma sessão gravada com --record e mede as teclas por segundo."
+    )
+    parser.add_argument("recording", help="Arquivo gravado (.log ou .log.gz)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Quantidade de reproduções (cada uma em um controlador novo)")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="Não compara o display com o gravado")
+    options = parser.parse_args(args)
+    
+    from calculator_replay import replay
+    
+    failed = False
+    for _ in range(max(1, options.repeat)):
+        try:
+            stats = replay(options.recording, verify=not options.no_verify)
+        except (OSError, ValueError) as e:
+            print(f"❌ Erro ao reproduzir a gravação: {e}", file=sys.stderr)
+            return 1
+        print(
+            f"{'❌' if stats['mismatches'] else '✅'} {stats['events']} eventos em "
+            f"{stats['elapsed_seconds'] * 1000:.1f} ms "
+            f"({stats['keystrokes_per_second']:.0f} teclas/s, "
+            f"{stats['speedup']:.0f}x a sessão gravada), "
+            f"{stats['mismatches']} divergências"
+        )
+        for mismatch in stats["first_mismatches"]:
+            print(
+                f"   evento {mismatch['event']} {mismatch['input']}: esperado "
+                f"{mismatch['expected']!r}, obtido {mismatch['actual']!r}"
+            )
+        failed = failed or stats["mismatches"] > 0
+    return 1 if failed else 0
+
+
 def show_help():
     """
     Exibe informações de ajuda sobre como usar a aplicação.
@@ -174,6 +440,23 @@ USO:
     python main.py              # Executar a calculadora
     python main.py --help       # Mostrar esta ajuda
     python main.py --version    # Mostrar versão
+    python main.py --batch ENTRADA.csv --out SAIDA.csv
+                                # Processar operações em lote (sem GUI)
+        [--workers N] [--chunk-size M]
+                                # Lote em N processos (0 = todas as CPUs)
+    python main.py --headless   # Operações pela entrada padrão (sem GUI)
+        [--check-startup]       # Medir a inicialização a frio
+    python main.py --transform ENTRADA.bin --out SAIDA.bin --operation OP
+                                # Aplicar OP a um arquivo de float64 (sem GUI)
+        [--function sin] [--unit degrees] [--chunk-size N]
+    python main.py --serve      # Serviço JSON em TCP (sem GUI)
+        [--host H] [--port P] [--max-concurrency N] [--max-pipeline N]
+        [--load-test N]         # Medir a vazão em localhost
+    python main.py --record SESSAO.log
+                                # Executar a calculadora gravando as teclas
+    python main.py --replay SESSAO.log
+                                # Reproduzir a gravação sem GUI e medir teclas/s
+        [--repeat N] [--no-verify]
 
 REQUISITOS:
     - Python 3.7 ou superior
@@ -217,6 +500,21 @@ if __name__ == "__main__":
         elif arg in ['--version', '-v', 'version']:
             print("Calculadora Moderna v1.0.0")
             sys.exit(0)
+        elif arg == '--batch':
+            sys.exit(run_batch_mode(sys.argv[2:]))
+        elif arg == '--headless':
+            sys.exit(run_headless_mode(sys.argv[2:]))
+        elif arg == '--transform':
+            sys.exit(run_transform_mode(sys.argv[2:]))
+        elif arg == '--serve':
+            sys.exit(run_serve_mode(sys.argv[2:]))
+        elif arg == '--replay':
+            sys.exit(run_replay_mode(sys.argv[2:]))
+        elif arg == '--record':
+            if len(sys.argv) < 3:
+                print("Informe o arquivo da gravação: --record SESSAO.log")
+                sys.exit(1)
+            sys.exit(main(record_path=sys.argv[2]))
         else:
             print(f"Argumento desconhecido: {sys.argv[1]}")
             print("Use --help para ver as opções disponíveis.")
@@ -0,0 +1,44 @@
+"""
+Testes da suíte de benchmarks da calculadora
+"""
+
+from benchmark_calculator import (
+    BENCHMARKS, compare_results, load_results, main, run_benchmarks,
+    save_results, select_benchmarks
+)
+
+def test_every_engine_method_has_benchmark():
+    """Testa que cada método público do motor é medido"""
+    names = select_benchmarks(["engine.*"])
+    for method in ["basic_operation", "percentage", "square_root", "trigonometric",
+                   "degrees_to_radians", "radians_to_degrees", "circle_area",
+                   "sphere_volume", "is_even_odd"]:
+        assert f"engine.{method}[str]" in names
+        assert f"engine.{method}[float]" in names
+    assert select_benchmarks(["history.*", "controller.process_input[*]"])
+    
+    print("✓ Teste de cobertura dos benchmarks passou!")
+
+def test_run_and_compare(tmp_path):
+    """Testa a execução, a gravação em JSON e a comparação com referência"""
+    names = select_benchmarks(["engine.square_root[*]", "history.add"])
+    results = run_benchmarks(names, repeat=2, min_time=0.001)
+    assert set(results["results"]) == set(names)
+    assert all(item["best_ns"] > 0 for item in results["results"].values())
+    
+    path = tmp_path / "referencia.json"
+    save_results(results, str(path))
+    baseline = load_results(str(path))
+    assert not any(item["regression"] for item in compare_results(baseline, baseline))
+    
+    # Referência 2x mais rápida deve ser acusada como regressão
+    for item in baseline["results"].values():
+        item["best_ns"] /= 2
+    comparisons = compare_results(results, baseline, threshold=0.10)
+    assert len(comparisons) == len(names)
+    assert all(item["regression"] for item in comparisons)
+    assert main(["history.add", "--repeat", "2", "--min-time", "0.001",
+                 "--baseline", str(path), "--threshold", "100"]) == 0
+    assert len(BENCHMARKS) > len(names)
+    
+    print("✓ Teste da execução de benchmarks passou!")
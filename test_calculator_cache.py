@@ -0,0 +1,62 @@
+"""
+Testes do cache de resultados do CalculatorEngine
+"""
+
+from calculator_cache import ResultCache
+from calculator_engine import CalculatorEngine
+
+def test_engine_memoization():
+    """Testa a memorização das funções puras do motor"""
+    engine = CalculatorEngine(cache_size=8)
+    
+    # "16", 16 e 16.0 compartilham a mesma entrada
+    first = engine.square_root("16")
+    assert engine.square_root(16) is first
+    assert engine.square_root(16.0) is first
+    
+    engine.trigonometric(30, 'sin')
+    engine.trigonometric(30, 'sin', 'degrees')
+    engine.circle_area(-1)
+    engine.circle_area(-1)
+    
+    stats = engine.get_cache_stats()
+    print(f"Estatísticas do cache = {stats}")
+    assert stats["operations"]["square_root"] == {"hits": 2, "misses": 1, "evictions": 0}
+    assert stats["operations"]["trigonometric"]["hits"] == 1
+    assert stats["operations"]["circle_area"]["hits"] == 1
+    assert stats["size"] == 3
+    
+    # Redimensionar e limpar em tempo de execução
+    engine.resize_cache(1)
+    assert engine.get_cache_stats()["size"] == 1
+    engine.clear_cache()
+    assert engine.get_cache_stats()["size"] == 0
+    
+    engine.disable_cache()
+    assert engine.get_cache_stats() is None
+    assert engine.square_root(16)['result'] == 4
+    
+    print("✓ Testes de memorização passaram!")
+
+def test_eviction_policies():
+    """Testa as políticas de remoção LRU e LFU"""
+    lru = ResultCache(capacity=2, policy="lru")
+    lru.put(("op", 1), "a")
+    lru.put(("op", 2), "b")
+    lru.get(("op", 1))
+    lru.put(("op", 3), "c")
+    assert lru.get(("op", 2)) is None
+    assert lru.get(("op", 1)) == "a"
+    
+    lfu = ResultCache(capacity=2, policy="lfu")
+    lfu.put(("op", 1), "a")
+    lfu.put(("op", 2), "b")
+    lfu.get(("op", 2))
+    lfu.get(("op", 1))
+    lfu.get(("op", 1))
+    lfu.put(("op", 3), "c")
+    assert lfu.get(("op", 2)) is None
+    assert lfu.get(("op", 3)) == "c"
+    assert lfu.stats()["operations"]["op"]["evictions"] == 1
+    
+    print("✓ Testes das políticas de remoção passaram!")
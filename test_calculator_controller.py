@@ -0,0 +1,108 @@
+"""
+Testes do controlador seguro para várias threads
+"""
+
+import threading
+
+from calculator_controller import (
+    CalculatorController, StateSnapshot, ThreadSafeCalculatorController
+)
+
+def test_state_snapshot():
+    """Testa a cópia imutável do estado"""
+    controller = CalculatorController()
+    for key in ["1", "2", "+", "3"]:
+        controller.process_input(key)
+    snapshot = controller.get_state_snapshot()
+    print(f"Estado = {snapshot}")
+    assert snapshot == StateSnapshot("3", "12", "+", False, "", "3")
+
+    controller.process_input("=")
+    assert snapshot.display_value == "3"
+    assert controller.get_state_snapshot().last_operation == "12 + 3 = 15"
+
+    print("✓ Teste de cópia do estado passou!")
+
+def test_thread_safe_sequences():
+    """Testa operações de várias threads sem perder entradas do histórico"""
+    threads_count = 8
+    rounds = 200
+    controller = ThreadSafeCalculatorController(history_size=threads_count * rounds * 2)
+    errors = []
+
+    def worker(index: int):
+        for _ in range(rounds):
+            # Uma sequência de teclas de outra thread pode se intercalar com
+            # esta, mas cada tecla é aplicada por inteiro
+            controller.process_input(str(index + 1))
+            controller.process_input("+")
+            controller.process_input("1")
+            controller.process_input("=")
+            result = controller.execute_operation("square_root", number=index * index)
+            if result != str(index):
+                errors.append(result)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summary = controller.get_history_summary()
+    print(f"Resumo = {summary['total_operations']} operações")
+    assert not errors
+    assert summary["operations"]["square_root"]["total"] == threads_count * rounds
+    assert controller.get_history_count() == summary["total_operations"]
+    assert len(controller.get_formatted_history()) == controller.get_history_count()
+
+    print("✓ Teste de sequências concorrentes passou!")
+
+def test_lock_free_reads():
+    """Testa que as leituras do display não esperam a trava de escrita"""
+    controller = ThreadSafeCalculatorController()
+    controller.process_input("7")
+    displays = []
+
+    with controller._lock:
+        # Outra thread consegue ler enquanto a trava está com esta thread
+        reader = threading.Thread(target=lambda: displays.append(
+            (controller.get_current_display(), controller.get_last_operation())
+        ))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+    assert displays == [("7", "")]
+    controller.process_input("C")
+    assert controller.get_state_snapshot() == CalculatorController().get_state_snapshot()
+
+    print("✓ Teste de leituras sem trava passou!")
+
+def test_snapshot_consistency():
+    """Testa que os leitores nunca veem um estado pela metade"""
+    controller = ThreadSafeCalculatorController()
+    stop = threading.Event()
+    torn = []
+
+    def writer():
+        while not stop.is_set():
+            for key in ["9", "+", "1", "="]:
+                controller.process_input(key)
+
+    def reader():
+        while not stop.is_set():
+            snapshot = controller.get_state_snapshot()
+            # Depois de "=" o display é "10" e a última operação termina em 10
+            if snapshot.display_value == "10" and not snapshot.last_operation.endswith("= 10"):
+                torn.append(snapshot)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    stop.wait(0.3)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert not torn
+    print("✓ Teste de consistência das cópias passou!")
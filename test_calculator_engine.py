@@ -2,7 +2,15 @@
 Testes básicos para verificar o funcionamento do CalculatorEngine
 """
 
+import math
+import operator
+import threading
+
+import calculator_batch
+from calculator_coercion import EMPTY, INVALID_FORMAT, INVALID_TYPE, OUT_OF_RANGE, parse_number
 from calculator_engine import CalculatorEngine
+from calculator_registry import BINARY_OPERATORS, TRIGONOMETRIC_FUNCTIONS
+from calculator_result import CalculationResult
 
 def test_basic_operations():
     """Testa operações básicas do motor de cálculo"""
@@ -70,7 +78,191 @@ def test_advanced_functions():
     
     print("✓ Testes de funções avançadas passaram!")
 
+def test_number_coercion():
+    """Testa a camada única de conversão numérica"""
+    engine = CalculatorEngine()
+    
+    # "16", 16 e 16.0 produzem o mesmo resultado; vírgula decimal é aceita
+    for value in ["16", 16, 16.0]:
+        assert engine.square_root(value)['result'] == 4
+    result = engine.basic_operation("2,5", "0,5", '+')
+    assert result['success'] == True
+    assert result['result'] == 3
+    
+    assert parse_number(7) == 7.0
+    assert parse_number("") is EMPTY
+    assert parse_number("abc") is INVALID_FORMAT
+    assert parse_number(None) is INVALID_TYPE
+    assert parse_number(10 ** 400) is OUT_OF_RANGE
+    assert engine.basic_operation(10 ** 400, 1, '+')['success'] == False
+    
+    print("✓ Testes de conversão numérica passaram!")
+
+def test_calculation_result():
+    """Testa o objeto de resultado compacto e compatível com dicionário"""
+    engine = CalculatorEngine()
+    
+    result = engine.basic_operation(2, 3, '+')
+    assert result == {
+        "success": True,
+        "result": 5,
+        "error_message": None,
+        "formula_used": "2.0 + 3.0",
+        "operation_type": "basic_operation"
+    }
+    assert dict(result)["formula_used"] == "2.0 + 3.0"
+    assert result.get("inexistente", "padrão") == "padrão"
+    
+    # Erros fixos são respostas pré-construídas e compartilhadas
+    first = engine.basic_operation(1, 0, '/')
+    second = engine.basic_operation(5, 0, '/')
+    assert first is second
+    assert first['error_message'] == "Erro: Divisão por zero não é permitida"
+    
+    # A fórmula adiada é formatada uma única vez, mesmo com leitores em
+    # várias threads (um argumento com chaves quebraria uma segunda formatação)
+    for _ in range(200):
+        shared = CalculationResult(True, 5, formula="{} + {}", formula_args=("{0}", 3.0))
+        seen = []
+        readers = [threading.Thread(target=lambda: seen.append(shared.formula_used))
+                   for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        assert seen == ["{0} + 3.0"] * 4
+    
+    print("✓ Testes do objeto de resultado passaram!")
+
+def test_basic_operation_batch():
+    """Testa a versão em lote das operações básicas"""
+    engine = CalculatorEngine()
+    
+    # Teste de divisão com divisão por zero e entrada inválida no lote
+    result = engine.basic_operation_batch([10, 1, 7, "x"], [4, 3, 0, 2], '/')
+    print(f"Lote de divisões = {result}")
+    assert result['success'] == True
+    values = list(result['result'])
+    assert values[0] == 2.5
+    assert values[1] == 0.3333333333
+    assert math.isnan(values[2])
+    assert list(result['error_mask']) == [
+        calculator_batch.BATCH_OK,
+        calculator_batch.BATCH_OK,
+        calculator_batch.BATCH_DIVISION_BY_ZERO,
+        calculator_batch.BATCH_INVALID_INPUT,
+    ]
+    assert result['error_count'] == 2
+    
+    # Teste de broadcast de escalar
+    result = engine.basic_operation_batch([1, 2, 3], 10, '*')
+    assert list(result['result']) == [10, 20, 30]
+    
+    # Teste de operador inválido
+    result = engine.basic_operation_batch([1], [2], '^')
+    assert result['success'] == False
+    assert result['error_mask'] is None and result['error_count'] == 0
+    result = engine.basic_operation_batch([1, 2], [1, 2, 3], '+')
+    assert result['success'] == False and result['error_count'] == 0
+    for result in (engine.trigonometric_batch([1], 'sec'),
+                   engine.trigonometric_batch([1], 'sin', 'grados')):
+        assert result['success'] == False
+        assert result['error_mask'] is None and result['error_count'] == 0
+    
+    # O lote aceita os mesmos operadores do cálculo escalar
+    BINARY_OPERATORS['//'] = operator.floordiv
+    try:
+        result = engine.basic_operation_batch([7, 7], [2, 0], '//')
+        assert result['success'] == True
+        assert result['result'][0] == engine.basic_operation(7, 2, '//')['result']
+        assert result['error_mask'][1] == calculator_batch.BATCH_DIVISION_BY_ZERO
+    finally:
+        del BINARY_OPERATORS['//']
+    assert engine.basic_operation_batch([7], [2], '//')['success'] == False
+    
+    print("✓ Testes de operações em lote passaram!")
+
+def test_trigonometric_batch():
+    """Testa a versão em lote das funções trigonométricas"""
+    engine = CalculatorEngine()
+    
+    result = engine.trigonometric_batch([0, 30, 90, "abc"], 'sin', 'degrees')
+    print(f"sin em lote = {result}")
+    assert result['success'] == True
+    assert list(result['result'])[:3] == [0, 0.5, 1]
+    assert result['error_mask'][3] == calculator_batch.BATCH_INVALID_INPUT
+    
+    # Tangente próxima da assíntota é reportada na máscara
+    result = engine.trigonometric_batch([45, 90], 'tan', 'degrees')
+    assert result['result'][0] == 1
+    assert result['error_mask'][1] == calculator_batch.BATCH_NEAR_POLE
+    assert result['error_count'] == 1
+    
+    # Mesmo resultado do cálculo escalar
+    single = engine.trigonometric(1.2, 'cos', 'radians')
+    result = engine.trigonometric_batch([1.2], 'cos', 'radians')
+    assert result['result'][0] == single['result']
+    
+    # O lote usa a mesma tabela de funções do cálculo escalar
+    TRIGONOMETRIC_FUNCTIONS['asin'] = math.asin
+    try:
+        single = engine.trigonometric(0.5, 'asin', 'radians')
+        result = engine.trigonometric_batch([0.5, 2], 'asin', 'radians')
+        assert result['success'] == True
+        assert result['result'][0] == single['result']
+        assert result['error_mask'][1] == calculator_batch.BATCH_CALCULATION_ERROR
+    finally:
+        del TRIGONOMETRIC_FUNCTIONS['asin']
+    assert engine.trigonometric_batch([0.5], 'asin', 'radians')['success'] == False
+    
+    print("✓ Testes trigonométricos em lote passaram!")
+
+def test_batch_numpy_parity():
+    """Testa que os lotes com e sem NumPy validam as entradas da mesma forma"""
+    engine = CalculatorEngine()
+    columns = [
+        [1, None, "x", 4],
+        [2.5, [1, 2], {"a": 1}, "3"],
+        None,
+        object(),
+    ]
+    
+    def run_all():
+        outputs = []
+        for column in columns:
+            for result in (engine.basic_operation_batch(column, 2, '*'),
+                           engine.trigonometric_batch(column, 'cos', 'radians')):
+                assert result['success'] == True
+                values = [None if math.isnan(v) else v for v in result['result']]
+                outputs.append((values, list(result['error_mask'])))
+        return outputs
+    
+    with_numpy = run_all()
+    saved = calculator_batch.np, calculator_batch._numpy_checked
+    calculator_batch.np, calculator_batch._numpy_checked = None, True
+    try:
+        without_numpy = run_all()
+    finally:
+        calculator_batch.np, calculator_batch._numpy_checked = saved
+    
+    print(f"Lote sem NumPy = {without_numpy[0]}")
+    assert with_numpy == without_numpy
+    assert without_numpy[0] == ([2.0, None, None, 8.0], [
+        calculator_batch.BATCH_OK,
+        calculator_batch.BATCH_INVALID_INPUT,
+        calculator_batch.BATCH_INVALID_INPUT,
+        calculator_batch.BATCH_OK,
+    ])
+    assert without_numpy[4] == ([None], [calculator_batch.BATCH_INVALID_INPUT])
+    
+    print("✓ Teste de paridade dos lotes com e sem NumPy passou!")
+
 if __name__ == "__main__":
     test_basic_operations()
     test_advanced_functions()
+    test_number_coercion()
+    test_calculation_result()
+    test_basic_operation_batch()
+    test_trigonometric_batch()
+    test_batch_numpy_parity()
     print("\n✓ Todos os testes passaram! Motor de cálculo funcionando corretamente.")
\ No newline at end of file
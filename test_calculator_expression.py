@@ -0,0 +1,93 @@
+"""
+Testes do compilador de expressões
+"""
+
+import pytest
+
+from calculator_controller import CalculatorController
+from calculator_expression import ExpressionCompiler, ExpressionError
+
+def test_precedence_and_functions():
+    """Testa precedência, parênteses, menos unário e funções do motor"""
+    compiler = ExpressionCompiler()
+    
+    assert compiler.evaluate("2 + 3 * 4") == 14
+    assert compiler.evaluate("(2 + 3) * 4") == 20
+    assert compiler.evaluate("-2 * -(3 - 5)") == -4
+    assert compiler.evaluate("sqrt(16) + sin(30)") == 4.5
+    assert compiler.evaluate("circle_area(1)") == 3.1415926536
+    assert compiler.evaluate("percentage(200, 10) / 4") == 5
+    assert compiler.evaluate("1 ÷ 4 × 2") == 0.5
+    
+    print("✓ Testes de precedência e funções passaram!")
+
+def test_variables_and_cache():
+    """Testa reavaliação com variáveis e estatísticas do cache"""
+    compiler = ExpressionCompiler(cache_size=2)
+    
+    formula = compiler.compile("x * x + y")
+    assert formula.variables == frozenset({"x", "y"})
+    assert [formula(x=i, y=1) for i in range(3)] == [1, 2, 5]
+    
+    # Mesmo texto normalizado reutiliza a expressão compilada
+    assert compiler.compile("x*x + y") is formula
+    assert compiler.cache_info()["hits"] == 1
+    assert compiler.cache_info()["misses"] == 1
+    
+    # Cache LRU limitado
+    compiler.compile("1 + 1")
+    compiler.compile("2 + 2")
+    assert compiler.cache_info()["size"] == 2
+    assert compiler.compile("x * x + y") is not formula
+    
+    print("✓ Testes de variáveis e cache passaram!")
+
+def test_errors():
+    """Testa erros de sintaxe e de cálculo"""
+    compiler = ExpressionCompiler()
+    
+    for expression in ["2 +", "(1 + 2", "foo(1)", "sqrt(1, 2)", "2 $ 3", ""]:
+        with pytest.raises(ExpressionError):
+            compiler.compile(expression)
+    
+    with pytest.raises(ExpressionError, match="Divisão por zero"):
+        compiler.evaluate("1 / (2 - 2)")
+    with pytest.raises(ExpressionError, match="negativo"):
+        compiler.evaluate("sqrt(x)", x=-4)
+    with pytest.raises(ExpressionError, match="Variável não definida"):
+        compiler.evaluate("x + 1")
+    
+    print("✓ Testes de erros passaram!")
+
+def test_controller_evaluate_expression():
+    """Testa a avaliação de expressões pelo controlador"""
+    controller = CalculatorController()
+    
+    assert controller.evaluate_expression("2 + 3 * 4") == "14"
+    assert controller.get_current_display() == "14"
+    assert controller.evaluate_expression("1 / 0").startswith("Erro")
+    assert controller.get_current_display() == "Erro"
+    assert len(controller.get_history()) == 2
+    
+    print("✓ Testes do controlador passaram!")
+
+def test_deep_nesting():
+    """Testa que expressões aninhadas ou longas demais viram erros da expressão"""
+    compiler = ExpressionCompiler()
+    
+    for expression in ["-" * 3000 + "1", "(" * 3000 + "1" + ")" * 3000,
+                       "sqrt(" * 500 + "16" + ")" * 500]:
+        with pytest.raises(ExpressionError, match="aninhada demais"):
+            compiler.evaluate(expression)
+    # Cadeias longas sem aninhamento são compiladas e avaliadas em laço
+    assert compiler.evaluate("+".join(["x"] * 5000), x=1) == 5000
+    assert compiler.evaluate("-".join(["1"] * 5000)) == -4998
+    assert compiler.evaluate("2*3+" + "+".join(["x*2/4"] * 3000), x=2) == 3006
+    assert compiler.evaluate("1+2+3+x-4", x=1) == 3
+    assert compiler.evaluate("(" * 50 + "-" * 40 + "2" + ")" * 50) == 2
+    
+    controller = CalculatorController()
+    assert controller.evaluate_expression("(" * 3000 + "1").startswith("Erro")
+    assert controller.get_current_display() == "Erro"
+    
+    print("✓ Testes de aninhamento passaram!")
@@ -0,0 +1,39 @@
+"""
+Testes do modo sem interface gráfica da calculadora
+"""
+
+import io
+
+from calculator_headless import measure_cold_start, run_headless
+
+def test_run_headless():
+    """Testa a execução de expressões e operações linha a linha"""
+    source = io.StringIO(
+        "2 + 3 * sqrt(16)\n"
+        "\n"
+        "# comentário\n"
+        "square_root number=-4\n"
+        "trigonometric number=60 function=cos\n"
+        "circle_area 2\n"
+    )
+    target = io.StringIO()
+    assert run_headless(source, target) == 4
+    
+    lines = target.getvalue().splitlines()
+    print(f"Saída = {lines}")
+    assert lines[0] == "14"
+    assert lines[1] == "Erro: Raiz quadrada de número negativo não é permitida"
+    assert lines[2] == "0.5"
+    assert lines[3].startswith("Erro: argumento inválido")
+    
+    print("✓ Teste do modo sem interface passou!")
+
+def test_cold_start_budget():
+    """Testa que a inicialização a frio não carrega tkinter/NumPy e cabe no orçamento"""
+    stats = measure_cold_start()
+    print(f"Inicialização a frio = {stats}")
+    assert not stats["tkinter_loaded"]
+    assert not stats["numpy_loaded"]
+    assert stats["within_budget"]
+    
+    print("✓ Teste da inicialização a frio passou!")
@@ -0,0 +1,422 @@
+"""
+Testes do histórico de operações da calculadora
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from calculator_controller import CalculatorController
+from calculator_history import ColumnarHistory, RingHistory, ThroughputMeter
+from calculator_history_export import export_chunks, export_history, import_history, read_history
+from calculator_history_sqlite import SQLiteHistory, _query_sql
+
+def test_ring_history():
+    """Testa inserção, descarte, janelas e redimensionamento do buffer circular"""
+    history = RingHistory(capacity=4)
+    evicted = [history.append(value) for value in range(6)]
+    assert evicted == [None, None, None, None, 0, 1]
+    assert list(history) == [2, 3, 4, 5]
+    assert history[0] == 2 and history[-1] == 5
+    
+    # Janelas com a semântica de fatias, inclusive sobre a volta do buffer
+    assert history.window() == [2, 3, 4, 5]
+    assert history.window(-2) == [4, 5]
+    assert history.window(1, 3) == [3, 4]
+    assert history.window(3, 1) == []
+    with pytest.raises(IndexError):
+        history[4]
+    
+    assert history.resize(2) == [2, 3]
+    assert list(history) == [4, 5]
+    history.resize(5)
+    history.append(6)
+    assert list(history) == [4, 5, 6]
+    assert history.capacity == 5
+    
+    history.clear()
+    assert len(history) == 0 and not history
+    with pytest.raises(ValueError):
+        RingHistory(0)
+    
+    print("✓ Teste do buffer circular passou!")
+
+def test_controller_history_window():
+    """Testa o histórico grande do controlador e as consultas por janela"""
+    controller = CalculatorController(history_size=100000)
+    for value in range(100010):
+        controller._add_to_history(f"op {value}", str(value), value % 2 == 0)
+    
+    assert len(controller.history) == 100000
+    assert controller.get_history(0, 1)[0]["operation"] == "op 10"
+    last = controller.get_history(-3)
+    assert [entry["result"] for entry in last] == ["100007", "100008", "100009"]
+    formatted = controller.get_formatted_history(-2)
+    assert formatted[0].endswith("op 100008 = 100008")
+    assert formatted[1].endswith("op 100009 = Erro: 100009")
+    
+    # Capacidade alterada em tempo de execução
+    controller.max_history_size = 10
+    assert len(controller.get_history()) == 10
+    assert controller.get_history_summary()["max_history_size"] == 10
+    assert controller.get_history()[-1]["result"] == "100009"
+    
+    print("✓ Teste do histórico do controlador passou!")
+
+def test_columnar_history():
+    """Testa o histórico em colunas contra o histórico de dicionários"""
+    ring = RingHistory(capacity=1000)
+    columnar = ColumnarHistory(capacity=1000)
+    for value in range(25000):
+        timestamp = 1700000000.0 + value
+        operation = f"√{value}" if value % 7 else "sin(30°)"
+        result = str(value) if value % 5 else "Erro: inválido"
+        ring.add(operation, result, value % 5 != 0, timestamp)
+        evicted = columnar.add(operation, result, value % 5 != 0, timestamp)
+    
+    assert evicted["operation"] == "√23999"
+    assert len(columnar) == len(ring) == 1000
+    assert columnar.window() == ring.window()
+    assert columnar.window(-3, -1) == ring.window(-3, -1)
+    assert columnar[0] == ring[0] and columnar[-1] == ring[-1]
+    assert list(columnar) == list(ring)
+    
+    assert columnar.resize(10) == ring.resize(10)
+    assert columnar.window() == ring.window()
+    columnar.clear()
+    assert len(columnar) == 0 and columnar.window() == []
+    
+    print("✓ Teste do histórico em colunas passou!")
+
+def test_history_memory_per_entry():
+    """Testa que o histórico em colunas ocupa muito menos memória por entrada"""
+    ring = RingHistory(capacity=100000)
+    columnar = ColumnarHistory(capacity=100000)
+    for value in range(100000):
+        ring.add(f"{value} + 1", str(value + 1), True)
+        columnar.add(f"{value} + 1", str(value + 1), True)
+    
+    ring_bytes = ring.memory_usage()["bytes_per_entry"]
+    columnar_bytes = columnar.memory_usage()["bytes_per_entry"]
+    print(f"Bytes por entrada: dicionários = {ring_bytes:.1f}, colunas = {columnar_bytes:.1f}")
+    assert columnar_bytes * 5 < ring_bytes
+    
+    controller = CalculatorController(history_size=100, compact_history=True)
+    controller.execute_operation("square_root", number="16")
+    assert controller.get_formatted_history()[0].endswith("√16 = 4")
+    
+    print("✓ Teste de memória do histórico passou!")
+
+def test_sqlite_history(tmp_path):
+    """Testa o histórico persistente em SQLite"""
+    path = str(tmp_path / "historico.db")
+    controller = CalculatorController(history_path=path)
+    assert controller.max_history_size is None
+    controller.execute_operation("square_root", number="16")
+    controller.execute_operation("square_root", number="-1")
+    for key in ["2", "+", "3", "="]:
+        controller.process_input(key)
+    controller.evaluate_expression("2 * sqrt(9)")
+    
+    summary = controller.get_history_summary()
+    print(f"Resumo = {summary}")
+    assert summary["total_operations"] == 4
+    assert summary["failed_operations"] == 1
+    assert controller.history.summary()["operations"]["square_root"] == {"successful": 1, "failed": 1}
+    assert controller.get_history()[0]["operation"] == "√16"
+    assert controller.get_history(-1)[0]["operation_type"] == "expression"
+    assert controller.get_formatted_history(2, 3)[0].endswith("2 + 3 = 5")
+    controller.close()
+    
+    # Os dados persistem entre processos/instâncias
+    with SQLiteHistory(path, capacity=3, batch_size=7) as history:
+        assert len(history) == 4
+        for value in range(20):
+            history.add(f"op {value}", str(value), value % 2 == 0, operation_type="basic_operation")
+        assert len(history) == 3
+        assert [entry["result"] for entry in history] == ["17", "18", "19"]
+        assert history[-1]["result"] == "19" and history[0]["result"] == "17"
+        assert history.summary()["failed"] == 2
+        
+        evicted = history.resize(1)
+        assert [entry["result"] for entry in evicted] == ["17", "18"]
+        history.resize(None)
+        assert history.set_capacity(None) == 0
+        history.clear()
+        assert len(history) == 0 and history.summary()["last_timestamp"] is None
+    
+    # Reduzir a capacidade pelo controlador não lê as entradas descartadas
+    controller = CalculatorController(history_path=str(tmp_path / "reduzir.db"))
+    events = []
+    controller.add_history_listener(events.append)
+    for value in range(10):
+        controller.execute_operation("square_root", number=value)
+    controller.history.window = None
+    controller.max_history_size = 4
+    assert controller.get_history_count() == 4 == len(controller.history)
+    assert events[-1] == {"type": "evicted", "count": 6}
+    assert controller.history.set_capacity(4) == 0
+    controller.close()
+    
+    print("✓ Teste do histórico em SQLite passou!")
+
+def test_sqlite_writer_connect_error(tmp_path, monkeypatch):
+    """Testa que a falha ao abrir a conexão de gravação não bloqueia flush()"""
+    connect = sqlite3.connect
+
+    def failing_connect(*args, **kwargs):
+        if threading.current_thread().name == "calculator-history-writer":
+            raise sqlite3.OperationalError("unable to open database file")
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", failing_connect)
+    history = SQLiteHistory(str(tmp_path / "historico.db"))
+    with pytest.raises(sqlite3.OperationalError):
+        history.flush()
+    with pytest.raises(sqlite3.OperationalError):
+        history.add("√16", "4", True)
+    with pytest.raises(sqlite3.OperationalError):
+        len(history)
+    history.close()
+
+    print("✓ Teste de falha na conexão de gravação passou!")
+
+def test_history_events_and_formatted_cache():
+    """Testa os eventos de alteração e o cache de linhas formatadas"""
+    controller = CalculatorController(history_size=3)
+    controller.execute_operation("square_root", number="1")
+    
+    events = []
+    controller.add_history_listener(events.append)
+    for number in ["4", "9", "-1"]:
+        controller.execute_operation("square_root", number=number)
+    print(f"Eventos = {events}")
+    assert [event["type"] for event in events] == ["appended", "appended", "evicted", "appended"]
+    assert events[-2]["count"] == 1
+    assert events[-1]["lines"][0].startswith("[") and "√-1 = Erro: " in events[-1]["lines"][0]
+    
+    # As linhas em cache são iguais às formatadas a partir das entradas
+    from calculator_controller import format_history_entry
+    expected = [format_history_entry(entry) for entry in controller.get_history()]
+    assert controller.get_formatted_history() == expected
+    assert controller.get_formatted_history(-2, -1) == expected[1:2]
+    assert controller.get_history_count() == 3
+    
+    controller.max_history_size = 1
+    controller.clear_history()
+    assert events[-2:] == [{"type": "evicted", "count": 2}, {"type": "cleared"}]
+    
+    controller.remove_history_listener(events.append)
+    controller.execute_operation("square_root", number="16")
+    assert len(events) == 6
+    assert controller.get_formatted_history()[0].endswith("√16 = 4")
+    
+    # Janelas anteriores ao cache são formatadas a partir do armazenamento
+    controller = CalculatorController(history_size=5000, compact_history=True)
+    for index in range(3000):
+        controller._add_to_history(f"{index} + 1", str(index + 1), True)
+    lines = controller.get_formatted_history(1000, 2100)
+    assert len(lines) == 1100
+    assert lines[0].endswith("1000 + 1 = 1001") and lines[-1].endswith("2099 + 1 = 2100")
+    
+    print("✓ Teste dos eventos e do cache do histórico passou!")
+
+def test_running_summary():
+    """Testa as contagens mantidas a cada inserção e a taxa de operações"""
+    for compact in (False, True):
+        controller = CalculatorController(history_size=4, compact_history=compact)
+        for number in ["4", "-1", "9"]:
+            controller.execute_operation("square_root", number=number)
+        for key in ["8", "/", "0", "=", "1", "+", "1", "="]:
+            controller.process_input(key)
+        
+        summary = controller.get_history_summary()
+        print(f"Resumo = {summary}")
+        # √4 foi descartado pelo limite de 4 entradas
+        assert summary["total_operations"] == 4
+        assert summary["failed_operations"] == 2
+        assert summary["error_rate"] == 0.5
+        assert summary["operations"]["square_root"] == {
+            "total": 2, "successful": 1, "failed": 1, "error_rate": 0.5
+        }
+        assert summary["operations"]["basic_operation"]["failed"] == 1
+        assert summary["operations_per_second"] == 5 / summary["throughput_window_seconds"]
+        
+        controller.max_history_size = 1
+        assert controller.get_history_summary()["operations"] == {
+            "basic_operation": {"total": 1, "successful": 1, "failed": 0, "error_rate": 0.0}
+        }
+        controller.clear_history()
+        summary = controller.get_history_summary()
+        assert summary["total_operations"] == 0 and summary["operations"] == {}
+        assert summary["error_rate"] == 0.0
+    
+    meter = ThroughputMeter(window=10.0, buckets=10)
+    for timestamp in [100.0, 100.5, 105.2, 109.9]:
+        meter.record(timestamp)
+    assert meter.rate(now=109.9) == 0.4
+    assert meter.rate(now=110.5) == 0.2
+    assert meter.rate(now=130.0) == 0.0
+    
+    print("✓ Teste do resumo incremental do histórico passou!")
+
+def test_query_history(tmp_path):
+    """Testa a consulta com filtros em todos os armazenamentos do histórico"""
+    operations = ["square_root", "expression", "basic_operation"]
+    histories = [
+        RingHistory(capacity=300),
+        ColumnarHistory(capacity=300),
+        SQLiteHistory(str(tmp_path / "consulta.db"), capacity=300, batch_size=32)
+    ]
+    for history in histories:
+        for index in range(400):
+            history.add(f"op {index}", str(index), index % 7 != 0,
+                        timestamp=1000.0 + index, operation_type=operations[index % 3])
+    
+    def expected(entries, start=None, end=None, operation_type=None, success=None, contains=None):
+        return [
+            entry["result"] for entry in entries
+            if (start is None or entry["timestamp"].timestamp() >= start)
+            and (end is None or entry["timestamp"].timestamp() < end)
+            and (operation_type is None or entry["operation_type"] == operation_type)
+            and (success is None or entry["success"] == success)
+            and (contains is None or contains in entry["operation"])
+        ]
+    
+    filters = [
+        {},
+        {"start": 1150.0, "end": 1200.0},
+        {"operation_type": "expression"},
+        {"operation_type": "expression", "success": False, "start": 1200.0},
+        {"success": False},
+        {"contains": "op 12"},
+        {"operation_type": "inexistente"},
+    ]
+    for history in histories:
+        entries = list(history)
+        assert len(entries) == 300
+        for options in filters:
+            result = [entry["result"] for entry in history.query(
+                start_time=options.get("start"), end_time=options.get("end"),
+                operation_type=options.get("operation_type"),
+                success=options.get("success"), contains=options.get("contains")
+            )]
+            assert result == expected(entries, **options), (type(history), options)
+        
+        page = [entry["result"] for entry in history.query(success=True, limit=5, offset=10)]
+        assert page == expected(entries, success=True)[10:15]
+    histories[2].close()
+    
+    # O iterador é preguiçoso e continua válido se o histórico mudar: cobre as
+    # entradas existentes na consulta e pula as descartadas depois dela
+    controller = CalculatorController(history_size=5)
+    for number in ["1", "4", "9"]:
+        controller.execute_operation("square_root", number=number)
+    results = controller.query_history(operation_type="square_root")
+    assert next(results)["result"] == "1"
+    for number in ["16", "25", "36", "49"]:
+        controller.execute_operation("square_root", number=number)
+    assert [entry["result"] for entry in results] == ["3"]
+    assert len(list(controller.query_history(success=True, limit=2))) == 2
+    
+    print("✓ Teste da consulta ao histórico passou!")
+
+def test_query_from_entry_timestamp(tmp_path):
+    """Testa que a consulta a partir do horário de uma entrada a inclui"""
+    histories = [
+        RingHistory(capacity=500),
+        ColumnarHistory(capacity=500),
+        SQLiteHistory(str(tmp_path / "horarios.db"), batch_size=64)
+    ]
+    for history in histories:
+        # Horários com frações abaixo de um microssegundo
+        for index in range(500):
+            history.add(f"op {index}", str(index), True, timestamp=1714558530.0 + index * 0.0012345678)
+        entries = list(history)
+        skipped = sum(
+            1 for position, entry in enumerate(entries)
+            if len(list(history.query(start_time=entry["timestamp"]))) != 500 - position
+            or len(list(history.query(end_time=entry["timestamp"]))) != position
+        )
+        print(f"{type(history).__name__}: {skipped} entradas puladas")
+        assert skipped == 0
+    histories[2].close()
+    
+    print("✓ Teste da consulta a partir do horário de uma entrada passou!")
+
+def test_sqlite_query_plan(tmp_path):
+    """Testa que as consultas do SQLite paginam pelos índices, sem ordenação temporária"""
+    with SQLiteHistory(str(tmp_path / "plano.db"), batch_size=4) as history:
+        # Várias entradas com o mesmo horário atravessam as páginas
+        for index in range(30):
+            history.add(f"op {index}", str(index), index % 2 == 0,
+                        timestamp=1000.0 + index // 5, operation_type="square_root")
+        results = [entry["result"] for entry in history.query(success=True)]
+        assert results == [str(index) for index in range(0, 30, 2)]
+        
+        filters = [
+            (["timestamp >= ?", "timestamp < ?"], (1001.0, 1003.0), "history_timestamp"),
+            (["operation_type = ?"], ("square_root",), "history_type"),
+            (["success = ?"], (1,), "history_success"),
+        ]
+        for conditions, parameters, index in filters:
+            for keyset in ([], ["(timestamp, id) > (?, ?)"]):
+                sql = _query_sql(conditions + keyset)
+                arguments = parameters + (1000.0, 0) * bool(keyset) + (10, 0)
+                plan = " | ".join(row[3] for row in history._reader.execute(
+                    "EXPLAIN QUERY PLAN " + sql, arguments
+                ))
+                print(f"Plano = {plan}")
+                assert f"USING INDEX {index}" in plan
+                assert "TEMP B-TREE" not in plan
+    
+    print("✓ Teste do plano das consultas em SQLite passou!")
+
+def test_export_and_import_history(tmp_path):
+    """Testa a exportação em blocos e a importação do histórico"""
+    controller = CalculatorController(history_size=50)
+    for index in range(60):
+        controller.execute_operation("square_root", number=str(index - 5))
+    controller.evaluate_expression('2 * "x"')
+    controller.evaluate_expression("1 + 1")
+    entries = controller.get_history()
+    
+    for name in ["historico.csv", "historico.jsonl", "historico.csv.gz", "historico.jsonl.gz"]:
+        path = str(tmp_path / name)
+        stats = export_history(controller, path, chunk_rows=7)
+        print(f"{name}: {stats}")
+        assert stats["rows"] == 50
+        assert list(read_history(path)) == entries
+        
+        restored = CalculatorController(history_size=100)
+        assert import_history(restored, path)["rows"] == 50
+        assert restored.get_history() == entries
+        assert restored.get_history_summary()["failed_operations"] == \
+            controller.get_history_summary()["failed_operations"]
+    
+    # Filtros de query_history limitam a exportação
+    path = str(tmp_path / "erros.jsonl")
+    assert export_history(controller, path, success=False)["rows"] == 1
+    assert [entry["success"] for entry in read_history(path)] == [False]
+    
+    # Os blocos têm no máximo chunk_rows linhas (mais o cabeçalho no CSV)
+    chunks = list(export_chunks(iter(entries), "jsonl", chunk_rows=20))
+    assert [chunk.count("\n") for chunk in chunks] == [20, 20, 10]
+    
+    with pytest.raises(ValueError):
+        export_history(controller, str(tmp_path / "historico.txt"))
+    
+    # Entradas anteriores às já registradas quebrariam a ordem de horário
+    older = str(tmp_path / "antigas.jsonl")
+    export_history(controller, older)
+    live = CalculatorController(history_size=100)
+    for index in range(5):
+        live.execute_operation("square_root", number=str(index))
+    with pytest.raises(ValueError, match="fora de ordem"):
+        import_history(live, older)
+    assert live.get_history_count() == 5
+    live.clear_history()
+    assert import_history(live, older)["rows"] == 50
+    
+    print("✓ Teste da exportação e importação do histórico passou!")
@@ -0,0 +1,74 @@
+"""
+Testes da instrumentação do CalculatorEngine
+"""
+
+from calculator_engine import CalculatorEngine
+from calculator_instrumentation import LatencyHistogram
+
+def test_latency_histogram():
+    """Testa os baldes no estilo HDR e os percentis"""
+    histogram = LatencyHistogram(precision_bits=5)
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+    
+    summary = histogram.summary()
+    print(f"Resumo = {summary}")
+    assert summary["count"] == 1000
+    assert summary["min_ns"] == 1000
+    assert summary["max_ns"] == 1000000
+    assert summary["mean_ns"] == 500500
+    # Erro relativo limitado pela precisão dos baldes
+    assert abs(histogram.percentile(50) - 500000) <= 500000 / 16
+    assert abs(histogram.percentile(99) - 990000) <= 990000 / 16
+    assert histogram.percentile(100) == 1000000
+    
+    counts = [count for _, _, count in histogram.buckets()]
+    assert sum(counts) == 1000
+    assert len(counts) < 200
+    for low, high, _ in histogram.buckets():
+        assert low <= high
+    
+    histogram.clear()
+    assert histogram.summary()["count"] == 0
+    
+    print("✓ Teste do histograma de latências passou!")
+
+def test_engine_instrumentation():
+    """Testa contadores, erros, hooks e a desativação da instrumentação"""
+    engine = CalculatorEngine()
+    assert engine.get_instrumentation_stats() is None
+    
+    instrumentation = engine.enable_instrumentation()
+    events = []
+    instrumentation.add_pre_hook(lambda op, args, kwargs: events.append(("pre", op)))
+    post = instrumentation.add_post_hook(
+        lambda op, args, kwargs, response, elapsed: events.append(("post", op, response["success"]))
+    )
+    
+    engine.square_root(16)
+    engine.square_root(-1)
+    engine.basic_operation(1, 0, '/')
+    engine.trigonometric(30, 'sin')
+    
+    stats = engine.get_instrumentation_stats()
+    print(f"Estatísticas = {stats}")
+    assert stats["square_root"]["calls"] == 2
+    assert stats["square_root"]["errors"] == 1
+    assert stats["square_root"]["error_rate"] == 0.5
+    assert stats["basic_operation"]["errors"] == 1
+    assert stats["trigonometric"]["latency"]["count"] == 1
+    assert "circle_area" not in stats
+    assert events[:2] == [("pre", "square_root"), ("post", "square_root", True)]
+    assert len(events) == 8
+    
+    instrumentation.remove_hook(post)
+    engine.circle_area(1)
+    assert events[-1] == ("pre", "circle_area")
+    
+    # Desativada, a instância volta a usar os métodos da classe
+    engine.disable_instrumentation()
+    assert "square_root" not in vars(engine)
+    assert engine.get_instrumentation_stats() is None
+    assert engine.square_root(16)["result"] == 4.0
+    
+    print("✓ Teste da instrumentação do motor passou!")
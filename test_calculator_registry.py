@@ -0,0 +1,74 @@
+"""
+Testes do registro de operações da calculadora
+"""
+
+import pytest
+
+from calculator_controller import CalculatorController
+from calculator_engine import CalculatorEngine
+from calculator_registry import (
+    BINARY_OPERATORS, OPERATIONS, create_default_registry, from_current
+)
+
+def test_default_operations():
+    """Testa o despacho das operações padrão pelo registro"""
+    controller = CalculatorController()
+    assert controller.operations is OPERATIONS
+    
+    controller.process_input("9")
+    assert controller.execute_operation("square_root") == "3"
+    assert controller.get_history()[-1]["operation"] == "√9"
+    
+    assert controller.execute_operation("trigonometric", number="90", unit="degrees") == "1"
+    assert controller.get_history()[-1]["operation"] == "sin(90°)"
+    
+    # Porcentagem usa o valor anterior e descarta a operação pendente
+    controller.clear_all()
+    for key in ["2", "0", "0", "+", "1", "0"]:
+        controller.process_input(key)
+    assert controller.execute_operation("percentage") == "20"
+    assert controller.state.operator == ""
+    assert controller.get_history()[-1]["operation"] == "10% de 200"
+    
+    assert controller.execute_operation("circle_area", radius="-1").startswith("Erro")
+    assert controller.execute_operation("desconhecida") == "Operação não reconhecida"
+    
+    print("✓ Teste das operações padrão passou!")
+
+def test_register_operation():
+    """Testa o registro de novas operações sem alterar o controlador"""
+    registry = create_default_registry()
+    registry.register(
+        "double",
+        handler=lambda engine, number: engine.basic_operation(number, 2, '*'),
+        parameters=(("number", from_current),),
+        describe=lambda number: f"2 × {number}"
+    )
+    with pytest.raises(ValueError):
+        registry.register("square_root")
+    
+    controller = CalculatorController(operations=registry)
+    controller.process_input("2")
+    controller.process_input("1")
+    assert controller.execute_operation("double") == "42"
+    assert controller.get_history()[-1]["operation"] == "2 × 21"
+    assert "double" not in OPERATIONS
+    
+    registry.unregister("double")
+    assert controller.execute_operation("double") == "Operação não reconhecida"
+    
+    print("✓ Teste do registro de operações passou!")
+
+def test_engine_operator_table():
+    """Testa operadores registrados na tabela do motor"""
+    engine = CalculatorEngine()
+    assert engine.basic_operation(1, 0, '/')["error_message"] == "Erro: Divisão por zero não é permitida"
+    assert engine.basic_operation(2, 3, '^')["success"] is False
+    
+    BINARY_OPERATORS['^'] = pow
+    try:
+        assert engine.basic_operation(2, 10, '^')["result"] == 1024
+    finally:
+        del BINARY_OPERATORS['^']
+    
+    print("✓ Teste da tabela de operadores passou!")
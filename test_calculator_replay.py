@@ -0,0 +1,105 @@
+"""
+Testes da gravação e reprodução de sessões da calculadora
+"""
+
+import json
+
+import pytest
+
+from calculator_controller import CalculatorController, ThreadSafeCalculatorController
+from calculator_replay import read_recording, replay
+
+def _record_session(controller: CalculatorController, path: str) -> int:
+    controller.start_recording(path)
+    for key in ["1", "2", "+", "3", "=", "C", "9", "/", "0", "=", "x", "C"]:
+        controller.process_input(key)
+    controller.process_input("1")
+    controller.process_input("6")
+    controller.execute_operation("square_root")
+    controller.execute_operation("trigonometric", number=30, function="sin")
+    controller.execute_operation("square_root", number="-4")
+    return controller.stop_recording()
+
+def test_record_and_replay(tmp_path):
+    """Testa a gravação e a reprodução com conferência do display"""
+    for name in ["sessao.log", "sessao.log.gz"]:
+        path = str(tmp_path / name)
+        assert _record_session(CalculatorController(), path) == 17
+
+        events = list(read_recording(path))
+        assert events[4][1:] == ("=", None, "15")
+        assert events[14][1:] == ("square_root", {}, "4")
+        assert events[15][2] == {"number": 30, "function": "sin"}
+        assert all(event[0] >= 0 for event in events)
+
+        stats = replay(path)
+        print(f"Reprodução de {name} = {stats}")
+        assert stats["events"] == 17 and stats["operations"] == 3
+        assert stats["keystrokes"] == 14
+        assert stats["mismatches"] == 0 and stats["keystrokes_per_second"] > 0
+
+    print("✓ Teste de gravação e reprodução passou!")
+
+def test_replay_mismatch(tmp_path):
+    """Testa o relatório de divergências do display"""
+    path = tmp_path / "sessao.log"
+    _record_session(CalculatorController(), str(path))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    event = json.loads(lines[5])
+    event[-1] = "16"
+    lines[5] = json.dumps(event)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    stats = replay(str(path))
+    assert stats["mismatches"] == 1
+    assert stats["first_mismatches"] == [
+        {"event": 5, "input": "=", "expected": "16", "actual": "15"}
+    ]
+    assert replay(str(path), verify=False)["mismatches"] == 0
+
+    print("✓ Teste de divergências passou!")
+
+def test_invalid_recording(tmp_path):
+    """Testa arquivos que não são gravações válidas"""
+    path = tmp_path / "outro.log"
+    path.write_text('{"format": "csv"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="gravação inválido"):
+        list(read_recording(str(path)))
+
+    path.write_text('{"format": "calculator-keystrokes", "version": 1}\n[1, "7"]\n',
+                    encoding="utf-8")
+    with pytest.raises(ValueError, match="Linha 2"):
+        list(read_recording(str(path)))
+
+    print("✓ Teste de gravação inválida passou!")
+
+def test_thread_safe_recording(tmp_path):
+    """Testa a gravação de um controlador seguro para várias threads"""
+    path = str(tmp_path / "sessao.log")
+    controller = ThreadSafeCalculatorController()
+    assert _record_session(controller, path) == 17
+    assert controller.stop_recording() == 0
+    assert replay(path, controller=ThreadSafeCalculatorController())["mismatches"] == 0
+
+    print("✓ Teste de gravação com várias threads passou!")
+
+def test_toggle_sign_recorded(tmp_path):
+    """Testa que a troca de sinal é gravada e reproduzida como tecla"""
+    path = str(tmp_path / "sessao.log")
+    controller = CalculatorController()
+    controller.start_recording(path)
+    displays = [controller.process_input(key) for key in ["±", "7", "±", "*", "2", "=", "±", "±"]]
+    assert controller.stop_recording() == 8
+    print(f"Displays = {displays}")
+    assert displays == ["0", "7", "-7", "-7", "2", "-14", "14", "-14"]
+
+    events = list(read_recording(path))
+    assert events[2][1:] == ("±", None, "-7")
+    assert replay(path)["mismatches"] == 0
+
+    controller.process_input("/")
+    controller.process_input("0")
+    error = controller.process_input("=")
+    assert controller.process_input("±") == error
+
+    print("✓ Teste de gravação da troca de sinal passou!")
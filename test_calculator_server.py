@@ -0,0 +1,115 @@
+"""
+Testes do serviço JSON da calculadora
+"""
+
+import asyncio
+import json
+
+from calculator_server import CalculatorServer, serve_and_load_test
+
+def test_execute():
+    """Testa o despacho das requisições para o motor"""
+    server = CalculatorServer()
+    assert server.execute({"id": 7, "op": "square_root", "args": [16]}) == {
+        "id": 7, "success": True, "result": 4, "error_message": None
+    }
+    response = server.execute({"op": "trigonometric", "args": {"number": 30, "function": "cos"}})
+    assert response["result"] == 0.8660254038
+    assert not server.execute({"op": "square_root", "args": [-1]})["success"]
+    assert server.execute({"op": "exec", "args": []})["error_message"] == "Operação não reconhecida"
+    assert server.execute({"op": "square_root", "args": [1, 2]})["error_message"] == \
+        "Argumentos inválidos para square_root"
+    assert server.execute([1, 2])["error_message"] == "Requisição deve ser um objeto JSON"
+    assert server.execute({"id": 3, "op": [1]})["error_message"] == "Operação não reconhecida"
+    assert server.execute({"op": {"nome": "square_root"}})["error_message"] == \
+        "Operação não reconhecida"
+    print(f"Estatísticas = {server.stats}")
+    assert server.stats["requests"] == 8 and server.stats["errors"] == 6
+
+    print("✓ Teste do despacho de requisições passou!")
+
+def test_pipelined_connection():
+    """Testa respostas em ordem para requisições enviadas sem esperar"""
+    async def scenario():
+        server = CalculatorServer(port=0, max_pipeline=4)
+        host, port = await server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        requests = [{"id": index, "op": "circle_area", "args": [index]} for index in range(50)]
+        requests.insert(10, {"id": "lote", "op": "batch", "requests": [
+            {"op": "square_root", "args": [9]}, {"op": "nope"}
+        ]})
+        writer.write(b"".join(json.dumps(item).encode() + b"\n" for item in requests))
+        writer.write(b"isto nao e json\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(len(requests) + 1)]
+        writer.close()
+        await writer.wait_closed()
+        await server.close()
+        return responses
+
+    responses = asyncio.run(scenario())
+    assert [response["id"] for response in responses[:-1]] == \
+        list(range(10)) + ["lote"] + list(range(10, 50))
+    assert responses[10]["results"][0]["result"] == 3
+    assert not responses[10]["results"][1]["success"]
+    assert responses[-1]["error_message"] == "JSON inválido"
+
+    print("✓ Teste de pipelining passou!")
+
+def test_malformed_operation():
+    """Testa que uma operação malformada não encerra a conexão"""
+    async def scenario():
+        server = CalculatorServer(port=0)
+        host, port = await server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b'{"id": 1, "op": [1]}\n')
+        writer.write(b'{"id": 2, "op": "batch", "requests": [{"op": [1]}, 7, '
+                     b'{"op": "square_root", "args": [25]}]}\n')
+        writer.write(b'{"id": 3, "op": "square_root", "args": [16]}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+        await writer.wait_closed()
+        await server.close()
+        return responses
+
+    single, batch, following = asyncio.run(scenario())
+    assert single == {"id": 1, "success": False, "result": None,
+                      "error_message": "Operação não reconhecida"}
+    assert [item["success"] for item in batch["results"]] == [False, False, True]
+    assert batch["results"][2]["result"] == 5
+    assert following["result"] == 4
+
+    print("✓ Teste de operação malformada passou!")
+
+def test_backpressure():
+    """Testa que o servidor para de ler quando o cliente não lê as respostas"""
+    async def scenario():
+        server = CalculatorServer(port=0, max_pipeline=8)
+        host, port = await server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        total = 120000
+        writer.write(b'{"op": "square_root", "args": [4]}\n' * total)
+        await asyncio.sleep(0.3)
+        processed_while_blocked = server.stats["requests"]
+        response = b'{"id":null,"success":true,"result":2,"error_message":null}\n'
+        assert await reader.readexactly(len(response) * total) == response * total
+        writer.close()
+        await writer.wait_closed()
+        await server.close()
+        return processed_while_blocked, server.stats["requests"]
+
+    blocked, finished = asyncio.run(scenario())
+    print(f"Processadas sem leitura do cliente: {blocked}")
+    assert blocked < finished == 120000
+
+    print("✓ Teste de contrapressão passou!")
+
+def test_load_test():
+    """Testa o teste de carga em localhost"""
+    stats = asyncio.run(serve_and_load_test(requests=2000, connections=3, pipeline=50))
+    print(f"Teste de carga = {stats}")
+    assert stats["requests"] == 2000 and stats["errors"] == 0
+    assert stats["requests_per_second"] > 0
+
+    print("✓ Teste de carga passou!")
@@ -0,0 +1,120 @@
+"""
+Testes do gerenciador de sessões da calculadora
+"""
+
+import pytest
+
+from calculator_replay import read_recording
+from calculator_sessions import SessionManager
+
+def test_shared_engine():
+    """Testa que as sessões têm estado próprio e motor compartilhado"""
+    manager = SessionManager()
+    first = manager.get("ana", now=0)
+    second = manager.get("bia", now=0)
+    assert first is not second
+    assert first.engine is second.engine is manager.engine
+    assert first.expression_compiler is second.expression_compiler
+
+    first.process_input("5")
+    second.process_input("9")
+    assert manager.get("ana", now=1).get_current_display() == "5"
+    assert manager.get("bia", now=1).get_current_display() == "9"
+    print(f"Sessões abertas: {len(manager)}")
+    assert len(manager) == 2 and "ana" in manager
+
+    print("✓ Teste de motor compartilhado passou!")
+
+def test_lru_and_pool():
+    """Testa a remoção por LRU e o reaproveitamento dos controladores"""
+    manager = SessionManager(max_sessions=2, pool_size=1)
+    first = manager.get("a", now=0)
+    first.process_input("4")
+    first.execute_operation("square_root")
+    first.add_history_listener(lambda event: None)
+    second = manager.get("b", now=1)
+    manager.get("b", now=2)
+
+    # "a" é a usada há mais tempo: sai limpa e seu controlador é
+    # reaproveitado pela nova sessão
+    reused = manager.get("c", now=3)
+    assert list(manager) == ["b", "c"]
+    assert manager.stats["evicted"] == 1
+    assert reused is first
+    assert reused.get_current_display() == "0"
+    assert reused.get_history_count() == 0
+    assert reused.get_history_summary()["total_operations"] == 0
+    assert not reused._history_listeners
+
+    # Com o pool cheio, o controlador removido é descartado
+    assert manager.close_session("c")
+    assert manager.close_session("b")
+    assert manager.get("d", now=4) is first
+    assert manager.get("e", now=5) not in (first, second)
+    print(f"Estatísticas = {manager.stats}")
+    assert manager.stats["reused"] == 2 and manager.stats["created"] == 3
+
+    assert manager.close_session("d")
+    assert not manager.close_session("d")
+
+    print("✓ Teste de LRU e pool passou!")
+
+def test_idle_timeout():
+    """Testa a expiração das sessões ociosas"""
+    manager = SessionManager(idle_timeout=10)
+    manager.get("antiga", now=0)
+    manager.get("ativa", now=0)
+    manager.get("ativa", now=8)
+    manager.get("nova", now=12)
+    assert "antiga" not in manager and list(manager) == ["ativa", "nova"]
+    assert manager.expire(now=20) == 1
+    assert list(manager) == ["nova"]
+    assert manager.stats["expired"] == 2
+
+    with pytest.raises(ValueError):
+        SessionManager(idle_timeout=0)
+
+    print("✓ Teste de tempo ocioso passou!")
+
+def test_memory_usage():
+    """Testa a contabilidade de memória por sessão"""
+    manager = SessionManager(history_size=100)
+    for index in range(3):
+        manager.get(str(index), now=0)
+    busy = manager.get("ocupada", now=0)
+    for value in range(50):
+        busy.execute_operation("square_root", number=value)
+
+    idle = manager.session_memory("0")
+    used = manager.session_memory("ocupada")
+    print(f"Sessão ociosa = {idle}")
+    print(f"Sessão ocupada = {used}")
+    assert used["history"] > idle["history"]
+    assert used["bytes"] == sum(value for key, value in used.items() if key != "bytes")
+
+    report = manager.memory_usage()
+    assert report["sessions"] == 4
+    assert report["largest_session"] == {"session_id": "ocupada", "bytes": used["bytes"]}
+    assert report["session_bytes"] == idle["bytes"] * 3 + used["bytes"]
+
+    print("✓ Teste de memória por sessão passou!")
+
+def test_recording_not_shared(tmp_path):
+    """Testa que a gravação de uma sessão não continua em quem reaproveita o controlador"""
+    manager = SessionManager(max_sessions=1)
+    path = str(tmp_path / "alice.log")
+    alice = manager.get("alice", now=0)
+    alice.start_recording(path)
+    alice.process_input("5")
+
+    bob = manager.get("bob", now=1)
+    assert bob is alice
+    assert bob._recorder is None
+    for key in ["9", "8", "7"]:
+        bob.process_input(key)
+
+    events = list(read_recording(path))
+    print(f"Eventos de alice = {events}")
+    assert [event[1] for event in events] == ["5"]
+
+    print("✓ Teste de gravação não compartilhada passou!")
@@ -0,0 +1,135 @@
+"""
+Testes do processamento em lote de arquivos CSV
+"""
+
+import csv
+import math
+import os
+import subprocess
+import sys
+from array import array
+
+import pytest
+
+from calculator_mmap import transform_file
+from calculator_parallel import run_parallel_batch
+from calculator_registry import TRIGONOMETRIC_FUNCTIONS
+from calculator_stream import run_batch
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def _write_input(path):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        handle.write("operation,arg1,arg2,arg3\n")
+        handle.write("basic_operation,2,3,+\n")
+        handle.write("basic_operation,1,0,/\n")
+        handle.write("trigonometric,30,sin\n")
+        handle.write("\n")
+        handle.write("desconhecida,1\n")
+        handle.write("square_root,16,4\n")
+
+def test_run_batch(tmp_path):
+    """Testa o pipeline de streaming do CSV de entrada ao de saída"""
+    source = tmp_path / "entrada.csv"
+    target = tmp_path / "saida.csv"
+    _write_input(source)
+    
+    stats = run_batch(str(source), str(target))
+    print(f"Estatísticas = {stats}")
+    assert stats["rows"] == 5
+    assert stats["errors"] == 3
+    
+    with open(target, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[0]["result"] == "5"
+    assert rows[1]["error_message"] == "Erro: Divisão por zero não é permitida"
+    assert rows[2]["result"] == "0.5"
+    assert rows[3]["error_message"] == "Operação não reconhecida"
+    assert rows[4]["line"] == "7"
+    
+    print("✓ Testes do processamento em lote passaram!")
+
+def test_batch_mode_does_not_import_tkinter(tmp_path):
+    """Testa que o modo --batch do main.py não carrega o tkinter"""
+    source = tmp_path / "entrada.csv"
+    target = tmp_path / "saida.csv"
+    _write_input(source)
+    
+    check = (
+        "import sys, runpy;"
+        f"sys.argv = ['main.py', '--batch', {str(source)!r}, '--out', {str(target)!r}];"
+        "code = 0\n"
+        "try:\n"
+        f"    runpy.run_path({os.path.join(ROOT, 'main.py')!r}, run_name='__main__')\n"
+        "except SystemExit as e:\n"
+        "    code = e.code\n"
+        "assert code == 0, code\n"
+        "assert 'tkinter' not in sys.modules\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+    assert target.exists()
+    
+    print("✓ Teste do modo --batch sem tkinter passou!")
+
+def test_parallel_batch_preserves_order(tmp_path):
+    """Testa o processamento paralelo em blocos, preservando a ordem"""
+    source = tmp_path / "entrada.csv"
+    with open(source, "w", newline="", encoding="utf-8") as handle:
+        for i in range(1, 101):
+            handle.write(f"basic_operation,{i},2,*\n")
+    serial = tmp_path / "serial.csv"
+    parallel = tmp_path / "paralelo.csv"
+    
+    run_batch(str(source), str(serial))
+    stats = run_parallel_batch(str(source), str(parallel), workers=2, chunk_size=7)
+    assert stats["rows"] == 100
+    assert stats["errors"] == 0
+    assert parallel.read_text(encoding="utf-8") == serial.read_text(encoding="utf-8")
+    
+    print("✓ Teste do processamento paralelo passou!")
+
+def test_transform_file(tmp_path):
+    """Testa a transformação de um arquivo binário de float64 em blocos"""
+    source = tmp_path / "raios.bin"
+    target = tmp_path / "areas.bin"
+    with open(source, "wb") as handle:
+        array('d', [1.0, 2.0, -1.0, float("nan"), 0.0]).tofile(handle)
+    
+    stats = transform_file(str(source), str(target), "circle_area", chunk_elements=2)
+    print(f"Estatísticas = {stats}")
+    assert stats["elements"] == 5
+    assert stats["errors"] == 2
+    
+    results = array('d')
+    with open(target, "rb") as handle:
+        results.fromfile(handle, 5)
+    assert results[0] == round(math.pi, 10)
+    assert results[1] == round(4 * math.pi, 10)
+    assert math.isnan(results[2]) and math.isnan(results[3])
+    assert results[4] == 0.0
+    
+    stats = transform_file(str(source), str(target), "trigonometric", function="cos")
+    assert stats["errors"] == 1
+    
+    # A saída não pode ser a própria entrada (nem outro caminho para ela)
+    link = tmp_path / "link.bin"
+    os.link(source, link)
+    for output in (source, link):
+        with pytest.raises(ValueError, match="próprio arquivo de entrada"):
+            transform_file(str(source), str(output), "circle_area")
+    assert os.path.getsize(source) == 5 * 8
+    
+    # Funções aceitas e mensagem de erro vêm da tabela do registro
+    with pytest.raises(ValueError, match="Use sin, cos ou tan$"):
+        transform_file(str(source), str(target), "trigonometric", function="sec")
+    TRIGONOMETRIC_FUNCTIONS["asin"] = math.asin
+    try:
+        assert transform_file(str(source), str(target), "trigonometric",
+                              function="asin", unit="radians")["errors"] == 2
+        with pytest.raises(ValueError, match="Use sin, cos, tan ou asin$"):
+            transform_file(str(source), str(target), "trigonometric", function="sec")
+    finally:
+        del TRIGONOMETRIC_FUNCTIONS["asin"]
+    
+    print("✓ Teste da transformação de arquivos binários passou!")